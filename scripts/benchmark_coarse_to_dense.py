@@ -0,0 +1,60 @@
+"""Benchmark of the storage of the child-parent element data between coarse and dense quad meshes.
+
+The former dictionaries, with a list of dense vertices per coarse halfedge, are compared with the compact storage, with one flat array of dense vertices per coarse edge and their offsets.
+The memory allocated by Python for the data is measured with tracemalloc, and the size of their JSON serialisation is given.
+
+Usage: python scripts/benchmark_coarse_to_dense.py [max_coarse_faces] [density]
+"""
+from __future__ import print_function
+
+import json
+import sys
+import time
+
+from compas_pattern.datastructures.mesh_quad_coarse.coarse_to_dense import CoarseToDense
+
+from benchmark_utilities import coarse_grid_quad_mesh
+from benchmark_utilities import memory
+
+
+def dictionaries(mesh):
+    # the former storage, with both directions of each coarse edge
+    coarse_to_dense = mesh.attributes['coarse_to_dense']
+    vertex_coarse_to_dense = dict(coarse_to_dense.vertices)
+    edge_coarse_to_dense = {vkey: {} for vkey in mesh.vertices()}
+    for u, v in coarse_to_dense.edges():
+        polyedge = coarse_to_dense.polyedge(u, v)
+        edge_coarse_to_dense[u][v] = polyedge
+        edge_coarse_to_dense[v][u] = list(reversed(polyedge))
+    return vertex_coarse_to_dense, edge_coarse_to_dense
+
+
+def compact(mesh):
+    return CoarseToDense.from_data(mesh.attributes['coarse_to_dense'].to_data())
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_coarse_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 2500
+    density = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print('{:>8} {:>10} {:>22} {:>22} {:>12}'.format('coarse', 'dense', 'dicts [MB, MB json]', 'compact [MB, MB json]', 'lookup [s]'))
+    for n in (10, 25, 50):
+        if n * n > max_coarse_faces:
+            break
+        mesh = coarse_grid_quad_mesh(n, density)
+        mesh.densification_patches()
+        dicts_memory, (vertex_coarse_to_dense, edge_coarse_to_dense) = memory(dictionaries, mesh)
+        dicts_json = len(json.dumps({'vertex_coarse_to_dense': vertex_coarse_to_dense, 'edge_coarse_to_dense': edge_coarse_to_dense})) / 1e6
+        compact_memory, coarse_to_dense = memory(compact, mesh)
+        compact_json = len(json.dumps(coarse_to_dense.to_data())) / 1e6
+        t0 = time.time()
+        for u, v in mesh.edges():
+            mesh.coarse_edge_dense_edges(u, v)
+            mesh.coarse_edge_dense_edges(v, u)
+        t = time.time() - t0
+        print('{:>8} {:>10} {:>22} {:>22} {:>12.3f}'.format(n * n, n * n * density * density, '{:.2f}, {:.2f}'.format(dicts_memory, dicts_json), '{:.2f}, {:.2f}'.format(compact_memory, compact_json), t))
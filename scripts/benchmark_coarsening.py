@@ -0,0 +1,36 @@
+"""Benchmark of the extraction of the coarse quad mesh of dense quad meshes, with the patches between singularity polyedges.
+
+The copy of the coarse quad mesh shares its dense and polygonal meshes until they are modified.
+
+The dense quad meshes are densifications of a square with an inner square, with four singularities, with up to 200k faces.
+
+Usage: python scripts/benchmark_coarsening.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+from benchmark_utilities import dense_quad_mesh
+from benchmark_utilities import timeit
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print('{:>10} {:>16} {:>18} {:>16} {:>10}'.format('faces', 'polyedges [s]', 'coarse faces', 'coarsening [s]', 'copy [s]'))
+    for density in (10, 50, 100, 200):
+        if 5 * density * density > max_faces:
+            break
+        quad_mesh = dense_quad_mesh(density)
+        t_polyedges, _ = timeit(quad_mesh.collect_polyedges)
+        t, coarse_quad_mesh = timeit(CoarseQuadMesh.from_quad_mesh, quad_mesh)
+        t_copy, _ = timeit(coarse_quad_mesh.copy)
+        assert coarse_quad_mesh.number_of_faces() == 5
+        print('{:>10} {:>16.3f} {:>18} {:>16.3f} {:>10.3f}'.format(quad_mesh.number_of_faces(), t_polyedges, coarse_quad_mesh.number_of_faces(), t, t_copy))
@@ -0,0 +1,49 @@
+"""Scaling benchmark of QuadMesh.collect_strips on square grids from 1k to 1M faces.
+
+The quadratic strip collection that removed visited edges from a list is timed alongside for the smaller sizes.
+
+Usage: python scripts/benchmark_collect_strips.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from benchmark_utilities import grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def collect_strips_list_removal(mesh):
+    """Former strip collection, removing visited edges from a list."""
+    edges = [(u, v) if mesh.halfedge[u][v] is not None else (v, u) for u, v in mesh.edges()]
+    strips = {}
+    while len(edges) > 0:
+        u0, v0 = edges.pop()
+        strip_edges = mesh.collect_strip(u0, v0)
+        strips[len(strips)] = strip_edges
+        for u, v in strip_edges:
+            if (u, v) in edges:
+                edges.remove((u, v))
+            elif (v, u) in edges:
+                edges.remove((v, u))
+    return strips
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    max_faces_list_removal = 10000
+
+    print('{:>10} {:>8} {:>12} {:>14} {:>16}'.format('faces', 'strips', 'visited [s]', 'us / face', 'list removal [s]'))
+    for n in (32, 100, 317, 1000):
+        if n * n > max_faces:
+            break
+        mesh = grid_quad_mesh(n, collect_strips=False)
+        t, _ = timeit(mesh.collect_strips)
+        t_old = '-'
+        if n * n <= max_faces_list_removal:
+            t_old = '{:.3f}'.format(timeit(collect_strips_list_removal, mesh)[0])
+        print('{:>10} {:>8} {:>12.3f} {:>14.2f} {:>16}'.format(n * n, mesh.number_of_strips(), t, 1e6 * t / (n * n), t_old))
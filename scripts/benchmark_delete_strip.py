@@ -0,0 +1,70 @@
+"""Benchmark of the deletion of a strip with a union-find over its vertices, on grids of three rows of faces.
+
+The middle strip, of the length of the rows, is deleted.
+The former deletion, building a network of the strip edges and substituting the vertices in the faces one by one, is timed alongside.
+
+Usage: python scripts/benchmark_delete_strip.py [max_length]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas.datastructures import mesh_substitute_vertex_in_faces
+from compas.datastructures import network_disconnected_vertices
+from compas.geometry import centroid_points
+
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strip
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import strip_edge_network
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import update_strip_data
+
+from benchmark_utilities import timeit
+
+
+def strip_quad_mesh(n):
+    """Grid quad mesh with three rows of n faces."""
+    vertices = [[float(i), float(j), 0.0] for j in range(4) for i in range(n + 1)]
+    faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(3) for i in range(n)]
+    mesh = QuadMesh.from_vertices_and_faces(vertices, faces)
+    mesh.collect_strips()
+    return mesh, mesh.edge_strip((n + 1, 2 * (n + 1)))
+
+
+def delete_strip_former(mesh, skey):
+    """Former deletion of a strip, with a network of the strip edges."""
+    network = strip_edge_network(mesh, skey)
+    disc_vertices = network_disconnected_vertices(network)
+    for fkey in mesh.strip_faces(skey):
+        mesh.delete_face(fkey)
+    old_vkeys_to_new_vkeys = {}
+    for vertices in disc_vertices:
+        x, y, z = centroid_points([mesh.vertex_coordinates(vkey) for vkey in vertices])
+        new_vkey = mesh.add_vertex(attr_dict={'x': x, 'y': y, 'z': z})
+        old_vkeys_to_new_vkeys.update({old_vkey: new_vkey for old_vkey in vertices})
+        for old_vkey in vertices:
+            mesh_substitute_vertex_in_faces(mesh, old_vkey, new_vkey, mesh.vertex_faces(old_vkey))
+        for old_vkey in vertices:
+            mesh.delete_vertex(old_vkey)
+    update_strip_data(mesh, old_vkeys_to_new_vkeys)
+    return old_vkeys_to_new_vkeys
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    print('{:>8} {:>12} {:>12}'.format('length', 'former [s]', 'new [s]'))
+    for n in (10, 100, 1000, 10000):
+        if n > max_length:
+            break
+        mesh_1, skey = strip_quad_mesh(n)
+        t_1, old_vkeys_to_new_vkeys_1 = timeit(delete_strip_former, mesh_1, skey)
+        mesh_2, skey = strip_quad_mesh(n)
+        t_2, old_vkeys_to_new_vkeys_2 = timeit(delete_strip, mesh_2, skey)
+        assert old_vkeys_to_new_vkeys_1 == old_vkeys_to_new_vkeys_2
+        assert sorted(mesh_1.faces()) == sorted(mesh_2.faces())
+        print('{:>8} {:>12.4f} {:>12.4f}'.format(n, t_1, t_2))
@@ -0,0 +1,44 @@
+"""Benchmark of the densification of coarse quad meshes, with one Coons patch per face, in one or several processes, and with batched NumPy Coons patches.
+
+The coarse meshes are perturbed square grids with up to 2k faces, densified with the same density for all strips.
+
+Usage: python scripts/benchmark_densification.py [max_coarse_faces] [density] [workers]
+"""
+from __future__ import print_function
+
+import sys
+
+import numpy as np
+
+from compas_pattern.datastructures.mesh_quad_compact.densification import densification_arrays_numpy
+from compas_pattern.datastructures.mesh_quad_compact.densification import densification_numpy
+
+from benchmark_utilities import coarse_grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_coarse_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    density = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    print('{:>8} {:>10} {:>12} {:>16} {:>12} {:>14}'.format('coarse', 'dense', 'coons [s]', '{} workers [s]'.format(workers), 'arrays [s]', 'quad mesh [s]'))
+    for n in (5, 15, 30, 45):
+        if n * n > max_coarse_faces:
+            break
+        mesh = coarse_grid_quad_mesh(n, density)
+        t_arrays, (xyz, faces) = timeit(densification_arrays_numpy, mesh)
+        t_numpy, _ = timeit(densification_numpy, mesh)
+        t_workers, (vertices, faces_workers) = timeit(mesh.dense_vertices_and_faces, workers)
+        t_coons, _ = timeit(mesh.densification)
+        quad_mesh = mesh.get_quad_mesh()
+        assert faces_workers == [quad_mesh.face_vertices(fkey) for fkey in quad_mesh.faces()]
+        assert vertices == [quad_mesh.vertex_coordinates(vkey) for vkey in quad_mesh.vertices()]
+        assert np.array_equal(faces, np.array([quad_mesh.face_vertices(fkey) for fkey in quad_mesh.faces()]))
+        assert np.allclose(xyz, np.array([quad_mesh.vertex_coordinates(vkey) for vkey in quad_mesh.vertices()]))
+        print('{:>8} {:>10} {:>12.3f} {:>16.3f} {:>12.3f} {:>14.3f}'.format(n * n, len(faces), t_coons, t_workers, t_arrays, t_numpy))
@@ -0,0 +1,48 @@
+"""Benchmark of the export of densifications to OBJ and binary PLY files, streamed patch by patch or through the dense quad mesh.
+
+The coarse meshes are perturbed square grids with up to 900 faces, densified with the same density for all strips.
+The peak memory allocated by Python is measured with tracemalloc, in separate runs.
+
+Usage: python scripts/benchmark_densification_export.py [max_coarse_faces] [density]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import tempfile
+
+from compas_pattern.datastructures.mesh_quad_coarse.streaming import densification_to_obj
+from compas_pattern.datastructures.mesh_quad_coarse.streaming import densification_to_ply
+
+from benchmark_utilities import coarse_grid_quad_mesh
+from benchmark_utilities import peak_memory
+from benchmark_utilities import timeit
+
+
+def densification_and_to_obj(mesh, filepath):
+    # densify again instead of updating the former dense quad mesh
+    mesh.set_quad_mesh(None)
+    mesh.densification()
+    mesh.peek_quad_mesh().to_obj(filepath)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_coarse_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 900
+    density = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    filepath = os.path.join(tempfile.gettempdir(), 'densification')
+
+    print('{:>8} {:>10} {:>28} {:>22} {:>22}'.format('coarse', 'dense', 'quad mesh + obj [s, MB]', 'stream obj [s, MB]', 'stream ply [s, MB]'))
+    for n in (5, 15, 30):
+        if n * n > max_coarse_faces:
+            break
+        mesh = coarse_grid_quad_mesh(n, density)
+        results = []
+        for func, extension in [(densification_and_to_obj, '.obj'), (densification_to_obj, '.obj'), (densification_to_ply, '.ply')]:
+            t, _ = timeit(func, mesh, filepath + extension)
+            results.append('{:.2f}, {:.0f}'.format(t, peak_memory(func, mesh, filepath + extension)[0]))
+        print('{:>8} {:>10} {:>28} {:>22} {:>22}'.format(n * n, n * n * density * density, *results))
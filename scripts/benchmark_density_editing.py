@@ -0,0 +1,54 @@
+"""Benchmark of density editing, where the density of one strip is changed before each densification.
+
+After a first densification, only the patches of the coarse faces along the edited strip are generated again and spliced in the dense quad mesh.
+The densification of the whole coarse mesh after each edit is timed alongside.
+
+Usage: python scripts/benchmark_density_editing.py [max_coarse_faces] [density] [edits]
+"""
+from __future__ import print_function
+
+import random
+import sys
+
+from compas.utilities import geometric_key
+
+from benchmark_utilities import coarse_grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def edit_densities(mesh, edits, full=False):
+    """Change the density of one random strip and densify, edits times."""
+    random.seed(edits)
+    skeys = sorted(mesh.strips())
+    for _ in range(edits):
+        mesh.set_strip_density(random.choice(skeys), random.randint(5, 25))
+        if full:
+            mesh.set_quad_mesh(None)
+        mesh.densification()
+
+
+def face_keys(quad_mesh):
+    return sorted([sorted([geometric_key(quad_mesh.vertex_coordinates(vkey)) for vkey in quad_mesh.face_vertices(fkey)]) for fkey in quad_mesh.faces()])
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_coarse_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 900
+    density = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    edits = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    print('{:>8} {:>10} {:>18} {:>14} {:>18}'.format('coarse', 'dense', 'first [s]', 'ms / edit', 'full ms / edit'))
+    for n in (5, 15, 30):
+        if n * n > max_coarse_faces:
+            break
+        mesh = coarse_grid_quad_mesh(n, density)
+        t_first, _ = timeit(mesh.densification)
+        t, _ = timeit(edit_densities, mesh, edits)
+        mesh_full = coarse_grid_quad_mesh(n, density)
+        t_full, _ = timeit(edit_densities, mesh_full, edits, True)
+        assert face_keys(mesh.peek_quad_mesh()) == face_keys(mesh_full.peek_quad_mesh())
+        print('{:>8} {:>10} {:>18.3f} {:>14.1f} {:>18.1f}'.format(n * n, mesh.peek_quad_mesh().number_of_faces(), t_first, 1e3 * t / edits, 1e3 * t_full / edits))
@@ -0,0 +1,43 @@
+"""Benchmark of the greedy strip density solver, with a target edge length field and a budget of dense faces.
+
+The coarse meshes are perturbed square grids with up to 1000 strips, with a target edge length decreasing towards a corner and a budget of 8 dense faces per coarse face, below the number of faces for the target alone.
+
+Usage: python scripts/benchmark_density_solver.py [max_strips]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad_coarse.density import greedy_strips_density
+
+from benchmark_utilities import coarse_grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def number_of_dense_faces(mesh, densities):
+    return sum([densities[u] * densities[v] for u, v in mesh.strip_connectivity().edges])
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_strips = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print('{:>8} {:>10} {:>14} {:>14} {:>12}'.format('strips', 'budget', 'dense faces', 'min-max d', 'solver [s]'))
+    for n in (25, 100, 250, 500):
+        if 2 * n > max_strips:
+            break
+        mesh = coarse_grid_quad_mesh(n)
+        nb_faces = 8 * n * n
+
+        def target(point):
+            return 0.05 + 0.5 * (point[0] + point[1]) / (2 * n)
+
+        mesh.strip_connectivity()
+        t, densities = timeit(greedy_strips_density, mesh, target, nb_faces)
+        faces = number_of_dense_faces(mesh, densities)
+        assert faces <= nb_faces
+        print('{:>8} {:>10} {:>14} {:>14} {:>12.3f}'.format(mesh.number_of_strips(), nb_faces, faces, '{}-{}'.format(min(densities.values()), max(densities.values())), t))
@@ -0,0 +1,57 @@
+"""Benchmark of trial strip deletions rolled back with a journal against trial strip deletions on copies, on square grids.
+
+Ten strips are deleted one at a time, as in the explorations of TwoColourableProjection, and each trial is checked to restore the mesh.
+
+Usage: python scripts/benchmark_journal.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
+
+from benchmark_utilities import grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def trials_on_copies(mesh, skeys):
+    numbers = []
+    for skey in skeys:
+        copy_mesh = mesh.copy()
+        delete_strips(copy_mesh, [skey])
+        numbers.append(copy_mesh.number_of_faces())
+    return numbers
+
+
+def trials_with_journal(mesh, skeys):
+    numbers = []
+    for skey in skeys:
+        mesh.begin_journal()
+        try:
+            delete_strips(mesh, [skey])
+            numbers.append(mesh.number_of_faces())
+        finally:
+            mesh.rollback_journal()
+    return numbers
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+
+    print('{:>10} {:>12} {:>14}'.format('faces', 'copies [s]', 'journal [s]'))
+    for n in (25, 50, 100, 200):
+        if n * n > max_faces:
+            break
+        mesh = grid_quad_mesh(n)
+        skeys = list(mesh.strips())[1: 11]
+        faces = {fkey: mesh.face_vertices(fkey)[:] for fkey in mesh.faces()}
+        t_1, numbers_1 = timeit(trials_on_copies, mesh, skeys)
+        t_2, numbers_2 = timeit(trials_with_journal, mesh, skeys)
+        assert numbers_1 == numbers_2
+        assert {fkey: mesh.face_vertices(fkey) for fkey in mesh.faces()} == faces
+        print('{:>10} {:>12.3f} {:>14.3f}'.format(n * n, t_1, t_2))
@@ -0,0 +1,68 @@
+"""Benchmark of the pole queries of pseudo-quad meshes with the pole index, on densified meshes with a pole.
+
+The former queries, building sets of the face pole data of the mesh data at each call, are timed alongside for the smaller sizes.
+
+Usage: python scripts/benchmark_pole_index.py [max_density]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad_pseudo_coarse.mesh_quad_pseudo_coarse import CoarsePseudoQuadMesh
+
+from benchmark_utilities import timeit
+
+
+def dense_pseudo_quad_mesh(density):
+    """Densified disc with a pole at its centre."""
+    vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0],
+                [2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [-2.0, 0.0, 0.0], [0.0, -2.0, 0.0]]
+    faces = [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 1], [1, 5, 6, 2], [2, 6, 7, 3], [3, 7, 8, 4], [4, 8, 5, 1]]
+    coarse_pseudo_quad_mesh = CoarsePseudoQuadMesh.from_vertices_and_faces_with_poles(vertices, faces, [[0.0, 0.0, 0.0]])
+    coarse_pseudo_quad_mesh.collect_strips()
+    coarse_pseudo_quad_mesh.set_strips_density(density)
+    return coarse_pseudo_quad_mesh.densification()
+
+
+def vertex_indices(mesh):
+    return [mesh.vertex_index(vkey) for vkey in mesh.vertices()]
+
+
+def vertex_pole_queries_former(mesh):
+    """Former pole queries of the vertex indices."""
+    results = []
+    for vkey in mesh.vertices():
+        is_vertex_pole = vkey in set(mesh.data['attributes']['face_pole'].values())
+        is_face_pseudo_quad = [fkey in set(mesh.data['attributes']['face_pole'].keys()) for fkey in mesh.vertex_faces(vkey)]
+        results.append((is_vertex_pole, is_face_pseudo_quad))
+    return results
+
+
+def vertex_pole_queries(mesh):
+    results = []
+    for vkey in mesh.vertices():
+        results.append((mesh.is_vertex_pole(vkey), [mesh.is_face_pseudo_quad(fkey) for fkey in mesh.vertex_faces(vkey)]))
+    return results
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_density = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    print('{:>8} {:>10} {:>18} {:>16} {:>12}'.format('density', 'faces', 'vertex indices [s]', 'pole queries [s]', 'former [s]'))
+    for density in (10, 30, 100):
+        if density > max_density:
+            break
+        mesh = dense_pseudo_quad_mesh(density)
+        t_indices, _ = timeit(vertex_indices, mesh)
+        t_queries, results = timeit(vertex_pole_queries, mesh)
+        former = ''
+        if density <= 10:
+            t_former, former_results = timeit(vertex_pole_queries_former, mesh)
+            assert former_results == results
+            former = '{:.3f}'.format(t_former)
+        print('{:>8} {:>10} {:>18.3f} {:>16.3f} {:>12}'.format(density, mesh.number_of_faces(), t_indices, t_queries, former))
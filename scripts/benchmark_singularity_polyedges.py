@@ -0,0 +1,47 @@
+"""Regression benchmark of the singularity polyedge splitting on densified meshes with four singularities.
+
+The former splitting, counting the polyedges of each vertex with list.count and locating split vertices with list.index, is timed alongside for the smaller sizes.
+
+Usage: python scripts/benchmark_singularity_polyedges.py [max_density]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.utilities.lists import list_split
+
+from benchmark_utilities import dense_quad_mesh
+from benchmark_utilities import timeit
+
+
+def split_polyedges_count_index(mesh, polyedges):
+    """Former splitting of polyedges at their intersections."""
+    vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
+    split_vertices = [vkey for vkey in mesh.vertices() if vertices.count(vkey) > 1]
+    return [split_polyedge for polyedge in polyedges for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_density = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    max_faces_count_index = 25000
+
+    print('{:>8} {:>12} {:>16} {:>16} {:>16}'.format('faces', 'polyedges', 'sing. polyedges', 'decomposition', 'count/index [s]'))
+    density = 8
+    while density <= max_density:
+        mesh = dense_quad_mesh(density)
+        mesh.collect_polyedges()
+        t_sing, _ = timeit(mesh.singularity_polyedges)
+        t_dec, _ = timeit(mesh.singularity_polyedge_decomposition)
+        t_old = '-'
+        if mesh.number_of_faces() <= max_faces_count_index:
+            polyedges = [polyedge for key, polyedge in mesh.polyedges(data=True)]
+            t, split_polyedges = timeit(split_polyedges_count_index, mesh, polyedges)
+            assert sorted(split_polyedges) == sorted(mesh._split_polyedges(polyedges))
+            t_old = '{:.3f}'.format(t)
+        print('{:>8} {:>12} {:>16.3f} {:>16.3f} {:>16}'.format(mesh.number_of_faces(), len(list(mesh.polyedges())), t_sing, t_dec, t_old))
+        density *= 2
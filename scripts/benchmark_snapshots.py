@@ -0,0 +1,66 @@
+"""Benchmark of the memory held by variants of a coarse quad mesh stored as copies against variants stored as snapshots, on square grids.
+
+Each strip is deleted in turn, as in the explorations of TwoColourableProjection, and each variant is checked to be rebuilt from its snapshot.
+
+Usage: python scripts/benchmark_snapshots.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh.snapshot import MeshSnapshot
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
+
+from benchmark_utilities import grid_quad_mesh
+from benchmark_utilities import memory
+
+
+def variants_as_copies(mesh, skeys):
+    variants = []
+    for skey in skeys:
+        mesh.begin_journal()
+        try:
+            delete_strips(mesh, [skey])
+            variants.append(mesh.copy())
+        finally:
+            mesh.rollback_journal()
+    return variants
+
+
+def variants_as_snapshots(mesh, skeys):
+    snapshot = MeshSnapshot.from_mesh(mesh)
+    variants = [snapshot]
+    for skey in skeys:
+        mesh.begin_journal()
+        try:
+            delete_strips(mesh, [skey])
+        finally:
+            journal = mesh.rollback_journal()
+        variants.append(snapshot.apply_journal(journal))
+    return variants
+
+
+def faces(mesh):
+    return {fkey: mesh.face_vertices(fkey) for fkey in mesh.faces()}
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 2500
+
+    print('{:>10} {:>10} {:>12} {:>14}'.format('faces', 'variants', 'copies [MB]', 'snapshots [MB]'))
+    for n in (10, 25, 50):
+        if n * n > max_faces:
+            break
+        mesh = grid_quad_mesh(n, CoarseQuadMesh)
+        skeys = list(mesh.strips())
+        m_1, copies = memory(variants_as_copies, mesh, skeys)
+        m_2, snapshots = memory(variants_as_snapshots, mesh, skeys)
+        for copy_mesh, snapshot in zip(copies, snapshots[1:]):
+            assert faces(snapshot.to_mesh()) == faces(copy_mesh)
+        print('{:>10} {:>10} {:>12.1f} {:>14.1f}'.format(n * n, len(skeys), m_1, m_2))
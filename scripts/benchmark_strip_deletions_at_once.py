@@ -0,0 +1,48 @@
+"""Benchmark of the deletion of several strips at once against their deletion one by one, on square grids.
+
+Twenty strips are deleted, every other strip in each direction, except the outer ones.
+The resulting meshes have the same numbers of vertices, faces and strips.
+
+Usage: python scripts/benchmark_strip_deletions_at_once.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strips
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strips_at_once
+
+from benchmark_utilities import grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def strips_to_delete(mesh, n, k=10):
+    """Every other strip in each direction, except the outer ones, up to k per direction."""
+    rows = [mesh.edge_strip((j * (n + 1), (j + 1) * (n + 1))) for j in range(n)]
+    columns = [mesh.edge_strip((i, i + 1)) for i in range(n)]
+    return rows[1:-1:2][:k] + columns[1:-1:2][:k]
+
+
+def summary(mesh):
+    return mesh.number_of_vertices(), mesh.number_of_faces(), len(list(mesh.strips()))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+
+    print('{:>10} {:>8} {:>14} {:>12}'.format('faces', 'strips', 'one by one [s]', 'at once [s]'))
+    for n in (25, 50, 100, 200):
+        if n * n > max_faces:
+            break
+        mesh_1 = grid_quad_mesh(n)
+        skeys = strips_to_delete(mesh_1, n)
+        t_1, _ = timeit(delete_strips, mesh_1, skeys)
+        mesh_2 = grid_quad_mesh(n)
+        t_2, _ = timeit(delete_strips_at_once, mesh_2, skeys)
+        assert summary(mesh_1) == summary(mesh_2)
+        print('{:>10} {:>8} {:>14.3f} {:>12.3f}'.format(n * n, len(skeys), t_1, t_2))
@@ -0,0 +1,62 @@
+"""Benchmark of sequences of strip deletions on square grids, where the strip data is updated incrementally.
+
+Each deletion only updates the strips with an edge at a merged vertex. The former update rewriting every strip after each deletion is timed alongside for the smaller sizes.
+
+Usage: python scripts/benchmark_strip_edits.py [max_faces]
+"""
+from __future__ import print_function
+
+import sys
+
+from compas_pattern.datastructures.mesh_quad.grammar import delete_strip as grammar_delete_strip
+
+from benchmark_utilities import grid_quad_mesh
+from benchmark_utilities import timeit
+
+
+def update_strip_data_all_strips(mesh, old_vkeys_to_new_vkeys):
+    """Former update, rewriting every strip."""
+    for skey, edges in dict(mesh.strips(data=True)).items():
+        new_edges = [tuple([old_vkeys_to_new_vkeys.get(vkey, vkey) for vkey in edge]) for edge in edges]
+        if all([u == v for u, v in new_edges]):
+            mesh.delete_strip_data(skey)
+            continue
+        new_edges = [edge for i, edge in enumerate(new_edges) if i == 0 or edge != new_edges[i - 1]]
+        mesh.set_strip_edges(skey, new_edges)
+        if len(new_edges) < 2:
+            mesh.delete_strip_data(skey)
+
+
+def delete_every_other_strip(mesh, update_all=False):
+    """Delete every other strip of the grid, except the outer ones, and return the number of edits."""
+    skeys = sorted(mesh.strips())
+    to_delete = [skey for skey in skeys[1:-1:2]]
+    for skey in to_delete:
+        old_vkeys_to_new_vkeys = grammar_delete_strip.delete_strip(mesh, skey, update_data=not update_all)
+        if update_all:
+            update_strip_data_all_strips(mesh, old_vkeys_to_new_vkeys)
+    return len(to_delete)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 250000
+    max_faces_all_strips = 40000
+
+    print('{:>10} {:>8} {:>16} {:>14} {:>18}'.format('faces', 'edits', 'incremental [s]', 'ms / edit', 'all strips [s]'))
+    for n in (50, 100, 200, 500):
+        if n * n > max_faces:
+            break
+        mesh = grid_quad_mesh(n)
+        t, k = timeit(delete_every_other_strip, mesh)
+        t_old = '-'
+        if n * n <= max_faces_all_strips:
+            mesh_old = grid_quad_mesh(n)
+            t_all, _ = timeit(delete_every_other_strip, mesh_old, True)
+            assert sorted(mesh.strips(data=True)) == sorted(mesh_old.strips(data=True))
+            t_old = '{:.3f}'.format(t_all)
+        print('{:>10} {:>8} {:>16.3f} {:>14.2f} {:>18}'.format(n * n, k, t, 1e3 * t / k, t_old))
@@ -0,0 +1,81 @@
+"""Meshes and measurements shared by the benchmarks.
+
+The benchmarks import this module from the scripts folder, as when run with python scripts/benchmark_<name>.py.
+"""
+from __future__ import print_function
+
+import random
+import time
+import tracemalloc
+
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+
+__all__ = [
+    'grid_quad_mesh',
+    'coarse_grid_quad_mesh',
+    'dense_quad_mesh',
+    'timeit',
+    'memory',
+    'peak_memory',
+]
+
+
+def grid_quad_mesh(n, cls=QuadMesh, collect_strips=True):
+    """Square grid quad mesh with n x n faces, with its strips by default."""
+    vertices = [[float(i), float(j), 0.0] for j in range(n + 1) for i in range(n + 1)]
+    faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(n) for i in range(n)]
+    mesh = cls.from_vertices_and_faces(vertices, faces)
+    if collect_strips:
+        mesh.collect_strips()
+    return mesh
+
+
+def coarse_grid_quad_mesh(n, density=None):
+    """Perturbed square grid coarse quad mesh with n x n faces, with the same density for all strips if any."""
+    random.seed(n)
+    vertices = [[i + 0.25 * random.random(), j + 0.25 * random.random(), 0.0] for j in range(n + 1) for i in range(n + 1)]
+    faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(n) for i in range(n)]
+    mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+    mesh.collect_strips()
+    if density is not None:
+        mesh.set_strips_density(density)
+    return mesh
+
+
+def dense_quad_mesh(density):
+    """Densification of a square with an inner square, which has four singularities, with the same density for all strips."""
+    vertices = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0], [0.0, 3.0, 0.0],
+                [1.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+    faces = [[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+    coarse_quad_mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+    coarse_quad_mesh.collect_strips()
+    coarse_quad_mesh.set_strips_density(density)
+    coarse_quad_mesh.densification()
+    return coarse_quad_mesh.get_quad_mesh()
+
+
+def timeit(func, *args):
+    """Time a function call, returning the time in seconds and the result."""
+    t0 = time.time()
+    result = func(*args)
+    return time.time() - t0, result
+
+
+def memory(func, *args):
+    """Trace the memory held after a function call, returning the memory in MB and the result."""
+    tracemalloc.start()
+    result = func(*args)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current / 1e6, result
+
+
+def peak_memory(func, *args):
+    """Trace the peak memory of a function call, returning the memory in MB and the result."""
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6, result
@@ -3,12 +3,12 @@ import time
 import itertools
 
 from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+from compas_pattern.datastructures.mesh.snapshot import MeshSnapshot
 
 from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
 from compas_pattern.datastructures.mesh_quad.grammar_pattern import collateral_strip_deletions
 from compas_pattern.datastructures.mesh_quad.grammar_pattern import total_boundary_deletions
 
-from compas.topology import adjacency_from_edges
 from compas_pattern.topology.coloring import is_adjacency_two_colorable
 
 from compas_pattern.utilities.lists import are_items_in_list
@@ -38,7 +38,7 @@ class TwoColourableProjection:
 		Returns
 		-------
 		results : dict
-			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the two-colourable mesh, the two-colourable network, and the network vertex colors.
+			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the snapshot of the two-colourable mesh, the adjacency of its strips, and the strip colors. The mesh is rebuilt from its snapshot by get_result_mesh.
 
 		References
 		----------
@@ -47,13 +47,18 @@ class TwoColourableProjection:
 		"""
 
 		mesh = self.quad_mesh
-		vertices, edges = mesh.strip_graph()
-		if is_adjacency_two_colorable(adjacency_from_edges(edges)) is not None:
+		euler = mesh.euler()
+		graph = mesh.strip_connectivity()
+		if is_adjacency_two_colorable(graph.adjacency()) is not None:
 			self.results = True
 			return True
 
 		results = {}
 		
+		# the trials run on a working copy, leaving the input mesh untouched, and the two-colourable meshes are derived from its snapshot
+		mesh = mesh.copy()
+		snapshot = MeshSnapshot.from_mesh(mesh)
+
 		t0 = time.time()
 		k = 0
 		
@@ -74,22 +79,28 @@ class TwoColourableProjection:
 				if len(total_boundary_deletions(mesh, combination)) > 0:
 					continue
 					
-				# delete strips in mesh and check validity
-				copy_mesh = mesh.copy()
-				delete_strips(copy_mesh, combination, preserve_boundaries=True)
-				topological_validity = copy_mesh.is_manifold() and copy_mesh.euler() == mesh.euler()
-				if not topological_validity:
-					pass
-
-				# delete strip vertices in network and check colourability
-				else:
-					new_vertices = {vkey: xyz for vkey, xyz in vertices.items() if vkey not in combination}
-					new_edges = [(u, v) for u, v in edges if u not in combination and v not in combination]
-					two_colourability = is_adjacency_two_colorable(adjacency_from_edges(new_edges))
-					if not two_colourability:
-						next_pool.append(combination)
+				# delete strips in mesh and check validity, then roll the deletions back rather than working on a copy
+				mesh.begin_journal()
+				kept = None
+				try:
+					delete_strips(mesh, combination, preserve_boundaries=True)
+					topological_validity = mesh.is_manifold() and mesh.euler() == euler
+					if not topological_validity:
+						pass
+
+					# delete strip vertices in network and check colourability
 					else:
-						results[tuple(combination)] = (copy_mesh, (new_vertices, new_edges), two_colourability)
+						adjacency = graph.reduced_adjacency(combination)
+						two_colourability = is_adjacency_two_colorable(adjacency)
+						if not two_colourability:
+							next_pool.append(combination)
+						else:
+							kept = (adjacency, two_colourability)
+				finally:
+					journal = mesh.rollback_journal()
+				# keep the two-colourable mesh as a snapshot sharing the unchanged data with the input mesh
+				if kept is not None:
+					results[tuple(combination)] = (snapshot.apply_journal(journal),) + kept
 
 			current_pool = itertools.combinations(next_pool, 2)
 
@@ -110,7 +121,7 @@ class TwoColourableProjection:
 		Returns
 		-------
 		results : dict
-			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the two-colourable mesh, the two-colourable network, and the network vertex colors.
+			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the snapshot of the two-colourable mesh, the adjacency of its strips, and the strip colors. The mesh is rebuilt from its snapshot by get_result_mesh.
 
 		References
 		----------
@@ -119,10 +130,11 @@ class TwoColourableProjection:
 		"""
 
 		mesh = self.quad_mesh
+		euler = mesh.euler()
 		n = mesh.number_of_strips()
 
-		vertices, edges = mesh.strip_graph()
-		if is_adjacency_two_colorable(adjacency_from_edges(edges)) is not None:
+		graph = mesh.strip_connectivity()
+		if is_adjacency_two_colorable(graph.adjacency()) is not None:
 			self.results = True
 			return True
 
@@ -138,6 +150,10 @@ class TwoColourableProjection:
 
 		results = {}
 		
+		# the trials run on a working copy, leaving the input mesh untouched, and the two-colourable meshes are derived from its snapshot
+		mesh = mesh.copy()
+		snapshot = MeshSnapshot.from_mesh(mesh)
+
 		t0 = time.time()
 		k = 0
 		
@@ -158,22 +174,28 @@ class TwoColourableProjection:
 				if len(total_boundary_deletions(mesh, combination)) > 0:
 					continue
 					
-				# delete strips in mesh and check validity
-				copy_mesh = mesh.copy()
-				delete_strips(copy_mesh, combination, preserve_boundaries=True)
-				topological_validity = copy_mesh.is_manifold() and copy_mesh.euler() == mesh.euler()
-				if not topological_validity:
-					pass
-
-				# delete strip vertices in network and check colourability
-				else:
-					new_vertices = {vkey: xyz for vkey, xyz in vertices.items() if vkey not in combination}
-					new_edges = [(u, v) for u, v in edges if u not in combination and v not in combination]
-					two_colourability = is_adjacency_two_colorable(adjacency_from_edges(new_edges))
-					if not two_colourability:
-						next_pool.append(combination)
+				# delete strips in mesh and check validity, then roll the deletions back rather than working on a copy
+				mesh.begin_journal()
+				kept = None
+				try:
+					delete_strips(mesh, combination, preserve_boundaries=True)
+					topological_validity = mesh.is_manifold() and mesh.euler() == euler
+					if not topological_validity:
+						pass
+
+					# delete strip vertices in network and check colourability
 					else:
-						results[tuple(combination)] = (copy_mesh, (new_vertices, new_edges), two_colourability)
+						adjacency = graph.reduced_adjacency(combination)
+						two_colourability = is_adjacency_two_colorable(adjacency)
+						if not two_colourability:
+							next_pool.append(combination)
+						else:
+							kept = (adjacency, two_colourability)
+				finally:
+					journal = mesh.rollback_journal()
+				# keep the two-colourable mesh as a snapshot sharing the unchanged data with the input mesh
+				if kept is not None:
+					results[tuple(combination)] = (snapshot.apply_journal(journal),) + kept
 
 			current_pool = itertools.combinations(next_pool, 2)
 
@@ -194,7 +216,7 @@ class TwoColourableProjection:
 		Returns
 		-------
 		results : dict
-			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the two-colourable mesh, the two-colourable network, and the network vertex colors.
+			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the snapshot of the two-colourable mesh, the adjacency of its strips, and the strip colors. The mesh is rebuilt from its snapshot by get_result_mesh.
 
 		References
 		----------
@@ -203,10 +225,11 @@ class TwoColourableProjection:
 		"""
 
 		mesh = self.quad_mesh
+		euler = mesh.euler()
 
 		# result for input mesh
-		vertices, edges = mesh.strip_graph()
-		if is_adjacency_two_colorable(adjacency_from_edges(edges)) is not None:
+		graph = mesh.strip_connectivity()
+		if is_adjacency_two_colorable(graph.adjacency()) is not None:
 			self.results = True
 			return True
 
@@ -217,6 +240,10 @@ class TwoColourableProjection:
 		if kmax < 1 or kmax > n:
 			kmax = n
 		
+		# the trials run on a working copy, leaving the input mesh untouched, and the two-colourable meshes are derived from its snapshot
+		mesh = mesh.copy()
+		snapshot = MeshSnapshot.from_mesh(mesh)
+
 		t0 = time.time()
 
 		# start iteration
@@ -242,23 +269,29 @@ class TwoColourableProjection:
 					discarding_combination.append(set(combination))
 					continue
 				
-				# delete strips in mesh and check validity
-				copy_mesh = mesh.copy()
-				delete_strips(copy_mesh, combination, preserve_boundaries=True)
-				topological_validity = copy_mesh.is_manifold() and copy_mesh.euler() == mesh.euler()
-				if not topological_validity:
-					discarding_combination.append(set(combination))
+				# delete strips in mesh and check validity, then roll the deletions back rather than working on a copy
+				mesh.begin_journal()
+				kept = None
+				try:
+					delete_strips(mesh, combination, preserve_boundaries=True)
+					topological_validity = mesh.is_manifold() and mesh.euler() == euler
+					if not topological_validity:
+						discarding_combination.append(set(combination))
 
-				# delete strip vertices in network and check colourability
-				else:
-					new_vertices = {vkey: xyz for vkey, xyz in vertices.items() if vkey not in combination}
-					new_edges = [(u, v) for u, v in edges if u not in combination and v not in combination]
-					two_colourability = is_adjacency_two_colorable(adjacency_from_edges(new_edges))
-					if not two_colourability:
-						to_continue = True
+					# delete strip vertices in network and check colourability
 					else:
-						results[combination] = (copy_mesh, (new_vertices, new_edges), two_colourability)
-						discarding_combination.append(set(combination))
+						adjacency = graph.reduced_adjacency(combination)
+						two_colourability = is_adjacency_two_colorable(adjacency)
+						if not two_colourability:
+							to_continue = True
+						else:
+							kept = (adjacency, two_colourability)
+							discarding_combination.append(set(combination))
+				finally:
+					journal = mesh.rollback_journal()
+				# keep the two-colourable mesh as a snapshot sharing the unchanged data with the input mesh
+				if kept is not None:
+					results[combination] = (snapshot.apply_journal(journal),) + kept
 
 			if not to_continue:
 				break
@@ -280,7 +313,7 @@ class TwoColourableProjection:
 		Returns
 		-------
 		results : dict
-			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the two-colourable mesh, the two-colourable network, and the network vertex colors.
+			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the snapshot of the two-colourable mesh, the adjacency of its strips, and the strip colors. The mesh is rebuilt from its snapshot by get_result_mesh.
 
 		References
 		----------
@@ -289,10 +322,10 @@ class TwoColourableProjection:
 		"""
 
 		mesh = self.quad_mesh
+		euler = mesh.euler()
 
 		# result for input mesh
-		vertices, edges = mesh.strip_graph()
-		if is_adjacency_two_colorable(adjacency_from_edges(edges)) is not None:
+		if is_adjacency_two_colorable(mesh.strip_connectivity().adjacency()) is not None:
 			self.results = True
 			return True
 
@@ -303,6 +336,10 @@ class TwoColourableProjection:
 		if kmax < 1 or kmax > n:
 			kmax = n
 		
+		# the trials run on a working copy, leaving the input mesh untouched, and the two-colourable meshes are derived from its snapshot
+		mesh = mesh.copy()
+		snapshot = MeshSnapshot.from_mesh(mesh)
+
 		t0 = time.time()
 
 		# start iteration
@@ -333,23 +370,29 @@ class TwoColourableProjection:
 					results[combination] = 'invalid shape topology'
 					continue
 				
-				# delete strips in mesh and check validity
-				copy_mesh = mesh.copy()
-				copy_mesh.collect_strips()
-				delete_strips(copy_mesh, combination, preserve_boundaries=True)
-				topological_validity = copy_mesh.is_manifold() and copy_mesh.euler() == mesh.euler()
-				if not topological_validity:
-					results[combination] = 'invalid shape topology'
-
-				# delete strip vertices in network and check colourability
-				else:
-					vertices, edges = copy_mesh.strip_graph()
-					two_colourability = is_adjacency_two_colorable(adjacency_from_edges(edges))
-					if not two_colourability:
-						results[combination] = 'not two-colourable'
-						to_continue = True
+				# delete strips in mesh and check validity, then roll the deletions back rather than working on a copy
+				mesh.begin_journal()
+				kept = None
+				try:
+					delete_strips(mesh, combination, preserve_boundaries=True)
+					topological_validity = mesh.is_manifold() and mesh.euler() == euler
+					if not topological_validity:
+						results[combination] = 'invalid shape topology'
+
+					# delete strip vertices in network and check colourability
 					else:
-						results[combination] = (copy_mesh, (vertices, edges), two_colourability)
+						adjacency = mesh.strip_connectivity().adjacency()
+						two_colourability = is_adjacency_two_colorable(adjacency)
+						if not two_colourability:
+							results[combination] = 'not two-colourable'
+							to_continue = True
+						else:
+							kept = (adjacency, two_colourability)
+				finally:
+					journal = mesh.rollback_journal()
+				# keep the two-colourable mesh as a snapshot sharing the unchanged data with the input mesh
+				if kept is not None:
+					results[combination] = (snapshot.apply_journal(journal),) + kept
 
 			if not to_continue:
 				break
@@ -370,7 +413,7 @@ class TwoColourableProjection:
 		Returns
 		-------
 		results : dict
-			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the two-colourable mesh, the two-colourable network, and the network vertex colors.
+			The combination pointing to the its result. If the combination is valid, the result is a tuple of the the snapshot of the two-colourable mesh, the adjacency of its strips, and the strip colors. The mesh is rebuilt from its snapshot by get_result_mesh.
 
 		References
 		----------
@@ -379,10 +422,11 @@ class TwoColourableProjection:
 		"""
 
 		mesh = self.quad_mesh
+		euler = mesh.euler()
 
 		# result for input mesh
-		vertices, edges = mesh.strip_graph()
-		if is_adjacency_two_colorable(adjacency_from_edges(edges)) is not None:
+		graph = mesh.strip_connectivity()
+		if is_adjacency_two_colorable(graph.adjacency()) is not None:
 			self.results = True
 			return True
 
@@ -393,6 +437,10 @@ class TwoColourableProjection:
 		if kmax < 1 or kmax > n:
 			kmax = n
 		
+		# the trials run on a working copy, leaving the input mesh untouched, and the two-colourable meshes are derived from its snapshot
+		mesh = mesh.copy()
+		snapshot = MeshSnapshot.from_mesh(mesh)
+
 		t0 = time.time()
 		t1 = - float('inf')
 		t2 = - float('inf')
@@ -431,33 +479,37 @@ class TwoColourableProjection:
 				if combination in results:
 					continue
 				
-				# delete strips in mesh and check validity
-				copy_mesh = mesh.copy()
-				#copy_mesh.collect_strips()
-				delete_strips(copy_mesh, combination, preserve_boundaries=True)
-				topological_validity = copy_mesh.is_manifold() and copy_mesh.euler() == mesh.euler()
-				if not topological_validity:
-					results[combination] = 'invalid shape topology'
-					discarding_combination.append(set(combination))
-					discarding_combination_type[tuple(combination)] = 'invalid shape topology'
+				# delete strips in mesh and check validity, then roll the deletions back rather than working on a copy
+				mesh.begin_journal()
+				kept = None
+				try:
+					delete_strips(mesh, combination, preserve_boundaries=True)
+					topological_validity = mesh.is_manifold() and mesh.euler() == euler
+					if not topological_validity:
+						results[combination] = 'invalid shape topology'
+						discarding_combination.append(set(combination))
+						discarding_combination_type[tuple(combination)] = 'invalid shape topology'
 
-				# delete strip vertices in network and check colourability
-				else:
-					#vertices, edges = copy_mesh.strip_graph()
-					new_vertices = {vkey: xyz for vkey, xyz in vertices.items() if vkey not in combination}
-					new_edges = [(u, v) for u, v in edges if u not in combination and v not in combination]
-					two_colourability = is_adjacency_two_colorable(adjacency_from_edges(new_edges))
-					if not two_colourability:
-						results[combination] = 'not two-colourable'
-						to_continue = True
+					# delete strip vertices in network and check colourability
 					else:
-						results[combination] = (copy_mesh, (new_vertices, new_edges), two_colourability)
-						discarding_combination.append(set(combination))
-						discarding_combination_type[tuple(combination)] = 'two-colourable'
-						at_least_one_valid_k = True
-						total_valid += 1
-						if t1 < 0:
-							t1 = time.time()
+						adjacency = graph.reduced_adjacency(combination)
+						two_colourability = is_adjacency_two_colorable(adjacency)
+						if not two_colourability:
+							results[combination] = 'not two-colourable'
+							to_continue = True
+						else:
+							kept = (adjacency, two_colourability)
+							discarding_combination.append(set(combination))
+							discarding_combination_type[tuple(combination)] = 'two-colourable'
+							at_least_one_valid_k = True
+							total_valid += 1
+							if t1 < 0:
+								t1 = time.time()
+				finally:
+					journal = mesh.rollback_journal()
+				# keep the two-colourable mesh as a snapshot sharing the unchanged data with the input mesh
+				if kept is not None:
+					results[combination] = (snapshot.apply_journal(journal),) + kept
 
 			if t2 < 0 and total_valid > 0 and not at_least_one_valid_k:
 				t2 = time.time()
@@ -480,6 +532,23 @@ class TwoColourableProjection:
 	def get_results(self):
 		return self.results
 
+	def get_result_mesh(self, combination):
+		"""Return the two-colourable mesh resulting from the deletion of a combination of strips.
+
+		Parameters
+		----------
+		combination : tuple
+			A combination of strips yielding two-colourability.
+
+		Returns
+		-------
+		QuadMesh
+			A new mesh built from the snapshot of the result.
+
+		"""
+
+		return self.get_results()[combination][0].to_mesh()
+
 	def strip_deletions_yielding_two_colourability(self):
 		out = []
 		for combination, result in self.get_results().items():
@@ -514,4 +583,6 @@ if __name__ == '__main__':
 	mesh.collect_strips()
 	projection = TwoColourableProjection(mesh)
 	projection.projection(kmax=10)
-	print(projection.strip_deletions_yielding_two_colourability())
+	combinations = projection.strip_deletions_yielding_two_colourability()
+	print(combinations)
+	print([projection.get_result_mesh(combination).number_of_faces() for combination in combinations])
@@ -37,6 +37,7 @@ from compas.utilities import pairwise
 from compas.utilities import window
 from compas.utilities import geometric_key
 from compas_pattern.utilities.lists import list_split
+from compas_pattern.utilities.versioned_dict import VersionedDict
 
 __author__     = ['Robin Oval']
 __copyright__  = 'Copyright 2018, Block Research Group - ETH Zurich'
@@ -361,6 +362,8 @@ class Decomposition(Skeleton):
 
 					# modify triangular face
 					mesh_insert_vertex_on_edge(mesh, u, mesh.face_vertex_ancestor(fkey, u), v)
+					# the halfedges are modified directly
+					mesh.bump_topology_version()
 
 				elif case == 2:
 					# remove triangular face and merge the two boundary vertices
@@ -458,7 +461,7 @@ class Decomposition(Skeleton):
 				if fkey not in face_poles:
 					print('pole missing')
 
-		mesh.data['attributes']['face_pole'] = face_poles
+		mesh.attributes['face_pole'] = VersionedDict(face_poles)
 
 # ==============================================================================
 # Main
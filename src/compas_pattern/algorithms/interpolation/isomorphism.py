@@ -26,9 +26,10 @@ def strip_graph(mesh, close_strip_data=False):
 	if mesh.data['attributes']['strips'] is None or mesh.data['attributes']['strips'] == {}:
 		mesh.collect_strips()
 
-	graph = nx.MultiGraph([tuple(mesh.face_strips(fkey)) for fkey in mesh.faces()])
+	strip_graph = mesh.strip_connectivity()
+	graph = nx.MultiGraph(strip_graph.edges)
 	if close_strip_data:
-		nx.set_node_attributes(graph, {skey : {'closed': mesh.is_strip_closed(skey)} for skey in mesh.strips()})
+		nx.set_node_attributes(graph, {skey : {'closed': is_closed} for skey, is_closed in zip(strip_graph.skeys, strip_graph.closed)})
 	return graph
 
 
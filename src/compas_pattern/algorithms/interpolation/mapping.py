@@ -96,38 +96,44 @@ def distance_and_deletion_rules_between_2_meshes(mesh_i, mesh_j):
     for k in range(0, max(ni, nj) - 1):
         
         for nodes_i in it.combinations(list(mesh_i.strips()), k + max(0, ni - nj)):
-            mesh_i_copy = mesh_i.copy()
-            delete_strips(mesh_i_copy, nodes_i)
-            # discard if collateral strip deletions, which are at a higher distance
-            if ni - mesh_i_copy.number_of_strips() != len(nodes_i):
-                continue
-
-            for nodes_j in it.combinations(list(mesh_j.strips()), k + max(0, nj - ni)):
-                mesh_j_copy = mesh_j.copy()
-                delete_strips(mesh_j_copy, nodes_j)
+            # the deletions are rolled back rather than applied to a copy
+            mesh_i.begin_journal()
+            try:
+                delete_strips(mesh_i, nodes_i)
                 # discard if collateral strip deletions, which are at a higher distance
-                if nj - mesh_j_copy.number_of_strips() != len(nodes_j):
+                if ni - mesh_i.number_of_strips() != len(nodes_i):
                     continue
 
-                # # test strip isomorphism
-                # nb_graph_iso_check += 1
-                # if are_strips_isomorphic(mesh_i_copy, mesh_j_copy, close_strip_data=True):  
-                #     # test mesh isomorphism
-                #     nb_mesh_iso_check += 1
-                #     if are_meshes_isomorphic(mesh_i_copy, mesh_j_copy, boundary_edge_data=True):
-                #         distance = 2 * k + abs(ni - nj)
-                #         results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
+                for nodes_j in it.combinations(list(mesh_j.strips()), k + max(0, nj - ni)):
+                    mesh_j.begin_journal()
+                    try:
+                        delete_strips(mesh_j, nodes_j)
+                        # discard if collateral strip deletions, which are at a higher distance
+                        if nj - mesh_j.number_of_strips() != len(nodes_j):
+                            continue
+
+                        # # test strip isomorphism
+                        # nb_graph_iso_check += 1
+                        # if are_strips_isomorphic(mesh_i, mesh_j, close_strip_data=True):  
+                        #     # test mesh isomorphism
+                        #     nb_mesh_iso_check += 1
+                        #     if are_meshes_isomorphic(mesh_i, mesh_j, boundary_edge_data=True):
+                        #         distance = 2 * k + abs(ni - nj)
+                        #         results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
+
+                        nb_mesh_iso_check += 1
+                        if are_meshes_isomorphic(mesh_i, mesh_j, boundary_edge_data=True):
+                            distance = 2 * k + abs(ni - nj)
+                            results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
+
+                        # if are_strips_isomorphic(mesh_i, mesh_j, close_strip_data=True):  
+                        #     distance = 2 * k + abs(ni - nj)
+                        #     results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
+                    finally:
+                        mesh_j.rollback_journal()
+            finally:
+                mesh_i.rollback_journal()
 
-                nb_mesh_iso_check += 1
-                if are_meshes_isomorphic(mesh_i_copy, mesh_j_copy, boundary_edge_data=True):
-                    distance = 2 * k + abs(ni - nj)
-                    results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
-
-                # if are_strips_isomorphic(mesh_i_copy, mesh_j_copy, close_strip_data=True):  
-                #     distance = 2 * k + abs(ni - nj)
-                #     results.append((distance, {mesh_i: nodes_i, mesh_j: nodes_j}))
-
-        
         # potentially several combinations with different combinations of strips at the same distance
         if len(results) != 0:
             #print(nb_graph_iso_check, nb_mesh_iso_check)
@@ -138,17 +138,17 @@ def singular():
 
         if edit is None or edit == 'exit':
             rs.EnableRedraw(False)
-            artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_polygonal_mesh())
+            artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_polygonal_mesh())
             return artist.draw_mesh()
 
         if edit == 'topology':
             editing_topology(coarse_pseudo_quad_mesh)
             coarse_pseudo_quad_mesh.densification()
-            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.get_quad_mesh().copy())
+            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.peek_quad_mesh().copy())
 
         elif edit == 'density':
             editing_density(coarse_pseudo_quad_mesh)
-            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.get_quad_mesh().copy())
+            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.peek_quad_mesh().copy())
 
         elif edit == 'symmetry':
             editing_symmetry(coarse_pseudo_quad_mesh)
@@ -157,7 +157,7 @@ def singular():
             editing_geometry(coarse_pseudo_quad_mesh)
 
         rs.EnableRedraw(False)
-        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_polygonal_mesh())
+        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_polygonal_mesh())
         guid = artist.draw_mesh()
         rs.EnableRedraw(True)
 
@@ -165,7 +165,7 @@ def singular():
             save_design(coarse_pseudo_quad_mesh, layer)
 
         if edit == 'evaluate':
-            evaluate_pattern(coarse_pseudo_quad_mesh.get_polygonal_mesh())
+            evaluate_pattern(coarse_pseudo_quad_mesh.peek_polygonal_mesh())
 
 
 def editing_topology(coarse_pseudo_quad_mesh):
@@ -237,7 +237,7 @@ def editing_density(coarse_pseudo_quad_mesh):
 
         # update drawing
         rs.EnableRedraw(False)
-        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_quad_mesh())
+        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_quad_mesh())
         guid = artist.draw_mesh()
         rs.EnableRedraw(True)
 
@@ -318,7 +318,7 @@ def editing_symmetry(coarse_pseudo_quad_mesh):
     while True:
 
         rs.EnableRedraw(False)
-        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_polygonal_mesh())
+        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_polygonal_mesh())
         guid = artist.draw_mesh()
         rs.EnableRedraw(True)
 
@@ -333,7 +333,7 @@ def editing_symmetry(coarse_pseudo_quad_mesh):
             return coarse_pseudo_quad_mesh.get_polygonal_mesh()
 
         elif operator == 'seed':
-            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.get_quad_mesh().copy())
+            coarse_pseudo_quad_mesh.set_polygonal_mesh(coarse_pseudo_quad_mesh.peek_quad_mesh().copy())
 
         elif operator in conway and conway[operator] in globals() and str(conway[operator])[: 6] == 'conway':
             coarse_pseudo_quad_mesh.set_polygonal_mesh(globals()[conway[operator]](
@@ -541,10 +541,10 @@ def save_design(coarse_pseudo_quad_mesh, layer):
         artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh)
         guid = artist.draw_mesh(coarse_pseudo_quad_mesh)
     elif mesh_to_save == 'pseudo_quad_mesh':
-        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_quad_mesh())
+        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_quad_mesh())
         guid = artist.draw_mesh()
     elif mesh_to_save == 'polygonal_mesh':
-        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.get_polygonal_mesh())
+        artist = rhino_artist.MeshArtist(coarse_pseudo_quad_mesh.peek_polygonal_mesh())
         guid = artist.draw_mesh()
     
     if guid is not None:
@@ -1,3 +1,4 @@
 from compas_pattern.datastructures.mesh.mesh import *
 from compas_pattern.datastructures.mesh.operations import *
-from compas_pattern.datastructures.mesh.coloring import *
\ No newline at end of file
+from compas_pattern.datastructures.mesh.coloring import *
+from compas_pattern.datastructures.mesh.snapshot import *
\ No newline at end of file
@@ -6,6 +6,8 @@ from compas.geometry import angle_points
 from compas.utilities import geometric_key
 from compas.utilities import pairwise
 
+from compas_pattern.utilities.versioned_dict import VersionedDict
+
 
 __all__ = ['Mesh']
 
@@ -15,8 +17,311 @@ __all__ = ['Mesh']
 
 class Mesh(Mesh):
 
+	# the dictionaries of the elements recorded in the journals
+	journaled_elements = ('vertex', 'halfedge', 'face', 'facedata', 'edgedata')
+
+	# the dictionary attributes whose items are recorded in the journals by their operations
+	journaled_attributes = ()
+
+	# the dictionary attributes counting the modifications of their items, to check the validity of the indices built on them
+	versioned_attributes = ()
+
 	def __init__(self):
 		super(Mesh, self).__init__()
+		self._topology_version = 0
+		self._journal = None
+
+	@property
+	def data(self):
+		return super(Mesh, self).data
+
+	@data.setter
+	def data(self, data):
+		super(Mesh, type(self)).data.fset(self, data)
+		self.version_attributes()
+
+	def version_attributes(self):
+		"""Convert the versioned attributes that have been replaced by plain dictionaries into versioned dictionaries.
+		"""
+
+		for name in self.versioned_attributes:
+			value = self.attributes.get(name)
+			if type(value) is dict:
+				self.attributes[name] = VersionedDict(value)
+
+	# --------------------------------------------------------------------------
+	# topology version
+	# --------------------------------------------------------------------------
+
+	@property
+	def topology_version(self):
+		"""int: A counter incremented by each topological modification, to check the validity of cached topological data."""
+		return self._topology_version
+
+	def bump_topology_version(self):
+		"""Increment the topology version, for instance after modifying the halfedge data structure directly.
+		"""
+
+		self._topology_version += 1
+
+	def clear(self):
+		if self._journal is not None:
+			self._journal_order(*self.journaled_elements)
+			self.journal_vertices(list(self.vertices()))
+			for fkey in list(self.faces()):
+				self._journal_face(fkey)
+			for u, v in list(self.edgedata):
+				self._journal_edge(u, v)
+		super(Mesh, self).clear()
+		self.bump_topology_version()
+
+	def add_vertex(self, key=None, attr_dict=None, **kwattr):
+		if self._journal is not None:
+			self._journal_vertex(key if key is not None else self._max_int_key + 1)
+		# updating the attributes of an existing vertex does not modify the topology
+		if key is None or key not in self.vertex:
+			self.bump_topology_version()
+		return super(Mesh, self).add_vertex(key=key, attr_dict=attr_dict, **kwattr)
+
+	def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
+		if self._journal is not None:
+			self._journal_face(fkey if fkey is not None else self._max_int_fkey + 1)
+			for u, v in pairwise(list(vertices) + list(vertices[:1])):
+				self._journal_vertex(u)
+				self._journal_edge(u, v)
+		self.bump_topology_version()
+		return super(Mesh, self).add_face(vertices, fkey=fkey, attr_dict=attr_dict, **kwattr)
+
+	def delete_vertex(self, key):
+		if self._journal is not None:
+			self._journal_order(*self.journaled_elements)
+			self._journal_vertex(key)
+			for nbr in self.vertex_neighbors(key):
+				fkey = self.halfedge[key][nbr]
+				if fkey is not None:
+					self._journal_face(fkey)
+				self._journal_vertex(nbr)
+				self._journal_edge(key, nbr)
+				for n in self.vertex_neighbors(nbr):
+					self._journal_vertex(n)
+					self._journal_edge(nbr, n)
+		self.bump_topology_version()
+		super(Mesh, self).delete_vertex(key)
+
+	def delete_face(self, fkey):
+		if self._journal is not None:
+			self._journal_order('face', 'facedata', 'edgedata')
+			self._journal_face(fkey)
+		self.bump_topology_version()
+		super(Mesh, self).delete_face(fkey)
+
+	# --------------------------------------------------------------------------
+	# journal
+	# --------------------------------------------------------------------------
+
+	def begin_journal(self):
+		"""Start recording the former state of the elements modified by the next operations, to roll them back without copying the mesh.
+		The vertices, the halfedges, the faces, their attributes and the attributes of the edges are recorded by the builders and the modifiers.
+		The items of the journaled attributes are recorded by their operations.
+		The order of the elements is recorded before their first deletion, so that the rollback restores their iteration order as well.
+		Vertex attributes modified in place, for instance by smoothing, must be recorded beforehand with journal_vertices.
+
+		"""
+
+		if self._journal is not None:
+			raise Exception('A journal is already being recorded.')
+		self._journal = {
+			'vertex': {},
+			'halfedge': {},
+			'face': {},
+			'facedata': {},
+			'edgedata': {},
+			'attributes': {},
+			'order': {},
+			'max_int_key': self._max_int_key,
+			'max_int_fkey': self._max_int_fkey
+		}
+		for name in self.journaled_attributes:
+			self._begin_journal_attribute(name)
+
+	def is_journaling(self):
+		"""Output whether a journal is being recorded.
+
+		Returns
+		-------
+		bool
+			True if a journal is being recorded. False otherwise.
+		"""
+
+		return self._journal is not None
+
+	def end_journal(self):
+		"""Stop recording the journal, keeping the modifications.
+
+		Returns
+		-------
+		dict
+			The journal, to undo the modifications with apply_journal.
+
+		"""
+
+		if self._journal is None:
+			raise Exception('No journal is being recorded.')
+		journal = self._journal
+		self._journal = None
+		return journal
+
+	def rollback_journal(self):
+		"""Stop recording the journal and undo the modifications.
+
+		Returns
+		-------
+		dict
+			The journal to redo the modifications with apply_journal.
+
+		"""
+
+		return self.apply_journal(self.end_journal())
+
+	def apply_journal(self, journal):
+		"""Restore the state of the elements recorded in a journal.
+		Each journal is applied once, the returned journal applying the modifications back.
+
+		Parameters
+		----------
+		journal : dict
+			A journal from end_journal, rollback_journal or apply_journal.
+
+		Returns
+		-------
+		dict
+			The journal to restore the current state of the elements.
+
+		"""
+
+		if self._journal is not None:
+			raise Exception('A journal cannot be applied while another one is being recorded.')
+
+		inverse = {
+			'attributes': {},
+			'order': {},
+			'max_int_key': self._max_int_key,
+			'max_int_fkey': self._max_int_fkey
+		}
+		for name in self.journaled_elements:
+			data = getattr(self, name)
+			images = journal[name]
+			order = journal['order'].get(name)
+			inverse[name] = {key: data.get(key) for key in images}
+			if order is not None:
+				inverse['order'][name] = list(data)
+			for key, value in images.items():
+				if value is not None:
+					data[key] = value
+				elif key in data:
+					del data[key]
+			# the restored elements would be iterated last otherwise
+			if order is not None:
+				_reorder(data, order)
+		self._max_int_key = journal['max_int_key']
+		self._max_int_fkey = journal['max_int_fkey']
+
+		# the caches built on the topology during the modifications are not valid anymore
+		self.bump_topology_version()
+
+		return inverse
+
+	def journal_vertices(self, vkeys):
+		"""Record the current state of vertices in the journal, if any, before modifying their attributes in place.
+
+		Parameters
+		----------
+		vkeys : list
+			The vertex keys.
+
+		"""
+
+		if self._journal is not None:
+			for vkey in vkeys:
+				self._journal_vertex(vkey)
+
+	def _journal_vertex(self, vkey):
+		# the first state of a vertex and of its halfedges, None if it does not exist yet
+		journal = self._journal
+		if vkey in journal['vertex']:
+			return
+		attr = self.vertex.get(vkey)
+		journal['vertex'][vkey] = dict(attr) if attr is not None else None
+		nbrs = self.halfedge.get(vkey)
+		journal['halfedge'][vkey] = dict(nbrs) if nbrs is not None else None
+
+	def _journal_face(self, fkey):
+		journal = self._journal
+		if fkey in journal['face']:
+			return
+		vertices = self.face.get(fkey)
+		journal['face'][fkey] = list(vertices) if vertices is not None else None
+		attr = self.facedata.get(fkey)
+		journal['facedata'][fkey] = dict(attr) if attr is not None else None
+		if vertices is not None:
+			for u, v in pairwise(vertices + vertices[:1]):
+				self._journal_vertex(u)
+				self._journal_edge(u, v)
+
+	def _journal_order(self, *names):
+		# the order of the elements before their first deletion
+		orders = self._journal['order']
+		for name in names:
+			if name not in orders:
+				orders[name] = list(getattr(self, name))
+
+	def _journal_edge(self, u, v):
+		edgedata = self._journal['edgedata']
+		for edge in ((u, v), (v, u)):
+			if edge not in edgedata:
+				attr = self.edgedata.get(edge)
+				edgedata[edge] = dict(attr) if attr is not None else None
+
+	def _begin_journal_attribute(self, name):
+		# the items of a dictionary attribute are recorded as long as it is not replaced
+		self._journal['attributes'][name] = {'data': self.attributes[name], 'items': {}, 'order': None, 'replaced': False}
+
+	def _journal_attribute_item(self, name, key, delete=False):
+		journal = self._journal['attributes'][name]
+		data = journal['data']
+		if self.attributes[name] is not data:
+			return
+		if key not in journal['items']:
+			value = data.get(key)
+			journal['items'][key] = list(value) if isinstance(value, list) else value
+		# a deleted item restored later would be iterated last
+		if delete and journal['order'] is None:
+			journal['order'] = list(data)
+
+	def _apply_journal_attribute(self, journal, inverse, name, set_item, delete_item):
+		# restore the items of a dictionary attribute through the operations maintaining its index, returning whether their order was restored
+		journal = journal['attributes'][name]
+		data = journal['data']
+		current = self.attributes[name]
+		if current is not data:
+			inverse['attributes'][name] = {'data': current, 'items': {}, 'order': None, 'replaced': True}
+			self.attributes[name] = data
+		else:
+			order = None
+			if journal['order'] is not None or any([value is None for value in journal['items'].values()]):
+				order = list(data)
+			inverse['attributes'][name] = {'data': data, 'items': {key: data.get(key) for key in journal['items']}, 'order': order, 'replaced': False}
+
+		for key, value in journal['items'].items():
+			if value is not None:
+				set_item(key, value)
+			elif key in data:
+				delete_item(key)
+
+		if journal['order'] is None:
+			return False
+		_reorder(data, journal['order'])
+		return True
 
 	def to_vertices_and_faces(self, keep_keys=True):
 
@@ -120,6 +425,20 @@ class Mesh(Mesh):
 		return centroid_points([self.vertex_coordinates(vkey) for vkey in self.vertices()])
 		
 
+def _reorder(data, order):
+	# reorder a dictionary in place, the keys missing from the order coming last
+	items = [(key, data[key]) for key in order if key in data]
+	if len(items) != len(data):
+		ordered = set(order)
+		items += [(key, value) for key, value in data.items() if key not in ordered]
+	# the items are unchanged, so the version of a versioned dictionary is kept
+	version = getattr(data, 'version', None)
+	data.clear()
+	data.update(items)
+	if version is not None:
+		data.version = version
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
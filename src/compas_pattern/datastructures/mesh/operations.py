@@ -4,7 +4,8 @@ __all__ = [
 	'mesh_move_by',
 	'mesh_move_vertices_by',
 	'mesh_move_vertex_to',
-	'mesh_move_vertices_to'
+	'mesh_move_vertices_to',
+	'mesh_substitute_vertices_in_faces'
 ]
 
 
@@ -92,6 +93,27 @@ def mesh_move_vertices_to(mesh, key_to_point):
 		mesh_move_vertex_to(mesh, point, vkey)
 
 
+def mesh_substitute_vertices_in_faces(mesh, old_vkeys_to_new_vkeys, fkeys):
+	"""Substitute several vertices in faces in one pass, each face being rebuilt once with the same key.
+	The faces are rebuilt in the given order.
+
+	Parameters
+	----------
+	mesh : Mesh
+		A mesh.
+	old_vkeys_to_new_vkeys : dict
+		A dictionary of the old vertex keys pointing to the new ones.
+	fkeys : list
+		The keys of the faces with old vertices.
+	"""
+
+	faces = [(fkey, [old_vkeys_to_new_vkeys.get(vkey, vkey) for vkey in mesh.face_vertices(fkey)]) for fkey in fkeys]
+	for fkey, vertices in faces:
+		mesh.delete_face(fkey)
+	for fkey, vertices in faces:
+		mesh.add_face(vertices, fkey)
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
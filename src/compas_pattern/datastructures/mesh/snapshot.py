@@ -0,0 +1,287 @@
+from copy import deepcopy
+
+from compas_pattern.utilities.persistent import PersistentMap
+
+
+__all__ = ['MeshSnapshot']
+
+
+class MeshSnapshot(object):
+	"""An immutable snapshot of a mesh, such as a quad mesh or a coarse quad mesh, to hold many variants of a mesh at once.
+	The vertices, the halfedges, the faces, the data of the faces and of the edges and the journaled attributes are stored in persistent maps.
+	The snapshots derived with a journal share the data of the elements left unchanged with their parent.
+	The other attributes are copied once and shared by all the derived snapshots.
+	The iteration order of the elements and of the items of the journaled attributes is stored as the rank of their keys, to rebuild the mesh in the same order as the modified mesh.
+
+	Parameters
+	----------
+	mesh_type : type
+		The type of the mesh.
+	elements : dict
+		The persistent maps of the journaled element dictionaries of the mesh, such as the vertex and face dictionaries.
+	attributes : dict
+		The persistent maps of the journaled attributes, and the values of the other attributes.
+	orders : dict
+		The names of the persistent maps pointing to the persistent map of the ranks of their keys and to the next rank.
+	defaults : tuple
+		The default vertex, edge and face attributes.
+	max_int_key : int
+		The maximum integer vertex key.
+	max_int_fkey : int
+		The maximum integer face key.
+
+	"""
+
+	def __init__(self, mesh_type, elements, attributes, orders, defaults, max_int_key, max_int_fkey):
+		self.mesh_type = mesh_type
+		self._elements = elements
+		self._attributes = attributes
+		self._orders = orders
+		self._defaults = defaults
+		self._max_int_key = max_int_key
+		self._max_int_fkey = max_int_fkey
+
+	@classmethod
+	def from_mesh(cls, mesh):
+		"""Take a snapshot of a mesh, copying all its data.
+
+		Parameters
+		----------
+		mesh : Mesh
+			A mesh.
+
+		Returns
+		-------
+		MeshSnapshot
+			The snapshot of the mesh.
+
+		"""
+
+		elements = {}
+		orders = {}
+		for name in mesh.journaled_elements:
+			data = getattr(mesh, name)
+			elements[name] = PersistentMap([(key, _copy(value)) for key, value in data.items()])
+			orders[name] = _ranks(data)
+		attributes = {}
+		for name, value in mesh.attributes.items():
+			if name in mesh.journaled_attributes:
+				attributes[name] = PersistentMap([(key, _copy(item)) for key, item in value.items()])
+				orders[name] = _ranks(value)
+			else:
+				attributes[name] = deepcopy(value)
+		defaults = deepcopy((mesh.default_vertex_attributes, mesh.default_edge_attributes, mesh.default_face_attributes))
+		return cls(type(mesh), elements, attributes, orders, defaults, mesh._max_int_key, mesh._max_int_fkey)
+
+	def apply_journal(self, journal):
+		"""Derive the snapshot of the mesh modified by a journal, sharing the unchanged data with this snapshot.
+		The journal holds the state of the modified elements to apply, as returned by rollback_journal after modifying the mesh of this snapshot.
+
+		Parameters
+		----------
+		journal : dict
+			A journal from rollback_journal or apply_journal.
+
+		Returns
+		-------
+		MeshSnapshot
+			The derived snapshot.
+
+		"""
+
+		elements = {}
+		orders = dict(self._orders)
+		for name, data in self._elements.items():
+			images = journal[name]
+			items = _changed_items(data, images)
+			deleted = [key for key, value in images.items() if value is None]
+			elements[name] = data.update(items, deleted)
+			orders[name] = _derive_ranks(self._orders[name], data, images, journal['order'].get(name))
+
+		attributes = dict(self._attributes)
+		for name, entry in journal['attributes'].items():
+			# a replaced attribute is stored again in full
+			if entry['replaced']:
+				attributes[name] = PersistentMap([(key, _copy(item)) for key, item in entry['data'].items()])
+				orders[name] = _ranks(entry['data'])
+			else:
+				items = _changed_items(self._attributes[name], entry['items'])
+				deleted = [key for key, item in entry['items'].items() if item is None]
+				attributes[name] = self._attributes[name].update(items, deleted)
+				orders[name] = _derive_ranks(self._orders[name], self._attributes[name], entry['items'], entry['order'])
+
+		return MeshSnapshot(self.mesh_type, elements, attributes, orders, self._defaults, journal['max_int_key'], journal['max_int_fkey'])
+
+	def to_mesh(self):
+		"""Build a mesh from the snapshot, listing its elements and the items of its journaled attributes in the same order as in the mesh of the snapshot.
+
+		Returns
+		-------
+		Mesh
+			A mesh of the type of the mesh of the snapshot.
+
+		"""
+
+		mesh = self.mesh_type()
+		dva, dea, dfa = deepcopy(self._defaults)
+		mesh.default_vertex_attributes.update(dva)
+		mesh.default_edge_attributes.update(dea)
+		mesh.default_face_attributes.update(dfa)
+		for name, data in self._elements.items():
+			setattr(mesh, name, {key: _copy(value) for key, value in _ordered_items(data, self._orders[name])})
+		for name, value in self._attributes.items():
+			if isinstance(value, PersistentMap):
+				mesh.attributes[name] = {key: _copy(item) for key, item in _ordered_items(value, self._orders[name])}
+			else:
+				mesh.attributes[name] = deepcopy(value)
+		mesh.version_attributes()
+		mesh._max_int_key = self._max_int_key
+		mesh._max_int_fkey = self._max_int_fkey
+		return mesh
+
+	# --------------------------------------------------------------------------
+	# read-only accessors
+	# --------------------------------------------------------------------------
+
+	def vertices(self):
+		"""Iterate over the vertex keys, in no particular order.
+		"""
+
+		return self._elements['vertex'].keys()
+
+	def faces(self):
+		"""Iterate over the face keys, in no particular order.
+		"""
+
+		return self._elements['face'].keys()
+
+	def number_of_vertices(self):
+		return len(self._elements['vertex'])
+
+	def number_of_faces(self):
+		return len(self._elements['face'])
+
+	def vertex_coordinates(self, vkey):
+		"""Return the coordinates of a vertex.
+
+		Parameters
+		----------
+		vkey : hashable
+			The vertex key.
+
+		Returns
+		-------
+		list
+			The XYZ coordinates.
+
+		"""
+
+		attr = self._elements['vertex'][vkey]
+		return [attr.get(name, self._defaults[0].get(name)) for name in 'xyz']
+
+	def face_vertices(self, fkey):
+		"""Return the vertices of a face.
+
+		Parameters
+		----------
+		fkey : hashable
+			The face key.
+
+		Returns
+		-------
+		list
+			The vertex keys.
+
+		"""
+
+		return list(self._elements['face'][fkey])
+
+	def attribute(self, name):
+		"""Return an attribute of the mesh, as a persistent map for the journaled attributes, such as the strip data.
+		The returned value must not be modified.
+
+		Parameters
+		----------
+		name : str
+			The attribute name.
+
+		Returns
+		-------
+		object
+			The attribute.
+
+		"""
+
+		return self._attributes[name]
+
+
+def _copy(value):
+	# the elements and the attribute items are dictionaries or lists of immutable values
+	if isinstance(value, dict):
+		return dict(value)
+	if isinstance(value, list):
+		return list(value)
+	return value
+
+
+def _changed_items(persistent_map, images):
+	# the copies of the images differing from the current values, in their order for dictionaries, the unchanged values being left shared
+	items = []
+	for key, value in images.items():
+		if value is None:
+			continue
+		current = persistent_map.get(key)
+		if isinstance(value, dict) and isinstance(current, dict):
+			if list(value.items()) == list(current.items()):
+				continue
+		elif current == value:
+			continue
+		items.append((key, _copy(value)))
+	return items
+
+
+def _ranks(data):
+	# the ranks of the keys of a dictionary in its iteration order, and the next rank
+	return PersistentMap([(key, rank) for rank, key in enumerate(data)]), len(data)
+
+
+def _derive_ranks(ranks, data, images, order):
+	# the ranks of the keys after applying the images of a journal to a persistent map, with the order of the keys after the modifications if some were deleted
+	ranks, rank = ranks
+	if order is None:
+		# without deletions, the new keys come last in the order they were recorded
+		appended = [key for key, value in images.items() if value is not None and key not in data]
+	else:
+		# the untouched keys keep their order, the keys after the last one were modified in place, restored or added
+		i = len(order)
+		while i > 0 and order[i - 1] in images:
+			i -= 1
+		appended = order[i:]
+	deleted = [key for key, value in images.items() if value is None]
+	return ranks.update([(key, rank + i) for i, key in enumerate(appended)], deleted), rank + len(appended)
+
+
+def _ordered_items(persistent_map, ranks):
+	ranks = ranks[0]
+	return sorted(persistent_map.items(), key=lambda item: ranks[item[0]])
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+	from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
+
+	vertices = [[i, j, 0.0] for i in range(4) for j in range(4)]
+	faces = [[4 * i + j, 4 * (i + 1) + j, 4 * (i + 1) + j + 1, 4 * i + j + 1] for i in range(3) for j in range(3)]
+	mesh = QuadMesh.from_vertices_and_faces(vertices, faces)
+	mesh.collect_strips()
+
+	snapshot = MeshSnapshot.from_mesh(mesh)
+	mesh.begin_journal()
+	delete_strips(mesh, [0])
+	variant = snapshot.apply_journal(mesh.rollback_journal())
+	print(snapshot.number_of_faces(), variant.number_of_faces(), variant.to_mesh().number_of_strips())
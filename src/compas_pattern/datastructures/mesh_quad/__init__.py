@@ -1,2 +1,3 @@
 from compas_pattern.datastructures.mesh_quad.mesh_quad import *
+from compas_pattern.datastructures.mesh_quad.strip_graph import *
 from compas_pattern.datastructures.mesh_quad.coloring import *
\ No newline at end of file
@@ -26,8 +26,7 @@ def quad_mesh_strip_2_coloring(quad_mesh):
         None if not two-colorable.
     """
 
-    vertices, edges = quad_mesh.strip_graph()
-    return is_adjacency_two_colorable(adjacency_from_edges(edges))
+    return is_adjacency_two_colorable(quad_mesh.strip_connectivity().adjacency())
 
 
 def quad_mesh_strip_n_coloring(quad_mesh):
@@ -44,8 +43,7 @@ def quad_mesh_strip_n_coloring(quad_mesh):
         A dictionary with strip keys pointing to colors.
     """
 
-    vertices, edges = quad_mesh.strip_graph()
-    return vertex_coloring(adjacency_from_edges(edges))
+    return vertex_coloring(quad_mesh.strip_connectivity().adjacency())
 
 
 def quad_mesh_polyedge_2_coloring(quad_mesh):
@@ -156,6 +156,9 @@ def add_element_end(mesh, u, v):
 
 def update_strip_data(mesh, full_updated_polyedge, old_vkeys_to_new_vkeys):
 	
+	# only the strips with an edge at a split vertex cross the modified region
+	touched_skeys = set([skey for vkey in old_vkeys_to_new_vkeys for skey in mesh.vertex_strips(vkey)])
+
 	# orthogonal strips
 	orth_to_update = {}
 	orth_skeys = []
@@ -166,13 +169,13 @@ def update_strip_data(mesh, full_updated_polyedge, old_vkeys_to_new_vkeys):
 		edges = mesh.collect_strip(new_u, new_v)
 		orth_to_update[skey] = edges
 	for skey, edges in orth_to_update.items():
-		mesh.data['attributes']['strips'][skey] = edges
+		mesh.set_strip_edges(skey, edges)
 	
 	# parallel strips
 	paral_to_update = {}
-	for skey, edges in mesh.data['attributes']['strips'].items():
+	for skey in touched_skeys:
 		if skey not in orth_to_update:
-			for u, v in edges:
+			for u, v in mesh.strip_edges(skey):
 				if u in old_vkeys_to_new_vkeys:
 					u, v = v, u
 				elif v in old_vkeys_to_new_vkeys:
@@ -184,12 +187,12 @@ def update_strip_data(mesh, full_updated_polyedge, old_vkeys_to_new_vkeys):
 				paral_to_update[skey] = new_edges
 				break
 	for skey, edges in paral_to_update.items():
-		mesh.data['attributes']['strips'][skey] = edges
+		mesh.set_strip_edges(skey, edges)
 
 	# self strip
-	n = max(mesh.data['attributes']['strips']) + 1
+	n = max(mesh.strips()) + 1
 	strip_edges = [tuple(old_vkeys_to_new_vkeys[vkey]) for vkey in full_updated_polyedge]
-	mesh.data['attributes']['strips'][n] = strip_edges
+	mesh.set_strip_edges(n, strip_edges)
 
 	return n
 
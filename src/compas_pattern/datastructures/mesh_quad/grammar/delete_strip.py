@@ -1,10 +1,13 @@
 from compas_pattern.datastructures.network.network import Network
-from compas.datastructures import network_disconnected_vertices
-from compas.datastructures import mesh_substitute_vertex_in_faces
+from compas_pattern.datastructures.mesh.operations import mesh_substitute_vertices_in_faces
+from compas_pattern.topology.components import UnionFind
+from compas_pattern.topology.components import union_find_components
 from compas.geometry import centroid_points
+from compas.utilities import pairwise
 
 __all__ = [
 	'delete_strips',
+	'delete_strips_at_once',
 	'delete_strip',
 	'strip_edge_network',
 	'update_strip_data',
@@ -13,15 +16,100 @@ __all__ = [
 
 
 def delete_strips(mesh, skeys, callback=None, callback_args=None):
+	"""Delete strips one by one.
+	Each merged vertex is at the centroid of the vertices merged by its strip, including those merged by the previous strips, and the callback is called after each deletion.
+	To merge all the vertices of the strips once, at the centroid of their groups, use delete_strips_at_once.
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	skeys : list
+		The strip keys.
+	callback : callable, optional
+		A function called with the mesh and the callback arguments after each strip deletion.
+	callback_args : tuple, optional
+		The arguments of the callback.
+
+	"""
 
 	for skey in skeys:
-		if skey in mesh.strips():
+		if skey in mesh.attributes['strips']:
 			delete_strip(mesh, skey)
 			if callback:
 				if callable(callback):
 					callback(mesh, callback_args)
 
 
+def delete_strips_at_once(mesh, skeys, update_data=True):
+	"""Delete several strips at once.
+	The vertices connected by the edges of the strips are grouped with a union-find and each group is merged once, instead of deleting the strips one by one.
+	As when deleting them one by one, a strip that has collapsed with the previous ones is not deleted.
+	The topology is the same, but each merged vertex is at the centroid of all the vertices of its group.
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	skeys : list
+		The strip keys.
+	update_data : bool, optional
+		Update strip data. Default is True.
+
+	Returns
+	-------
+	old_vkeys_to_new_vkeys : dict
+		A dictionary of the merged vertices pointing to their new vertex.
+
+	"""
+
+	# union-find of the vertices of the edges of the deleted strips
+	union_find = UnionFind()
+	find = union_find.find
+
+	# strips to delete, skipping those that have collapsed with the previous ones, as in update_strip_data
+	deleted_skeys = []
+	for skey in skeys:
+		if skey not in mesh.attributes['strips'] or skey in deleted_skeys:
+			continue
+		# edges with the vertices merged by the previous strips
+		edges = [(find(u), find(v)) for u, v in mesh.strip_edges(skey)]
+		if all([u == v for u, v in edges]) or len([edge for i, edge in enumerate(edges) if i == 0 or edge != edges[i - 1]]) < 2:
+			continue
+		deleted_skeys.append(skey)
+		for u, v in edges:
+			union_find.union(u, v)
+
+	# groups of vertices to merge, including the poles on their own
+	parts = {}
+	for vkey in set([vkey for skey in deleted_skeys for edge in mesh.strip_edges(skey) for vkey in edge]):
+		parts.setdefault(find(vkey), []).append(vkey)
+
+	# delete strip faces
+	for fkey in set([fkey for skey in deleted_skeys for fkey in mesh.strip_faces(skey)]):
+		mesh.delete_face(fkey)
+
+	# merge each group in a new vertex
+	old_vkeys_to_new_vkeys = {}
+	for part in parts.values():
+		x, y, z = centroid_points([mesh.vertex_coordinates(vkey) for vkey in part])
+		new_vkey = mesh.add_vertex(attr_dict={'x': x, 'y': y, 'z': z})
+		old_vkeys_to_new_vkeys.update({old_vkey: new_vkey for old_vkey in part})
+
+	# rebuild each face with merged vertices once
+	fkeys = set([fkey for vkey in old_vkeys_to_new_vkeys for fkey in mesh.vertex_faces(vkey)])
+	mesh_substitute_vertices_in_faces(mesh, old_vkeys_to_new_vkeys, [fkey for fkey in mesh.faces() if fkey in fkeys])
+
+	for old_vkey in old_vkeys_to_new_vkeys:
+		mesh.delete_vertex(old_vkey)
+
+	# update strip data once
+	if update_data:
+		update_strip_data(mesh, old_vkeys_to_new_vkeys)
+
+	return old_vkeys_to_new_vkeys
+
+
 def delete_strip(mesh, skey, update_data=True):
 	"""Delete a strip.
 
@@ -41,9 +129,10 @@ def delete_strip(mesh, skey, update_data=True):
 
 	"""
 
-	# build network between vertices of the edges of the strip to delete to get the disconnect parts of vertices to merge
-	network = strip_edge_network(mesh, skey)
-	disc_vertices = network_disconnected_vertices(network)
+	# connected parts of the vertices of the edges of the strip to merge, with a union-find instead of a network
+	strip_edges = mesh.strip_edges(skey)
+	vertices = list(set([vkey for edge in strip_edges for vkey in edge]))
+	parts = union_find_components(vertices, [(u, v) for u, v in strip_edges if u != v]) # exception for poles
 
 	# delete strip faces
 	for fkey in mesh.strip_faces(skey):
@@ -52,20 +141,23 @@ def delete_strip(mesh, skey, update_data=True):
 	old_vkeys_to_new_vkeys = {}
 
 	# merge strip edge vertices that are connected
-	for vertices in disc_vertices:
-
-		# new vertex
+	for vertices in parts:
 		x, y, z = centroid_points([mesh.vertex_coordinates(vkey) for vkey in vertices])
 		new_vkey = mesh.add_vertex(attr_dict={'x': x, 'y': y, 'z': z})
 		old_vkeys_to_new_vkeys.update({old_vkey: new_vkey for old_vkey in vertices})
 
-		# replace the old vertices
-		for old_vkey in vertices:
-			new_faces = mesh_substitute_vertex_in_faces(mesh, old_vkey, new_vkey, mesh.vertex_faces(old_vkey))
+	# rebuild each face with merged vertices once, in the order of their last substitution vertex by vertex
+	fkeys = []
+	visited = set()
+	for fkey in reversed([fkey for vertices in parts for vkey in vertices for fkey in mesh.vertex_faces(vkey)]):
+		if fkey not in visited:
+			visited.add(fkey)
+			fkeys.append(fkey)
+	mesh_substitute_vertices_in_faces(mesh, old_vkeys_to_new_vkeys, list(reversed(fkeys)))
 
-		# delete the old vertices
-		for old_vkey in vertices:
-			mesh.delete_vertex(old_vkey)
+	# delete the old vertices
+	for old_vkey in old_vkeys_to_new_vkeys:
+		mesh.delete_vertex(old_vkey)
 
 	# update strip data
 	if update_data:
@@ -83,14 +175,16 @@ def strip_edge_network(mesh, skey):
 
 def update_strip_data(mesh, old_vkeys_to_new_vkeys):
 
-	strip_data = mesh.data['attributes']['strips'].copy()
+	# only the strips with an edge at a merged vertex are modified
+	touched_skeys = set([skey for vkey in old_vkeys_to_new_vkeys for skey in mesh.vertex_strips(vkey)])
+	strip_data = {skey: mesh.strip_edges(skey) for skey in touched_skeys}
 
 	for skey, edges in strip_data.items():
 		new_edges = [tuple([old_vkeys_to_new_vkeys.get(vkey, vkey) for vkey in edge]) for edge in edges]
 
 		# remove collapsed strips
 		if all([u == v for u, v in new_edges]):
-			del mesh.data['attributes']['strips'][skey]
+			mesh.delete_strip_data(skey)
 			continue
 		
 		# remove collapsed faces
@@ -101,11 +195,11 @@ def update_strip_data(mesh, old_vkeys_to_new_vkeys):
 					duplicates.append(i)
 		for i in reversed(duplicates):
 			del new_edges[i]
-		mesh.data['attributes']['strips'][skey] = new_edges
+		mesh.set_strip_edges(skey, new_edges)
 		
 		# remove collateral collapsed strips
 		if len(new_edges) < 2:
-			del mesh.data['attributes']['strips'][skey]
+			mesh.delete_strip_data(skey)
 
 
 def strips_to_split_to_prevent_boundary_collapse(mesh, skeys):
@@ -125,9 +219,11 @@ def strips_to_split_to_prevent_boundary_collapse(mesh, skeys):
 
     """
 
+    skeys = set(skeys)
     to_split = {}
     for boundary in mesh.boundaries():
-        non_deleted_strips = [mesh.edge_strip((u, v)) for u, v in pairwise(boundary + boundary[:1]) if mesh.edge_strip((u, v)) not in skeys]
+        boundary_strips = [mesh.edge_strip((u, v)) for u, v in pairwise(boundary + boundary[:1])]
+        non_deleted_strips = [skey_2 for skey_2 in boundary_strips if skey_2 not in skeys]
 
         if len(non_deleted_strips) == 0:
             return None
@@ -1,7 +1,7 @@
 from math import pi
 
 from compas_pattern.datastructures.mesh.mesh import Mesh
-from compas_pattern.datastructures.network.network import Network
+from compas_pattern.datastructures.mesh.operations import mesh_substitute_vertices_in_faces
 
 from compas.datastructures import mesh_substitute_vertex_in_faces
 
@@ -10,8 +10,8 @@ from compas.datastructures import mesh_unweld_vertices
 from compas.topology import shortest_path
 
 from compas.topology import connected_components
-from compas.datastructures import network_disconnected_vertices
 from compas.topology import breadth_first_paths
+from compas_pattern.topology.components import union_find_components
 
 from compas.datastructures.mesh import mesh_smooth_centroid
 
@@ -167,13 +167,13 @@ def add_strip(mesh, polyedge):
 
     # update transverse strip data
     for skey, i in update.items():
-        mesh.data['attributes']['strips'][skey] = mesh.collect_strip(
-            *list(pairwise(left_polyedge))[i])
+        mesh.set_strip_edges(skey, mesh.collect_strip(
+            *list(pairwise(left_polyedge))[i]))
 
     # add new strip data
     new_skey = list(mesh.strips())[-1] + 1
-    mesh.data['attributes']['strips'][new_skey] = mesh.collect_strip(
-        left_polyedge[0], right_polyedge[0])
+    mesh.set_strip_edges(new_skey, mesh.collect_strip(
+        left_polyedge[0], right_polyedge[0]))
 
     # update adjacent strips
     for i in range(len(polyedge)):
@@ -232,6 +232,9 @@ def func_1(mesh, fix_xyz, kmax, damping):
     split_boundaries_geom = {i: [mesh.vertex_coordinates(vkey) for vkey in boundary] for i, boundary in enumerate(split_boundaries)}
 
     callback_args = mesh, fixed, split_boundaries, split_boundaries_geom
+    # the smoothing moves the free vertices in place
+    fixed_set = set(fixed)
+    mesh.journal_vertices([vkey for vkey in mesh.vertices() if vkey not in fixed_set])
     mesh_smooth_centroid(mesh, fixed, kmax=kmax, damping=damping, callback=callback, callback_args=callback_args)
 
 
@@ -296,28 +299,17 @@ def delete_strip(mesh, skey, preserve_boundaries=False):
     strip_faces = mesh.strip_faces(skey)
 
     # collateral strip deletions
-    collateral_deleted_strips = []
-    #print('strip_faces: ', strip_faces)
-    for skey_2 in mesh.strips():
-        if skey_2 == skey:
-            continue
-        #print('strip_faces_2: ', mesh.strip_faces(skey_2), [mesh.strip_faces(skey_2) in strip_faces])
-        if all([fkey in strip_faces for fkey in mesh.strip_faces(skey_2)]):
-            collateral_deleted_strips.append(skey_2)
-    #print('collateral_deleted_strips: ', collateral_deleted_strips)
-
-    # build network between vertices of the edges of the strip to delete to
-    # get the disconnect parts of vertices to merge
+    collateral_deleted_strips = collateral_strip_deletions(mesh, [skey])
+
+    # union-find between vertices of the edges of the strip to delete to get
+    # the disconnect parts of vertices to merge
     vertices = set([i for edge in strip_edges for i in edge])
     # maps between old and new indices
     old_to_new = {vkey: i for i, vkey in enumerate(vertices)}
     new_to_old = {i: vkey for i, vkey in enumerate(vertices)}
-    # network
-    vertex_coordinates = [mesh.vertex_coordinates(vkey) for vkey in vertices]
-    edges = [(old_to_new[u], old_to_new[v]) for u, v in strip_edges]
-    network = Network.from_vertices_and_edges(vertex_coordinates, edges)
     # disconnected parts
-    parts = network_disconnected_vertices(network)
+    edges = [(old_to_new[u], old_to_new[v]) for u, v in strip_edges]
+    parts = union_find_components(range(len(vertices)), edges)
 
     # delete strip faces
     for fkey in strip_faces:
@@ -326,11 +318,12 @@ def delete_strip(mesh, skey, preserve_boundaries=False):
         mesh.delete_face(fkey)
 
     old_vkeys_to_new_vkeys = {}
+    substituted_fkeys = []
 
     # merge strip edge vertices that are connected
     for part in parts:
 
-        # move back from network vertices to mesh vertices
+        # move back from union-find indices to mesh vertices
         vertices = [new_to_old[vkey] for vkey in part]
 
         # skip adding a vertex if all vertices of the part are disconnected
@@ -352,30 +345,37 @@ def delete_strip(mesh, skey, preserve_boundaries=False):
             x, y, z = centroid_points(points)
             new_vkey = mesh.add_vertex(attr_dict={'x': x, 'y': y, 'z': z})
             old_vkeys_to_new_vkeys.update({old_vkey: new_vkey for old_vkey in vertices})
-
-            # replace the old vertices
-            for old_vkey in vertices:
-                mesh.substitute_vertex_in_strips(old_vkey, new_vkey)
-                mesh_substitute_vertex_in_faces(
-                    mesh, old_vkey, new_vkey, mesh.vertex_faces(old_vkey))
-
-        # delete the old vertices
-        for old_vkey in vertices:
-            mesh.delete_vertex(old_vkey)
+            substituted_fkeys += [fkey for old_vkey in vertices for fkey in mesh.vertex_faces(old_vkey)]
+
+    # replace the old vertices in the strips and in the faces in one pass,
+    # each face being rebuilt once in the order of its last substitution
+    for skey_1 in set([skey_1 for vkey in old_vkeys_to_new_vkeys for skey_1 in mesh.vertex_strips(vkey)]):
+        edges = mesh.strip_edges(skey_1)
+        if any(vkey in old_vkeys_to_new_vkeys for edge in edges for vkey in edge):
+            mesh.set_strip_edges(skey_1, [tuple([old_vkeys_to_new_vkeys.get(vkey, vkey) for vkey in edge]) for edge in edges])
+    fkeys = []
+    visited = set()
+    for fkey in reversed(substituted_fkeys):
+        if fkey not in visited:
+            visited.add(fkey)
+            fkeys.append(fkey)
+    mesh_substitute_vertices_in_faces(mesh, old_vkeys_to_new_vkeys, list(reversed(fkeys)))
+
+    # delete the old vertices
+    for vkey in new_to_old.values():
+        mesh.delete_vertex(vkey)
 
     # delete data of deleted strip and collateral deleted strips
-    del mesh.data['attributes']['strips'][skey]
+    mesh.delete_strip_data(skey)
     for skey_2 in collateral_deleted_strips:
-        del mesh.data['attributes']['strips'][skey_2]
+        mesh.delete_strip_data(skey_2)
     #print(old_vkeys_to_new_vkeys)
     #print(mesh.data['attributes']['face_pole'])
-    if 'face_pole' in mesh.data['attributes']:
-        for fkey, pole in mesh.data['attributes']['face_pole'].items():
-            if fkey in mesh.data['attributes']['face_pole']:
-                #print(fkey, pole, mesh.data['attributes']['face_pole'])
-                if pole == mesh.data['attributes']['face_pole'][fkey]:
-                    if pole in old_vkeys_to_new_vkeys:
-                        mesh.data['attributes']['face_pole'][fkey] = old_vkeys_to_new_vkeys[pole]
+    if 'face_pole' in mesh.attributes:
+        # through the face pole operations to keep the pole index up to date
+        for fkey, pole in list(mesh.attributes['face_pole'].items()):
+            if pole in old_vkeys_to_new_vkeys:
+                mesh.set_face_pole(fkey, old_vkeys_to_new_vkeys[pole])
 
     return old_vkeys_to_new_vkeys
 
@@ -426,9 +426,11 @@ def strips_to_split_to_prevent_boundary_collapse(mesh, skeys):
 
     """
 
+    skeys = set(skeys)
     to_split = {}
     for boundary in mesh.boundaries():
-        non_deleted_strips = [mesh.edge_strip((u, v)) for u, v in pairwise(boundary + boundary[:1]) if mesh.edge_strip((u, v)) not in skeys]
+        boundary_strips = [mesh.edge_strip((u, v)) for u, v in pairwise(boundary + boundary[:1])]
+        non_deleted_strips = [skey_2 for skey_2 in boundary_strips if skey_2 not in skeys]
 
         if len(non_deleted_strips) == 0:
             return {}
@@ -570,8 +572,11 @@ def collateral_strip_deletions(mesh, skeys):
     """Return the strips that would be deleted from the deletion of other strips.
     """
 
-    deleted_fkeys = [fkey for skey in skeys for fkey in mesh.strip_faces(skey)]
-    return [skey for skey in mesh.strips() if skey not in skeys and all([fkey in deleted_fkeys for fkey in mesh.strip_faces(skey)])]
+    skeys = set(skeys)
+    deleted_fkeys = set([fkey for skey in skeys for fkey in mesh.strip_faces(skey)])
+    # only the strips crossing the deleted faces can be deleted
+    candidates = set([skey for fkey in deleted_fkeys for skey in mesh.face_strips(fkey) if skey not in skeys])
+    return [skey for skey in mesh.strips() if skey in candidates and all([fkey in deleted_fkeys for fkey in mesh.strip_faces(skey)])]
 
 
 def total_boundary_deletions(mesh, skeys):
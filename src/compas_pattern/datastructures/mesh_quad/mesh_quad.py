@@ -2,11 +2,13 @@ from math import floor
 from operator import itemgetter
 
 from compas_pattern.datastructures.mesh.mesh import Mesh
+from compas_pattern.datastructures.mesh_quad.strip_graph import StripGraph
 
 from compas.geometry import centroid_points
 
 from compas.utilities import pairwise
 from compas_pattern.utilities.lists import list_split
+from compas_pattern.utilities.versioned_dict import VersionedDict
 
 
 __all__ = ['QuadMesh']
@@ -14,23 +16,49 @@ __all__ = ['QuadMesh']
 
 class QuadMesh(Mesh):
 
+	# cache the topological classification of the vertices until the next topological modification
+	cache_vertex_classification = True
+
+	# the strip data are recorded in the journals by the strip data operations, but not the polyedge data
+	journaled_attributes = ('strips',)
+
+	# the strip and polyedge data count the assignments and deletions of their items, to check the validity of their indices
+	versioned_attributes = ('strips', 'polyedges')
+
 	def __init__(self):
 		super(QuadMesh, self).__init__()
-		self.data['attributes']['strips'] = {}
-		self.data['attributes']['polyedges'] = {}
+		self.data['attributes']['strips'] = VersionedDict()
+		self.data['attributes']['polyedges'] = VersionedDict()
+		self._strip_index = {}
+		self._strip_index_shared = set()
+		self._strip_vertex_index = {}
+		self._strip_index_strips = None
+		self._strip_index_version = None
+		self._strip_data_version = 0
+		self._strip_graph = None
+		self._strip_graph_version = None
+		self._strip_graph_strips = None
+		self._strip_graph_halfedge = None
+		self._polyedge_index = {}
+		self._polyedge_index_polyedges = None
+		self._polyedge_index_version = None
+		self._polyedge_data_version = 0
+		self._vertex_classification = {}
+		self._vertex_classification_version = None
+		self._vertex_classification_halfedge = None
 
 	def strips(self, data=False):
 
-		for skey in self.data['attributes']['strips']:
+		for skey in self.attributes['strips']:
 			if data:
-				yield skey, self.data['attributes']['strips'][skey]
+				yield skey, self.attributes['strips'][skey]
 			else:
 				yield skey
 
 	def polyedges(self, data=False):
-		for key in self.data['attributes']['polyedges']:
+		for key in self.attributes['polyedges']:
 			if data:
-				yield key, self.data['attributes']['polyedges'][key]
+				yield key, self.attributes['polyedges'][key]
 			else:
 				yield key
 
@@ -96,6 +124,59 @@ class QuadMesh(Mesh):
 	# singularities
 	# --------------------------------------------------------------------------
 
+	def vertex_classification(self, vkey):
+		"""Return the topological classification of a vertex.
+		The classification is cached until the next topological modification of the mesh, unless cache_vertex_classification is False.
+
+		Parameters
+		----------
+		vkey : int
+			The vertex key.
+
+		Returns
+		-------
+		tuple
+			Whether the vertex is on the boundary, its degree, whether it is a singularity and its index.
+
+		"""
+
+		if not self.cache_vertex_classification:
+			return self._classify_vertex(vkey)
+
+		if self._vertex_classification_version != self._topology_version or self._vertex_classification_halfedge is not self.halfedge:
+			self._vertex_classification = {}
+			self._vertex_classification_version = self._topology_version
+			self._vertex_classification_halfedge = self.halfedge
+
+		classification = self._vertex_classification.get(vkey)
+		if classification is None:
+			classification = self._vertex_classification[vkey] = self._classify_vertex(vkey)
+		return classification
+
+	def _classify_vertex(self, vkey):
+		is_on_boundary = super(QuadMesh, self).is_vertex_on_boundary(vkey)
+		degree = super(QuadMesh, self).vertex_degree(vkey)
+
+		is_singular = (is_on_boundary and degree != 3) or (not is_on_boundary and degree != 4)
+
+		if degree == 0:
+			index = 0
+		else:
+			regular_valency = 4 if not is_on_boundary else 3
+			index = (regular_valency - degree) / 4
+
+		return is_on_boundary, degree, is_singular, index
+
+	def is_vertex_on_boundary(self, vkey):
+		if not self.cache_vertex_classification:
+			return super(QuadMesh, self).is_vertex_on_boundary(vkey)
+		return self.vertex_classification(vkey)[0]
+
+	def vertex_degree(self, vkey):
+		if not self.cache_vertex_classification:
+			return super(QuadMesh, self).vertex_degree(vkey)
+		return self.vertex_classification(vkey)[1]
+
 	def is_vertex_singular(self, vkey):
 		"""Output whether a vertex is quad mesh singularity.
 
@@ -111,11 +192,7 @@ class QuadMesh(Mesh):
 
 		"""
 
-		if (self.is_vertex_on_boundary(vkey) and self.vertex_degree(vkey) != 3) or (not self.is_vertex_on_boundary(vkey) and self.vertex_degree(vkey) != 4):
-			return True
-
-		else:
-			return False
+		return self.vertex_classification(vkey)[2]
 
 	def singularities(self):
 		"""Returns all the singularity indices in the quad mesh.
@@ -143,12 +220,7 @@ class QuadMesh(Mesh):
 
 		"""
 
-		if self.vertex_degree(vkey) == 0:
-			return 0
-
-		regular_valency = 4 if not self.is_vertex_on_boundary(vkey) else 3
-
-		return (regular_valency - self.vertex_degree(vkey)) / 4
+		return self.vertex_classification(vkey)[3]
 
 	# --------------------------------------------------------------------------
 	# polyedges
@@ -172,7 +244,8 @@ class QuadMesh(Mesh):
 
 		polyedge = [u0, v0]
 
-		while len(polyedge) <= self.number_of_vertices():
+		n = len(self.vertex)
+		while len(polyedge) <= n:
 
 			# end if closed loop
 			if polyedge[0] == polyedge[-1]:
@@ -196,6 +269,7 @@ class QuadMesh(Mesh):
 
 	def collect_polyedges(self):
 		"""Collect the polyedges accross four-valent vertices between boundaries and/or singularities and store it in the mesh data attributes.
+		Each edge is visited once thanks to an edge-indexed visited array, so the collection is linear in the number of edges.
 
 		Parameters
 		----------
@@ -209,24 +283,82 @@ class QuadMesh(Mesh):
 
 		edges = list(self.edges())
 
-		nb_polyedges = -1
-		while len(edges) > 0:
-			nb_polyedges += 1
-			
+		edge_index = {}
+		for i, (u, v) in enumerate(edges):
+			edge_index[(u, v)] = i
+			edge_index[(v, u)] = i
+		visited = [False] * len(edges)
+
+		polyedges = {}
+		# start from the last edges, as if popping them from the list
+		for i in reversed(range(len(edges))):
+			if visited[i]:
+				continue
+
 			# collect new polyedge
-			u0, v0 = edges.pop()
+			u0, v0 = edges[i]
 			polyedge = self.collect_polyedge(u0, v0)
-			self.data['attributes']['polyedges'].update({nb_polyedges: polyedge})
+			polyedges[len(polyedges)] = polyedge
 
-			# remove collected edges
+			# mark collected edges
 			for u, v in pairwise(polyedge):
-				if (u, v) in edges:
-					edges.remove((u, v))
-				elif (v, u) in edges:
-					edges.remove((v, u))
+				visited[edge_index[(u, v)]] = True
+
+		self.attributes['polyedges'] = VersionedDict(polyedges)
 
 		return self.polyedges(data=True)
 
+	def polyedge_index(self):
+		"""Return the index of the vertices pointing to the polyedges passing through them.
+		The index is rebuilt after any assignment or deletion of polyedges, or replacement of the polyedge data.
+		Polyedges modified in place are not detected, call invalidate_polyedge_index after such modifications.
+
+		Returns
+		-------
+		dict
+			A copy of the dictionary of vertex keys pointing to the list of polyedge keys, in polyedge data order.
+		"""
+
+		return {vkey: list(keys) for vkey, keys in self._current_polyedge_index().items()}
+
+	def invalidate_polyedge_index(self):
+		"""Invalidate the polyedge index, for instance after modifying polyedges in place.
+		"""
+
+		self._polyedge_data_version += 1
+
+	def _current_polyedge_index(self):
+		# the polyedge index, rebuilt if the polyedge data are not versioned or have changed
+		polyedges = self.attributes['polyedges']
+		version = (self._polyedge_data_version, polyedges.version) if isinstance(polyedges, VersionedDict) else None
+		if version is None or self._polyedge_index_polyedges is not polyedges or self._polyedge_index_version != version:
+			index = {}
+			for key, polyedge in self.polyedges(data=True):
+				for vkey in polyedge:
+					keys = index.setdefault(vkey, [])
+					if len(keys) == 0 or keys[-1] != key:
+						keys.append(key)
+			self._polyedge_index = index
+			self._polyedge_index_polyedges = polyedges
+			self._polyedge_index_version = version
+		return self._polyedge_index
+
+	def vertex_polyedges(self, vkey):
+		"""Return the polyedges passing through a vertex.
+
+		Parameters
+		----------
+		vkey : hashable
+			A vertex key.
+
+		Returns
+		-------
+		list
+			The keys of the polyedges passing through the vertex.
+		"""
+
+		return list(self._current_polyedge_index().get(vkey, []))
+
 	def singularity_polyedges(self):
 		"""Collect the polyedges connected to singularities.
 
@@ -238,14 +370,39 @@ class QuadMesh(Mesh):
 		"""
 
 		# keep only polyedges connected to singularities or along the boundary		
-		polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if self.is_vertex_singular(polyedge[0]) or self.is_vertex_singular(polyedge[-1]) or self.is_edge_on_boundary(polyedge[0], polyedge[1])]									
+		keys = [key for key, polyedge in self.polyedges(data=True) if self.is_vertex_singular(polyedge[0]) or self.is_vertex_singular(polyedge[-1]) or self.is_edge_on_boundary(polyedge[0], polyedge[1])]
+		polyedges = [self.attributes['polyedges'][key] for key in keys]
 
 		# get intersections between polyedges for split
-		vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-		split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
+		split_vertices = self._polyedges_split_vertices(keys)
 		
 		# split singularity polyedges
-		return [split_polyedge for polyedge in polyedges for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+		return self._split_polyedges(polyedges, split_vertices)
+
+	def _polyedges_split_vertices(self, keys):
+		# vertices shared by several of the polyedges
+		keys = set(keys)
+		index = self._current_polyedge_index()
+		return set([vkey for vkey, vkey_keys in index.items() if len([key for key in vkey_keys if key in keys]) > 1])
+
+	def _split_polyedges(self, polyedges, split_vertices=None):
+		# split polyedges at the vertices shared by several of them, counted once per polyedge
+		if split_vertices is None:
+			count = {}
+			for polyedge in polyedges:
+				for vkey in set(polyedge):
+					count[vkey] = count.get(vkey, 0) + 1
+			split_vertices = set([vkey for vkey, n in count.items() if n > 1])
+
+		split_polyedges = []
+		for polyedge in polyedges:
+			# first position of the split vertices in the polyedge
+			position = {}
+			for i, vkey in enumerate(polyedge):
+				if vkey in split_vertices and vkey not in position:
+					position[vkey] = i
+			split_polyedges += list_split(polyedge, list(position.values()))
+		return split_polyedges
 
 	def singularity_polyedge_decomposition(self):
 		"""Returns a quad patch decomposition of the mesh based on the singularity polyedges, including boundaries and additionnal splits on the boundaries.
@@ -256,13 +413,13 @@ class QuadMesh(Mesh):
 			The polyedges forming the decomposition.
 
 		"""
-		if self.data['attributes']['polyedges'] == {}:
+		if self.attributes['polyedges'] == {}:
 			self.collect_polyedges()
 
 		polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if (self.is_vertex_singular(polyedge[0]) or self.is_vertex_singular(polyedge[-1])) and not self.is_edge_on_boundary(polyedge[0], polyedge[1])]									
 
 		# split boundaries
-		all_splits = [vkey for polyedge in polyedges for vkey in polyedge]
+		all_splits = set([vkey for polyedge in polyedges for vkey in polyedge])
 		for boundary in self.boundaries():
 			splits = [vkey for vkey in boundary if vkey in all_splits]
 			new_splits = []
@@ -284,18 +441,14 @@ class QuadMesh(Mesh):
 					if not self.is_edge_on_boundary(vkey, nbr):
 						new_polyedge = self.collect_polyedge(vkey, nbr)
 						polyedges.append(new_polyedge)
-						all_splits = list(set(all_splits + new_polyedge))
+						all_splits.update(new_polyedge)
 						break
 
 		# add boundaries
 		polyedges += [polyedge for key, polyedge in self.polyedges(data=True) if self.is_edge_on_boundary(polyedge[0], polyedge[1])]
 
-		# get intersections between polyedges for split
-		vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-		split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
-		
-		# split singularity polyedges
-		return [split_polyedge for polyedge in polyedges for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+		# split singularity polyedges at their intersections
+		return self._split_polyedges(polyedges)
 
 	# --------------------------------------------------------------------------
 	# polylines
@@ -313,14 +466,13 @@ class QuadMesh(Mesh):
 		"""
 
 		vertices = {key: centroid_points([self.vertex_coordinates(vkey) for vkey in polyedge]) for key, polyedge in self.polyedges(data=True)}
+		index = self._current_polyedge_index()
 		edges = []
 		for key, polyedge in self.polyedges(data=True):
 			for vkey in polyedge:
 				if not self.is_vertex_singular(vkey):
-					for key_2, polyedge_2 in self.polyedges(data=True):
-						if vkey in polyedge_2:
-							edges.append((key, key_2))
-							break
+					# first polyedge passing through the vertex
+					edges.append((key, index[vkey][0]))
 		return vertices, edges
 
 	# --------------------------------------------------------------------------
@@ -367,7 +519,7 @@ class QuadMesh(Mesh):
 
 	def number_of_strips(self):
 		"""Count the number of strips in the mesh."""
-		return len(list(self.strips()))
+		return len(self.attributes['strips'])
 
 	def collect_strip(self, u0, v0):
 		"""Returns all the edges in the strip of the input edge.
@@ -390,7 +542,8 @@ class QuadMesh(Mesh):
 			
 		edges = [(u0, v0)]
 
-		count = self.number_of_edges()
+		# a strip crosses each face at most twice
+		count = 2 * len(self.face) + 2
 		while count > 0:
 			count -= 1
 
@@ -413,6 +566,8 @@ class QuadMesh(Mesh):
 	def collect_strips(self):
 		"""Collect the strip data and store it in the mesh data attributes.
 
+		Each edge is visited once thanks to an edge-indexed visited array, so the collection is linear in the number of edges.
+
 		Returns
 		-------
 		strips : dict
@@ -421,18 +576,28 @@ class QuadMesh(Mesh):
 
 		edges = [(u, v) if self.halfedge[u][v] is not None else (v, u) for u, v in self.edges()]
 
-		nb_strip = -1
-		while len(edges) > 0:
-			nb_strip += 1
+		edge_index = {}
+		for i, (u, v) in enumerate(edges):
+			edge_index[(u, v)] = i
+			edge_index[(v, u)] = i
+		visited = [False] * len(edges)
 
-			u0, v0 = edges.pop()
+		strips = {}
+		# start from the last edges, as if popping them from the list
+		for i in reversed(range(len(edges))):
+			if visited[i]:
+				continue
+
+			u0, v0 = edges[i]
 			strip_edges = self.collect_strip(u0, v0)
-			self.data['attributes']['strips'].update({nb_strip: strip_edges})
+			strips[len(strips)] = strip_edges
+
 			for u, v in strip_edges:
-				if (u, v) in edges:
-					edges.remove((u, v))
-				elif (v, u) in edges:
-					edges.remove((v, u))
+				# skip collapsed edges at poles
+				if u != v:
+					visited[edge_index[(u, v)]] = True
+
+		self.attributes['strips'] = VersionedDict(strips)
 
 		return self.strips(data=True)
 
@@ -466,7 +631,7 @@ class QuadMesh(Mesh):
 
 		"""
 
-		return self.data['attributes']['strips'][skey]
+		return self.attributes['strips'][skey]
 
 	def edge_strip(self, edge):
 		"""Return the strip of an edge.
@@ -482,8 +647,13 @@ class QuadMesh(Mesh):
 			The strip of the edge.
 		"""
 
+		u, v = edge
+		if u != v:
+			return self.strip_index().get((u, v))
+
+		# collapsed edges at poles are shared by several strips and are not indexed
 		for skey, edges in self.strips(data=True):
-			if edge in edges or tuple(reversed(edge)) in edges:
+			if (u, v) in edges:
 				return skey
 
 	def strip_faces(self, skey):
@@ -518,10 +688,199 @@ class QuadMesh(Mesh):
 
 		return [self.edge_strip((u, v)) for u, v in list(self.face_halfedges(fkey))[:2]]
 
+	# --------------------------------------------------------------------------
+	# strip index
+	# --------------------------------------------------------------------------
+
+	def strip_index(self):
+		"""Return the index of the strip edges, in both directions, pointing to their strip.
+		The vertices of the strip edges are indexed as well, counting the distinct edges of each strip at each vertex.
+		The index is updated by the strip data operations and rebuilt after any other modification or replacement of the strip data.
+		Collapsed edges at poles are not indexed.
+
+		Returns
+		-------
+		dict
+			A dictionary of halfedges (u, v) pointing to strip keys.
+		"""
+
+		if not self.is_strip_index_valid():
+			self.build_strip_index()
+		return self._strip_index
+
+	def vertex_strips(self, vkey):
+		"""Return the strips with an edge at a vertex, using the strip index.
+		The vertex may have been deleted from the mesh as long as the strip data has not been updated yet.
+
+		Parameters
+		----------
+		vkey : hashable
+			A vertex key.
+
+		Returns
+		-------
+		list
+			The keys of the strips with an edge at the vertex.
+		"""
+
+		if not self.is_strip_index_valid():
+			self.build_strip_index()
+		return list(self._strip_vertex_index.get(vkey, {}))
+
+	def is_strip_index_valid(self):
+		"""Output whether the strip index is up to date with the strip data.
+		The index is valid if it was built from the current strip data and kept up to date by the strip data operations since the last assignment or deletion of strips.
+		Strip data replaced by a plain dictionary are not versioned, so that the index is never valid for them.
+		The edge lists of the strips modified in place are not detected, call invalidate_strip_index after such modifications.
+
+		Returns
+		-------
+		bool
+			True if the strip index is valid. False otherwise.
+		"""
+
+		version = self._strip_data_state()
+		return version is not None and self._strip_index_strips is self.attributes['strips'] and self._strip_index_version == version
+
+	def _strip_data_state(self):
+		# the version of the strip data and of their items, None if the strip data are not versioned
+		strips = self.attributes['strips']
+		if not isinstance(strips, VersionedDict):
+			return None
+		return self._strip_data_version, strips.version
+
+	def build_strip_index(self):
+		"""Build the index of the strip edges pointing to their strip.
+		An edge listed in several strips points to the first one.
+		"""
+
+		index = {}
+		shared = set()
+		vertex_index = {}
+		for skey, edges in self.strips(data=True):
+			for u, v in set(edges):
+				for vkey in (u, v):
+					vertex_strips = vertex_index.setdefault(vkey, {})
+					vertex_strips[skey] = vertex_strips.get(skey, 0) + 1
+				if u == v:
+					continue
+				if (u, v) in index:
+					if index[(u, v)] != skey:
+						shared.add((u, v))
+						shared.add((v, u))
+					continue
+				index[(u, v)] = skey
+				index[(v, u)] = skey
+
+		self._strip_index = index
+		self._strip_index_shared = shared
+		self._strip_vertex_index = vertex_index
+		self._strip_index_strips = self.attributes['strips']
+		self._strip_index_version = self._strip_data_state()
+
+	def invalidate_strip_index(self):
+		"""Invalidate the strip index and the strip graph, for instance after modifying the strip data in place without the strip data operations.
+		The strip data version is bumped, so that the data derived from the strips are updated as well.
+		"""
+
+		self._strip_index_strips = None
+		self._strip_data_version += 1
+		self._strip_graph = None
+
+	def _unindex_strip_edges(self, skey, edges):
+		index = self._strip_index
+		vertex_index = self._strip_vertex_index
+		for u, v in edges:
+			for vkey in (u, v):
+				vertex_strips = vertex_index[vkey]
+				vertex_strips[skey] -= 1
+				if vertex_strips[skey] == 0:
+					del vertex_strips[skey]
+					if len(vertex_strips) == 0:
+						del vertex_index[vkey]
+			if u == v:
+				continue
+			if (u, v) in self._strip_index_shared:
+				self.invalidate_strip_index()
+				return
+			if index.get((u, v)) == skey:
+				del index[(u, v)]
+				del index[(v, u)]
+
+	def _index_strip_edges(self, skey, edges):
+		index = self._strip_index
+		vertex_index = self._strip_vertex_index
+		for u, v in edges:
+			for vkey in (u, v):
+				vertex_strips = vertex_index.setdefault(vkey, {})
+				vertex_strips[skey] = vertex_strips.get(skey, 0) + 1
+			if u == v:
+				continue
+			other = index.get((u, v))
+			if other is None:
+				index[(u, v)] = skey
+				index[(v, u)] = skey
+			elif other != skey:
+				# the first strip in the strip data must prevail
+				self.invalidate_strip_index()
+				return
+
 	# --------------------------------------------------------------------------
 	# strip data operations
 	# --------------------------------------------------------------------------
 
+	def set_strip_edges(self, skey, edges):
+		"""Set the edges of a new or existing strip, updating the strip index.
+
+		Parameters
+		----------
+		skey : hashable
+			A strip key.
+		edges : list
+			The edges of the strip.
+
+		"""
+
+		if self._journal is not None:
+			self._journal_attribute_item('strips', skey)
+
+		strips = self.attributes['strips']
+		is_valid = self.is_strip_index_valid()
+
+		# only the edges that are removed or added are unindexed or indexed
+		new_edges = set(edges)
+		old_edges = set()
+		if is_valid and skey in strips:
+			old_edges = set(strips[skey])
+			self._unindex_strip_edges(skey, old_edges - new_edges)
+		strips[skey] = edges
+
+		if is_valid and self._strip_index_strips is not None:
+			self._strip_index_version = self._strip_data_state()
+			self._index_strip_edges(skey, new_edges - old_edges)
+
+	def delete_strip_data(self, skey):
+		"""Delete the data of a strip, updating the strip index.
+
+		Parameters
+		----------
+		skey : hashable
+			A strip key.
+
+		"""
+
+		if self._journal is not None:
+			self._journal_attribute_item('strips', skey, delete=True)
+
+		strips = self.attributes['strips']
+		is_valid = self.is_strip_index_valid()
+
+		edges = strips.pop(skey)
+
+		if is_valid:
+			self._strip_index_version = self._strip_data_state()
+			self._unindex_strip_edges(skey, set(edges))
+
 	def substitute_vertex_in_strips(self, old_vkey, new_vkey, strips = None):
 		"""Substitute a vertex by another one.
 
@@ -537,22 +896,49 @@ class QuadMesh(Mesh):
 		"""
 
 		if strips is None:
-			strips = list(self.strips())
-		self.data['attributes']['strips'].update({skey: [tuple([new_vkey if vkey == old_vkey else vkey for vkey in list(edge)]) for edge in self.strip_edges(skey)] for skey in strips})
+			strips = self.vertex_strips(old_vkey)
+		for skey in strips:
+			edges = self.strip_edges(skey)
+			if any(old_vkey in edge for edge in edges):
+				self.set_strip_edges(skey, [tuple([new_vkey if vkey == old_vkey else vkey for vkey in list(edge)]) for edge in edges])
 
 	def delete_face_in_strips(self, fkey):
 		"""Delete face in strips.
 
 		Parameters
 		----------
-		old_vkey : hashable
-			The old vertex key.
-		new_vkey : hashable
-			The new vertex key.
+		fkey : hashable
+			The face key.
 
 		"""
 
-		self.data['attributes']['strips'] = {skey: [(u, v) for u, v in self.strip_edges(skey) if self.halfedge[u][v] != fkey] for skey in self.strips()}
+		for skey in self._face_halfedge_strips(fkey):
+			edges = self.strip_edges(skey)
+			new_edges = [(u, v) for u, v in edges if self.halfedge[u][v] != fkey]
+			if len(new_edges) != len(edges):
+				self.set_strip_edges(skey, new_edges)
+
+	def _face_halfedge_strips(self, fkey):
+		# strips that may contain a halfedge of the face
+		index = self.strip_index()
+		skeys = set()
+		for u, v in self.face_halfedges(fkey):
+			if (u, v) in self._strip_index_shared:
+				return list(self.strips())
+			if (u, v) in index:
+				skeys.add(index[(u, v)])
+		return skeys
+
+	# --------------------------------------------------------------------------
+	# journal
+	# --------------------------------------------------------------------------
+
+	def apply_journal(self, journal):
+		inverse = super(QuadMesh, self).apply_journal(journal)
+		if self._apply_journal_attribute(journal, inverse, 'strips', self.set_strip_edges, self.delete_strip_data) and self._strip_index_shared:
+			# the first strip listing a shared edge may change with the order of the strips
+			self.invalidate_strip_index()
+		return inverse
 
 	# --------------------------------------------------------------------------
 	# strip graph
@@ -569,9 +955,27 @@ class QuadMesh(Mesh):
 		"""
 
 		vertices = {skey: centroid_points(self.strip_edge_midpoint_polyline(skey) if not self.is_strip_closed(skey) else self.strip_edge_midpoint_polyline(skey)[:-1]) for skey in self.strips()}
-		edges = [tuple(self.face_strips(fkey)) for fkey in self.faces()]
+		edges = list(self.strip_connectivity().edges)
 		return vertices, edges
 
+	def strip_connectivity(self):
+		"""Return the graph of the strip connectivity, as in strip_graph but without coordinates, with its adjacency in compressed sparse row format.
+		The graph is cached until the next topological modification or strip data operation.
+
+		Returns
+		-------
+		StripGraph
+			The strip graph.
+		"""
+
+		version = (self._topology_version, self._strip_data_state())
+		if self._strip_graph is None or version[1] is None or self._strip_graph_version != version or self._strip_graph_strips is not self.attributes['strips'] or self._strip_graph_halfedge is not self.halfedge:
+			self._strip_graph = StripGraph.from_quad_mesh(self)
+			self._strip_graph_version = version
+			self._strip_graph_strips = self.attributes['strips']
+			self._strip_graph_halfedge = self.halfedge
+		return self._strip_graph
+
 	# --------------------------------------------------------------------------
 	# strip polyedges
 	# --------------------------------------------------------------------------
@@ -0,0 +1,223 @@
+from compas.topology import adjacency_from_edges
+
+
+__all__ = ['StripGraph']
+
+
+class StripGraph(object):
+	"""The graph of the strips of a quad mesh, where each graph vertex is a mesh strip and each graph edge a mesh face representing the crossing of two strips.
+	The adjacency is stored in compressed sparse row format, with the number of faces between two strips as value.
+
+	Parameters
+	----------
+	skeys : list
+		The strip keys, in the order of the rows.
+	edges : list
+		The pairs of strip keys of the mesh faces.
+	closed : list
+		Whether each strip is closed.
+
+	Attributes
+	----------
+	indptr : list
+		The row pointers of the adjacency.
+	indices : list
+		The column indices of the adjacency, sorted per row.
+	multiplicities : list
+		The number of faces between the strips of the row and the column.
+	self_loops : list
+		Whether each strip crosses itself.
+
+	"""
+
+	def __init__(self, skeys, edges, closed):
+		self.skeys = list(skeys)
+		self.key_index = {skey: i for i, skey in enumerate(self.skeys)}
+		self.edges = list(edges)
+		self.closed = list(closed)
+		self._adjacency = None
+
+		# count the faces between each pair of strips, ignoring faces outside the strip data
+		rows = [{} for _ in self.skeys]
+		for u, v in self.edges:
+			i, j = self.key_index.get(u), self.key_index.get(v)
+			if i is None or j is None:
+				continue
+			rows[i][j] = rows[i].get(j, 0) + 1
+			if i != j:
+				rows[j][i] = rows[j].get(i, 0) + 1
+
+		self.indptr = [0]
+		self.indices = []
+		self.multiplicities = []
+		for row in rows:
+			for j in sorted(row):
+				self.indices.append(j)
+				self.multiplicities.append(row[j])
+			self.indptr.append(len(self.indices))
+		self.self_loops = [i in row for i, row in enumerate(rows)]
+
+	@classmethod
+	def from_quad_mesh(cls, mesh):
+		"""Build the strip graph of a quad mesh.
+
+		Parameters
+		----------
+		mesh : QuadMesh
+			A quad mesh with strip data.
+
+		Returns
+		-------
+		StripGraph
+			The strip graph.
+
+		"""
+
+		skeys = list(mesh.strips())
+		edges = [tuple(mesh.face_strips(fkey)) for fkey in mesh.faces()]
+		closed = [mesh.is_strip_closed(skey) for skey in skeys]
+		return cls(skeys, edges, closed)
+
+	def number_of_vertices(self):
+		return len(self.skeys)
+
+	def number_of_edges(self):
+		return len(self.edges)
+
+	def adjacency(self):
+		"""Return the adjacency of the strips, as from the list of edges, with repeated neighbours for multiple edges.
+		The dictionary is shared between calls and must not be modified.
+
+		Returns
+		-------
+		dict
+			A dictionary of strip keys pointing to the list of their neighbours.
+
+		"""
+
+		if self._adjacency is None:
+			self._adjacency = adjacency_from_edges(self.edges)
+		return self._adjacency
+
+	def reduced_adjacency(self, skeys):
+		"""Return the adjacency of the strips without some deleted strips, as from the list of edges between the other strips.
+		The strips left without neighbours are removed and the first strip is the first one of the first remaining edge, to colour the adjacency from the same strip.
+
+		Parameters
+		----------
+		skeys : list
+			The keys of the deleted strips.
+
+		Returns
+		-------
+		dict
+			A new dictionary of strip keys pointing to the list of their neighbours.
+
+		"""
+
+		deleted = set(skeys)
+		adjacency = {}
+		for u, v in self.edges:
+			if u not in deleted and v not in deleted:
+				adjacency[u] = None
+				break
+		for u, nbrs in self.adjacency().items():
+			if u in deleted:
+				continue
+			nbrs = [v for v in nbrs if v not in deleted]
+			if len(nbrs) > 0:
+				adjacency[u] = nbrs
+		return adjacency
+
+	def neighbors(self, skey):
+		"""Return the strips crossing a strip, including itself if it crosses itself.
+
+		Parameters
+		----------
+		skey : hashable
+			A strip key.
+
+		Returns
+		-------
+		list
+			The keys of the neighbouring strips.
+
+		"""
+
+		i = self.key_index[skey]
+		return [self.skeys[j] for j in self.indices[self.indptr[i]: self.indptr[i + 1]]]
+
+	def multiplicity(self, u, v):
+		"""Return the number of faces between two strips.
+
+		Parameters
+		----------
+		u : hashable
+			A strip key.
+		v : hashable
+			A strip key.
+
+		Returns
+		-------
+		int
+			The number of faces crossed by both strips.
+
+		"""
+
+		i, j = self.key_index[u], self.key_index[v]
+		for k in range(self.indptr[i], self.indptr[i + 1]):
+			if self.indices[k] == j:
+				return self.multiplicities[k]
+		return 0
+
+	def is_self_crossing(self, skey):
+		return self.self_loops[self.key_index[skey]]
+
+	def is_closed(self, skey):
+		return self.closed[self.key_index[skey]]
+
+	def arrays(self):
+		"""Return the adjacency and the strip flags as NumPy arrays.
+
+		Returns
+		-------
+		tuple
+			The arrays of row pointers, column indices, multiplicities, self-loop flags and closed-strip flags.
+
+		"""
+
+		import numpy as np
+
+		return (np.array(self.indptr, dtype=np.int64), np.array(self.indices, dtype=np.int64), np.array(self.multiplicities, dtype=np.int64),
+			np.array(self.self_loops, dtype=bool), np.array(self.closed, dtype=bool))
+
+	def adjacency_matrix(self):
+		"""Return the adjacency as a SciPy sparse matrix, with the multiplicities as values.
+
+		Returns
+		-------
+		scipy.sparse.csr_matrix
+			The (S, S) adjacency matrix, in the order of the strip keys.
+
+		"""
+
+		from scipy.sparse import csr_matrix
+
+		indptr, indices, multiplicities = self.arrays()[:3]
+		n = len(self.skeys)
+		return csr_matrix((multiplicities, indices, indptr), shape=(n, n))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	import compas
+	from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+
+	mesh = QuadMesh.from_obj(compas.get('faces.obj'))
+	mesh.collect_strips()
+	graph = mesh.strip_connectivity()
+	print(graph.adjacency_matrix().toarray())
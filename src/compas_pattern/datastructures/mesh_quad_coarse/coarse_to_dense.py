@@ -0,0 +1,224 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+
+__all__ = [
+	'CoarseToDense'
+]
+
+
+class CoarseToDense(object):
+	"""The child-parent element data between a coarse quad mesh and its dense quad mesh.
+	Each coarse vertex points to a dense vertex and each coarse edge to a polyedge of dense vertices.
+	The polyedges are stored once per edge, in one direction, in a flat array of dense vertices, with the offsets of each edge.
+
+	Attributes
+	----------
+	vertices : dict
+		The coarse vertices pointing to their dense vertex.
+
+	"""
+
+	def __init__(self):
+		self.vertices = {}
+		self._edge_index = {}
+		self._edges = []
+		self._starts = array('l')
+		self._stops = array('l')
+		self._polyedges = array('l')
+		# number of entries of the flat array left by replaced polyedges
+		self._garbage = 0
+
+	# --------------------------------------------------------------------------
+	# edges
+	# --------------------------------------------------------------------------
+
+	def _index(self, u, v):
+		# the index of an edge and whether it is stored in the other direction
+		i = self._edge_index.get((u, v))
+		if i is not None:
+			return i, False
+		return self._edge_index[(v, u)], True
+
+	def has_edge(self, u, v):
+		return (u, v) in self._edge_index or (v, u) in self._edge_index
+
+	def edges(self):
+		"""Iterate over the coarse edges, in the direction of their stored polyedge.
+		"""
+
+		return iter(self._edges)
+
+	def polyedge(self, u, v):
+		"""Return the polyedge of a coarse edge.
+
+		Parameters
+		----------
+		u : hashable
+			The start coarse vertex.
+		v : hashable
+			The end coarse vertex.
+
+		Returns
+		-------
+		list
+			The dense vertices from the child of u to the child of v.
+
+		"""
+
+		i, reverse = self._index(u, v)
+		polyedge = self._polyedges[self._starts[i]: self._stops[i]].tolist()
+		if reverse:
+			polyedge.reverse()
+		return polyedge
+
+	def polyedge_length(self, u, v):
+		"""Return the number of dense vertices of the polyedge of a coarse edge, without building it.
+		"""
+
+		i, reverse = self._index(u, v)
+		return self._stops[i] - self._starts[i]
+
+	def set_polyedge(self, u, v, polyedge):
+		"""Set the polyedge of a coarse edge, in place of the former one, if any.
+
+		Parameters
+		----------
+		u : hashable
+			The start coarse vertex.
+		v : hashable
+			The end coarse vertex.
+		polyedge : list
+			The dense vertices from the child of u to the child of v.
+
+		"""
+
+		if (v, u) in self._edge_index:
+			u, v = v, u
+			polyedge = list(reversed(polyedge))
+
+		i = self._edge_index.get((u, v))
+		if i is None:
+			self._edge_index[(u, v)] = len(self._edges)
+			self._edges.append((u, v))
+			self._starts.append(len(self._polyedges))
+			self._polyedges.extend(polyedge)
+			self._stops.append(len(self._polyedges))
+			return
+
+		start, stop = self._starts[i], self._stops[i]
+		if stop - start == len(polyedge):
+			self._polyedges[start: stop] = array('l', polyedge)
+			return
+
+		# a polyedge with another length is appended and the former one left until compaction
+		self._garbage += stop - start
+		self._starts[i] = len(self._polyedges)
+		self._polyedges.extend(polyedge)
+		self._stops[i] = len(self._polyedges)
+		if 2 * self._garbage > len(self._polyedges):
+			self.compact()
+
+	def compact(self):
+		"""Rebuild the flat array of dense vertices without the entries of replaced polyedges.
+		"""
+
+		polyedges = array('l')
+		for i in range(len(self._edges)):
+			start = len(polyedges)
+			polyedges.extend(self._polyedges[self._starts[i]: self._stops[i]])
+			self._starts[i] = start
+			self._stops[i] = len(polyedges)
+		self._polyedges = polyedges
+		self._garbage = 0
+
+	# --------------------------------------------------------------------------
+	# serialisation
+	# --------------------------------------------------------------------------
+
+	def to_data(self):
+		"""Return the data in the compact format, with flat lists.
+
+		Returns
+		-------
+		dict
+			The coarse vertices and their dense vertices, the coarse edges as pairs of vertices, the offsets of their polyedges and the flat list of polyedges.
+
+		"""
+
+		offsets = [0]
+		polyedges = []
+		for i in range(len(self._edges)):
+			polyedges += self._polyedges[self._starts[i]: self._stops[i]].tolist()
+			offsets.append(len(polyedges))
+		return {
+			'vertices': [[vkey, dense_vkey] for vkey, dense_vkey in self.vertices.items()],
+			'edges': [[u, v] for u, v in self._edges],
+			'offsets': offsets,
+			'polyedges': polyedges
+		}
+
+	@classmethod
+	def from_data(cls, data):
+		"""Build the child-parent element data from the compact format.
+
+		Parameters
+		----------
+		data : dict
+			The data, as from to_data.
+
+		Returns
+		-------
+		CoarseToDense
+			The child-parent element data.
+
+		"""
+
+		coarse_to_dense = cls()
+		coarse_to_dense.vertices = {vkey: dense_vkey for vkey, dense_vkey in data['vertices']}
+		coarse_to_dense._edges = [(u, v) for u, v in data['edges']]
+		coarse_to_dense._edge_index = {edge: i for i, edge in enumerate(coarse_to_dense._edges)}
+		coarse_to_dense._starts = array('l', data['offsets'][:-1])
+		coarse_to_dense._stops = array('l', data['offsets'][1:])
+		coarse_to_dense._polyedges = array('l', data['polyedges'])
+		return coarse_to_dense
+
+	@classmethod
+	def from_dicts(cls, vertex_coarse_to_dense, edge_coarse_to_dense):
+		"""Build the child-parent element data from the former dictionaries of dense vertices and polyedges.
+
+		Parameters
+		----------
+		vertex_coarse_to_dense : dict
+			The coarse vertices pointing to their dense vertex.
+		edge_coarse_to_dense : dict
+			The coarse vertices pointing to their neighbours pointing to the polyedge of the edge.
+
+		Returns
+		-------
+		CoarseToDense
+			The child-parent element data.
+
+		"""
+
+		coarse_to_dense = cls()
+		coarse_to_dense.vertices = dict(vertex_coarse_to_dense)
+		for u in edge_coarse_to_dense:
+			for v, polyedge in edge_coarse_to_dense[u].items():
+				if not coarse_to_dense.has_edge(u, v):
+					coarse_to_dense.set_polyedge(u, v, polyedge)
+		return coarse_to_dense
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	coarse_to_dense = CoarseToDense()
+	coarse_to_dense.vertices = {0: 0, 1: 1}
+	coarse_to_dense.set_polyedge(0, 1, [0, 2, 3, 1])
+	print(coarse_to_dense.polyedge(1, 0), coarse_to_dense.to_data())
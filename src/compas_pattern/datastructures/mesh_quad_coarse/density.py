@@ -0,0 +1,117 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from heapq import heappush
+from heapq import heappop
+
+from compas.geometry import distance_point_point
+from compas.geometry import midpoint_point_point
+
+__all__ = [
+	'greedy_strips_density'
+]
+
+
+def greedy_strips_density(coarse_quad_mesh, target=None, nb_faces=None, min_density=1):
+	"""Compute integer strip densities close to a target edge length field, within a budget of dense faces.
+	The deviation of a strip is the sum of the squared differences between the dense edge lengths l / d and the target lengths along the coarse edges of the strip.
+	Starting from the minimum density, the strip with the largest reduction of the total deviation per additional dense face is densified, one step at a time, as long as the deviation decreases and the budget is not exceeded.
+	Without target, the longest dense edges are refined until the budget is reached.
+	The number of dense faces of a coarse face is the product of the densities of its two strips.
+
+	Parameters
+	----------
+	coarse_quad_mesh : CoarseQuadMesh
+		A coarse quad mesh with strip data.
+	target : float, callable, optional
+		A target edge length, or a function returning the target edge length at a point, evaluated at the midpoints of the coarse edges.
+		Default is None, without target length.
+	nb_faces : int, optional
+		The maximum number of dense faces. Default is None, without budget.
+	min_density : int, optional
+		The minimum density of the strips. Default is 1.
+
+	Returns
+	-------
+	dict
+		The density of each strip.
+
+	Raises
+	------
+	ValueError
+		If neither a positive target nor a budget are given, as the densities would increase indefinitely.
+
+	"""
+
+	graph = coarse_quad_mesh.strip_connectivity()
+	skeys = graph.skeys
+
+	# coefficients of the deviation a / d ** 2 - 2 * b / d of each strip, up to a constant
+	a = [0.0] * len(skeys)
+	b = [0.0] * len(skeys)
+	xyz = {vkey: coarse_quad_mesh.vertex_coordinates(vkey) for vkey in coarse_quad_mesh.vertices()}
+	for i, skey in enumerate(skeys):
+		for u, v in coarse_quad_mesh.strip_edges(skey):
+			if u == v:
+				continue
+			length = distance_point_point(xyz[u], xyz[v])
+			a[i] += length ** 2
+			if target is not None:
+				b[i] += length * (target(midpoint_point_point(xyz[u], xyz[v])) if callable(target) else target)
+
+	if nb_faces is None and not any([x > 0 for x in b]):
+		raise ValueError('A positive target edge length or a number of faces is required.')
+
+	densities = [min_density] * len(skeys)
+	faces = len([1 for u, v in graph.edges if u in graph.key_index and v in graph.key_index]) * min_density ** 2
+
+	def gain(i):
+		# reduction of the deviation and additional faces from densifying strip i by one
+		d = densities[i]
+		reduction = a[i] / d ** 2 - 2 * b[i] / d - a[i] / (d + 1) ** 2 + 2 * b[i] / (d + 1)
+		added = 0
+		for k in range(graph.indptr[i], graph.indptr[i + 1]):
+			j = graph.indices[k]
+			added += graph.multiplicities[k] * (2 * d + 1 if j == i else densities[j])
+		return reduction, added
+
+	# the added faces only increase with the densities of the neighbours, so the priorities are upper bounds, updated when popped
+	heap = []
+	for i in range(len(skeys)):
+		reduction, added = gain(i)
+		if reduction > 0:
+			heappush(heap, (- reduction / max(added, 1), i))
+
+	while heap:
+		priority, i = heappop(heap)
+		reduction, added = gain(i)
+		if reduction <= 0 or (nb_faces is not None and faces + added > nb_faces):
+			continue
+		if - reduction / max(added, 1) > priority:
+			heappush(heap, (- reduction / max(added, 1), i))
+			continue
+		densities[i] += 1
+		faces += added
+		reduction, added = gain(i)
+		if reduction > 0:
+			heappush(heap, (- reduction / max(added, 1), i))
+
+	return {skey: densities[i] for i, skey in enumerate(skeys)}
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+	vertices = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0], [0.0, 3.0, 0.0], [1.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+	faces = [[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+	coarse_quad_mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+	coarse_quad_mesh.collect_strips()
+
+	print(greedy_strips_density(coarse_quad_mesh, target=0.2))
+	print(greedy_strips_density(coarse_quad_mesh, nb_faces=500))
@@ -1,14 +1,13 @@
+import json
+
 from math import floor
 from math import ceil
 
 from compas_pattern.datastructures.network.network import Network
-from compas_pattern.datastructures.mesh.mesh import Mesh
 from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
-
-from compas.datastructures.mesh import meshes_join_and_weld
-
-from compas.topology import adjacency_from_edges
-from compas.topology import connected_components
+from compas_pattern.datastructures.mesh_quad_coarse.density import greedy_strips_density
+from compas_pattern.datastructures.mesh_quad_coarse.coarse_to_dense import CoarseToDense
+from compas_pattern.utilities.copy_on_write import CopyOnWrite
 
 from compas.geometry import Polyline
 
@@ -18,20 +17,37 @@ from compas.utilities import pairwise
 from compas.utilities import reverse_geometric_key
 from compas.utilities import average
 
-__all__ = ['CoarseQuadMesh']
+try:
+	from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+	# before Python 3.8 and in IronPython the patches are densified in the current process
+	SharedMemory = None
+
+__all__ = [
+	'CoarseQuadMesh',
+	'patch_grid',
+	'patch_faces',
+	'densify_patch',
+	'densify_patches',
+	'densify_patches_in_parallel',
+	'remove_collapsed_edges'
+]
 
 
 class CoarseQuadMesh(QuadMesh):
 
+	# the type of the dense quad mesh of the densification
+	dense_quad_mesh_type = QuadMesh
+
 	def __init__(self):
 		super(CoarseQuadMesh, self).__init__()
-		self.data['attributes']['strips_density'] = {}
+		self._densification = None
+		self.attributes['strips_density'] = {}
 
-		self.data['attributes']['vertex_coarse_to_dense'] = {}
-		self.data['attributes']['edge_coarse_to_dense'] = {}
+		self.attributes['coarse_to_dense'] = CoarseToDense()
 
-		self.data['attributes']['quad_mesh'] = None
-		self.data['attributes']['polygonal_mesh'] = None
+		self.attributes['quad_mesh'] = None
+		self.attributes['polygonal_mesh'] = None
 
 	# --------------------------------------------------------------------------
 	# constructors
@@ -40,11 +56,14 @@ class CoarseQuadMesh(QuadMesh):
 	@classmethod
 	def from_quad_mesh(cls, quad_mesh, collect_strips=True, collect_polyedges=True, attribute_density=True):
 		"""Build coarse quad mesh from quad mesh with density and child-parent element data.
+		The coarse quad mesh takes ownership of the quad mesh, which is stored as its dense quad mesh and shared as its polygonal mesh, without copy.
+		Modifications made through get_quad_mesh or get_polygonal_mesh copy it first, but direct modifications of the quad mesh show in both.
+		To keep modifying the quad mesh independently, pass a copy of it.
 
 		Parameters
 		----------
 		quad_mesh : QuadMesh
-			A quad mesh.
+			A quad mesh, owned by the coarse quad mesh afterwards.
 		attribute_density : bool, optional
 			Keep density data of dense quad mesh and inherit it as aatribute.
 
@@ -57,30 +76,56 @@ class CoarseQuadMesh(QuadMesh):
 		polyedges = quad_mesh.singularity_polyedge_decomposition()
 
 		# vertex data
-		vertices = {vkey: quad_mesh.vertex_coordinates(vkey) for vkey in quad_mesh.vertices()}
 		coarse_vertices_children = {vkey: vkey for polyedge in polyedges for vkey in [polyedge[0], polyedge[-1]]}
 		coarse_vertices = {vkey: quad_mesh.vertex_coordinates(vkey) for vkey in coarse_vertices_children}
 
 		# edge data
 		coarse_edges_children = {(polyedge[0], polyedge[-1]): polyedge for polyedge in polyedges}
-		singularity_edges = [(x, y) for polyedge in polyedges for u, v in pairwise(polyedge) for x, y in [(u, v), (v, u)]]
+		singularity_halfedges = set([(x, y) for polyedge in polyedges for u, v in pairwise(polyedge) for x, y in [(u, v), (v, u)]])
+
+		# face data: patches of faces connected across non-singular edges, including single faces
+		patch_index = {}
+		patches = []
+		for fkey in quad_mesh.faces():
+			if fkey in patch_index:
+				continue
+			patch_index[fkey] = len(patches)
+			patch = [fkey]
+			for face in patch:
+				for u, v in quad_mesh.face_halfedges(face):
+					nbr = quad_mesh.halfedge[v][u]
+					if nbr is not None and nbr not in patch_index and (u, v) not in singularity_halfedges:
+						patch_index[nbr] = len(patches)
+						patch.append(nbr)
+			patches.append(patch)
 
-		# face data
-		faces = {fkey: quad_mesh.face_vertices(fkey) for fkey in quad_mesh.faces()}
-		adj_edges = {(f1, f2) for f1 in quad_mesh.faces() for f2 in quad_mesh.face_neighbors(f1) if f1 < f2 and quad_mesh.face_adjacency_halfedge(f1, f2) not in singularity_edges}
 		coarse_faces_children = {}
-		for i, connected_faces in enumerate(connected_components(adjacency_from_edges(adj_edges))):
-			mesh = Mesh.from_vertices_and_faces(vertices, [faces[face] for face in connected_faces])
-			coarse_faces_children[i] = [vkey for vkey in reversed(mesh.boundaries()[0]) if mesh.vertex_degree(vkey) == 2]
+		for i, patch in enumerate(patches):
+			# halfedges of the patch boundary, in the orientation of the faces
+			boundary = {}
+			for fkey in patch:
+				for u, v in quad_mesh.face_halfedges(fkey):
+					if patch_index.get(quad_mesh.halfedge[v][u]) != i:
+						boundary[u] = v
+			# walk along the boundary and keep the corners, where the two boundary halfedges are in the same face
+			corners = []
+			start = u = next(iter(boundary))
+			for _ in range(len(boundary)):
+				v = boundary[u]
+				if quad_mesh.halfedge[u][v] == quad_mesh.halfedge[v][boundary[v]]:
+					corners.append(v)
+				u = v
+				if u == start:
+					break
+			coarse_faces_children[i] = corners
 
 		coarse_quad_mesh = cls.from_vertices_and_faces(coarse_vertices, coarse_faces_children)
 
 		# attribute relation child-parent element between coarse and dense quad meshes
-		coarse_quad_mesh.data['attributes']['vertex_coarse_to_dense'] = coarse_vertices_children
-		coarse_quad_mesh.data['attributes']['edge_coarse_to_dense'] = {u: {} for u in coarse_quad_mesh.vertices()}
+		coarse_to_dense = coarse_quad_mesh.attributes['coarse_to_dense']
+		coarse_to_dense.vertices = coarse_vertices_children
 		for (u, v), polyedge in coarse_edges_children.items():
-			coarse_quad_mesh.data['attributes']['edge_coarse_to_dense'][u][v] = polyedge
-			coarse_quad_mesh.data['attributes']['edge_coarse_to_dense'][v][u] = list(reversed(polyedge))
+			coarse_to_dense.set_polyedge(u, v, polyedge)
 
 		# collect strip and polyedge attributes
 		if collect_strips:
@@ -96,35 +141,114 @@ class CoarseQuadMesh(QuadMesh):
 				d = len(coarse_edges_children.get((u, v), coarse_edges_children.get((v, u), [])))
 				coarse_quad_mesh.set_strip_density(skey, d)
 
-		# store quad mesh and use as polygonal mesh
+		# store quad mesh and share it as polygonal mesh until one of them is modified
 		coarse_quad_mesh.set_quad_mesh(quad_mesh)
-		coarse_quad_mesh.set_polygonal_mesh(quad_mesh.copy())
+		coarse_quad_mesh.attributes['polygonal_mesh'] = coarse_quad_mesh.attributes['quad_mesh'].share()
 		
 		return coarse_quad_mesh
 
+	# --------------------------------------------------------------------------
+	# serialisation
+	# --------------------------------------------------------------------------
+
+	# the child-parent element data are stored compactly and serialised as flat lists by to_data
+
+	@property
+	def data(self):
+		return super(CoarseQuadMesh, self).data
+
+	@data.setter
+	def data(self, data):
+		QuadMesh.data.fset(self, data)
+		coarse_to_dense = self.attributes.get('coarse_to_dense')
+		if isinstance(coarse_to_dense, dict):
+			self.attributes['coarse_to_dense'] = CoarseToDense.from_data(coarse_to_dense)
+		# former data with a dictionary per child-parent element type
+		if 'edge_coarse_to_dense' in self.attributes:
+			vertex_coarse_to_dense = self.attributes.pop('vertex_coarse_to_dense', {})
+			edge_coarse_to_dense = self.attributes.pop('edge_coarse_to_dense')
+			self.attributes['coarse_to_dense'] = CoarseToDense.from_dicts(vertex_coarse_to_dense, edge_coarse_to_dense)
+
+	def to_data(self):
+		"""Return the data of the coarse quad mesh, with the child-parent element data as flat lists.
+		"""
+
+		data = self.data
+		data['attributes'] = dict(data['attributes'])
+		data['attributes']['coarse_to_dense'] = self.attributes['coarse_to_dense'].to_data()
+		return data
+
+	def to_json(self, filepath, pretty=False):
+		with open(filepath, 'w+') as f:
+			if pretty:
+				json.dump(self.to_data(), f, sort_keys=True, indent=4)
+			else:
+				json.dump(self.to_data(), f)
+
 	# --------------------------------------------------------------------------
 	# meshes getters and setters
 	# --------------------------------------------------------------------------
 
+	# the dense and polygonal meshes are stored as copy-on-write references, shared by the copies of the coarse quad mesh until modified
+
 	def get_quad_mesh(self):
-		return self.data['attributes']['quad_mesh']
+		"""Return the dense quad mesh, for modification.
+		If it is shared, for instance with the polygonal mesh or a copy of the coarse quad mesh, it is copied first.
+		"""
+
+		return self._get_mesh('quad_mesh')
+
+	def peek_quad_mesh(self):
+		"""Return the dense quad mesh, for reading only, without copying it if it is shared.
+		"""
+
+		return self._peek_mesh('quad_mesh')
 
 	def set_quad_mesh(self, quad_mesh):
-		self.data['attributes']['quad_mesh'] = quad_mesh
+		self._set_mesh('quad_mesh', quad_mesh)
 
 	def get_polygonal_mesh(self):
-		return self.data['attributes']['polygonal_mesh']
+		"""Return the polygonal mesh, for modification.
+		If it is shared, for instance with the quad mesh or a copy of the coarse quad mesh, it is copied first.
+		"""
+
+		return self._get_mesh('polygonal_mesh')
+
+	def peek_polygonal_mesh(self):
+		"""Return the polygonal mesh, for reading only, without copying it if it is shared.
+		"""
+
+		return self._peek_mesh('polygonal_mesh')
 
 	def set_polygonal_mesh(self, polygonal_mesh):
-		self.data['attributes']['polygonal_mesh'] = polygonal_mesh
+		self._set_mesh('polygonal_mesh', polygonal_mesh)
+
+	def _get_mesh(self, name):
+		reference = self.attributes[name]
+		if reference is None:
+			return None
+		return reference.get()
+
+	def _peek_mesh(self, name):
+		reference = self.attributes[name]
+		if reference is None:
+			return None
+		return reference.peek()
+
+	def _set_mesh(self, name, mesh):
+		self.attributes[name] = CopyOnWrite(mesh) if mesh is not None else None
 
 	# --------------------------------------------------------------------------
 	# element child-parent relation getters
 	# --------------------------------------------------------------------------
 
+	def coarse_vertex_dense_vertex(self, vkey):
+		"""Return the child vertex in the dense quad mesh from a parent vertex in the coarse quad mesh."""
+		return self.attributes['coarse_to_dense'].vertices[vkey]
+
 	def coarse_edge_dense_edges(self, u, v):
 		"""Return the child edges, or polyedge, in the dense quad mesh from a parent edge in the coarse quad mesh."""
-		return self.data['attributes']['edge_coarse_to_dense'][u][v]
+		return self.attributes['coarse_to_dense'].polyedge(u, v)
 
 	# --------------------------------------------------------------------------
 	# density getters and setters
@@ -144,7 +268,7 @@ class CoarseQuadMesh(QuadMesh):
 			The strip density.
 		"""
 
-		return self.data['attributes']['strips_density'][skey]
+		return self.attributes['strips_density'][skey]
 
 	def get_strip_densities(self):
 		"""Get the density of a strip.
@@ -155,7 +279,7 @@ class CoarseQuadMesh(QuadMesh):
 			The dictionary of the strip densities.
 		"""
 
-		return self.data['attributes']['strips_density']
+		return self.attributes['strips_density']
 
 	# --------------------------------------------------------------------------
 	# density setters
@@ -172,7 +296,7 @@ class CoarseQuadMesh(QuadMesh):
 			A density parameter.
 		"""
 
-		self.data['attributes']['strips_density'][skey] = d
+		self.attributes['strips_density'][skey] = d
 
 	def set_strips_density(self, d, skeys=None):
 		"""Set the same density to all strips.
@@ -260,26 +384,282 @@ class CoarseQuadMesh(QuadMesh):
 			n = int(ceil(n))
 		self.set_strips_density(n)
 
+	def set_strips_density_greedy(self, target=None, nb_faces=None, min_density=1):
+		"""Set the strip densities closest to a target edge length field within a budget of faces, with a greedy solver.
+		See greedy_strips_density.
+
+		Parameters
+		----------
+		target : float, callable, optional
+			A target edge length, or a function returning the target edge length at a point. Default is None, without target length.
+		nb_faces : int, optional
+			The maximum number of dense faces. Default is None, without budget.
+		min_density : int, optional
+			The minimum density of the strips. Default is 1.
+		"""
+
+		for skey, d in greedy_strips_density(self, target, nb_faces, min_density).items():
+			self.set_strip_density(skey, d)
+
 	# --------------------------------------------------------------------------
 	# densification
 	# --------------------------------------------------------------------------
 
-	def densification(self):
+	def densification(self, workers=None):
 		"""Generate a denser quad mesh from the coarse quad mesh and its strip densities.
+		The patches of the faces share the dense vertices of their coarse vertices and edges, which are also stored as child-parent element data.
+
+		If only some strip densities have changed since the last densification, the patches of the coarse faces along the edges of these strips are generated again and spliced in the dense quad mesh, which is modified in place.
+		The other patches, and any geometrical modification of their dense vertices, are kept.
+		Otherwise, for instance after a topological modification of the coarse or the dense quad mesh or a modification of the coarse vertex coordinates, or if the dense quad mesh is shared with a copy, a new dense quad mesh is generated.
+
+		Parameters
+		----------
+		workers : int, optional
+			A number of processes to generate the face patches in parallel. Default is None, in the current process.
+			The result does not depend on the number of processes.
+
+		"""
+
+		skeys = self.densification_changed_strips()
+		if skeys is None:
+			vertices, patches = self.densification_patches()
+			vertices, faces = densify_patches(vertices, patches, workers)
+			self.set_quad_mesh(self.dense_quad_mesh_type.from_vertices_and_faces(vertices, faces))
+			self.record_densification(patches)
+			self.update_dense_face_data([], self._densification['face_dense_faces'])
+		elif len(skeys) > 0:
+			self.update_densification(skeys)
+
+	def dense_vertices_and_faces(self, workers=None):
+		"""Generate the vertices and faces of the denser quad mesh from the coarse quad mesh and its strip densities.
+		The child-parent element data are updated.
+
+		Parameters
+		----------
+		workers : int, optional
+			A number of processes to generate the face patches in parallel. Default is None, in the current process.
+
+		Returns
+		-------
+		tuple
+			The list of dense vertex coordinates and the list of dense faces as lists of vertex indices.
+
+		"""
+
+		vertices, patches = self.densification_patches()
+		return densify_patches(vertices, patches, workers)
+
+	def densification_patches(self):
+		"""Allocate the dense vertices of the face patches of the densification.
+		Each coarse vertex and each subdivided coarse edge is allocated once and shared by the patches.
+		The child-parent element data are updated.
+
+		Returns
+		-------
+		vertices : list
+			The coordinates of the dense vertices on the coarse vertices and edges.
+		patches : list
+			Per face, the patch numbers of points n and m, the lists of dense vertices on the sides ab, bc, dc and ad, and the first dense vertex of the patch interior.
+
 		"""
 
-		edge_strip = {}
-		for skey, edges in self.strips(data=True):
-		    for edge in edges:
-		        edge_strip[edge] = skey
-		        edge_strip[tuple(reversed(edge))] = skey
+		vertices = []
+
+		coarse_to_dense = CoarseToDense()
+		self.attributes['coarse_to_dense'] = coarse_to_dense
+		for vkey in self.vertices():
+			coarse_to_dense.vertices[vkey] = len(vertices)
+			vertices.append(self.vertex_coordinates(vkey))
+
+		for u, v in self.edges():
+			points = self.densification_edge_points(u, v)
+			polyedge = [coarse_to_dense.vertices[u]] + list(range(len(vertices), len(vertices) + len(points))) + [coarse_to_dense.vertices[v]]
+			vertices += points
+			coarse_to_dense.set_polyedge(u, v, polyedge)
 
-		meshes = []
+		patches = []
+		start = len(vertices)
 		for fkey in self.faces():
-			ab, bc, cd, da = [[self.edge_point(u, v, float(i) / float(self.get_strip_density(edge_strip[(u, v)]))) for i in range(0, self.get_strip_density(edge_strip[(u, v)]) + 1)] for u, v in self.face_halfedges(fkey)]
-			vertices, faces = discrete_coons_patch(ab, bc, list(reversed(cd)), list(reversed(da)))
-			meshes.append(QuadMesh.from_vertices_and_faces(vertices, faces))
-		self.set_quad_mesh(meshes_join_and_weld(meshes))
+			n, m, sides = self.densification_face_patch(fkey)
+			patches.append((n, m, sides, start))
+			start += (n - 2) * (m - 2)
+
+		return vertices, patches
+
+	def densification_edge_points(self, u, v):
+		"""Return the points subdividing an edge in the densification, depending on the density of its strip.
+		"""
+
+		d = self.get_strip_density(self.edge_strip((u, v)))
+		return [self.edge_point(u, v, float(i) / float(d)) for i in range(1, d)]
+
+	def densification_face_patch(self, fkey):
+		"""Return the patch numbers of points n and m and the lists of dense vertices on the sides ab, bc, dc and ad of a face in the densification.
+		"""
+
+		coarse_to_dense = self.attributes['coarse_to_dense']
+		a, b, c, d = self.densification_face_vertices(fkey)
+		n = coarse_to_dense.polyedge_length(a, b) if a != b else coarse_to_dense.polyedge_length(d, c)
+		m = coarse_to_dense.polyedge_length(b, c) if b != c else coarse_to_dense.polyedge_length(a, d)
+		# collapsed sides at poles repeat the pole
+		sides = [coarse_to_dense.polyedge(u, v) if u != v else [coarse_to_dense.vertices[u]] * k for (u, v), k in zip([(a, b), (b, c), (d, c), (a, d)], [n, m, n, m])]
+		return n, m, sides
+
+	def densification_face_vertices(self, fkey):
+		"""Return the four vertices of the patch of a face in the densification.
+		"""
+
+		return self.face_vertices(fkey)
+
+	def update_dense_face_data(self, old_fkeys, face_dense_faces):
+		"""Update the face data of the dense quad mesh after the densification of some patches.
+		The base densification does not have any face data.
+
+		Parameters
+		----------
+		old_fkeys : list
+			The keys of the deleted dense faces.
+		face_dense_faces : dict
+			The coarse faces with a new patch pointing to the keys of their dense faces.
+
+		"""
+
+		pass
+
+	# --------------------------------------------------------------------------
+	# incremental densification
+	# --------------------------------------------------------------------------
+
+	def record_densification(self, patches):
+		"""Record the state of the coarse quad mesh and the dense elements of each coarse face after a densification, to update it incrementally.
+
+		Parameters
+		----------
+		patches : list
+			The patches of the densification, as from densification_patches, with the dense faces numbered in the order of the patches.
+
+		"""
+
+		face_dense_vertices = {}
+		face_dense_faces = {}
+		start = 0
+		for fkey, (n, m, sides, vkey) in zip(self.faces(), patches):
+			face_dense_vertices[fkey] = list(range(vkey, vkey + (n - 2) * (m - 2)))
+			face_dense_faces[fkey] = list(range(start, start + (n - 1) * (m - 1)))
+			start += (n - 1) * (m - 1)
+
+		quad_mesh = self.get_quad_mesh()
+		self._densification = {
+			'quad_mesh': quad_mesh,
+			'quad_mesh_version': quad_mesh.topology_version,
+			'version': (self._topology_version, self._strip_data_state()),
+			'halfedge': self.halfedge,
+			'strips': self.attributes['strips'],
+			'coarse_to_dense': self.attributes['coarse_to_dense'],
+			'vertices': {vkey: self.vertex_coordinates(vkey) for vkey in self.vertices()},
+			'densities': dict(self.get_strip_densities()),
+			'face_dense_vertices': face_dense_vertices,
+			'face_dense_faces': face_dense_faces,
+			'next_vkey': max([vkey + 1 for vkey in quad_mesh.vertices()] + [0])
+		}
+
+	def densification_changed_strips(self):
+		"""Return the strips whose density has changed since the last densification, if it can be updated incrementally.
+
+		Returns
+		-------
+		list, None
+			The keys of the strips with a new density, or None if the coarse quad mesh, its strips, or the dense quad mesh have changed otherwise.
+
+		"""
+
+		state = self._densification
+		if state is None:
+			return None
+
+		quad_mesh = self.peek_quad_mesh()
+		if quad_mesh is not state['quad_mesh'] or quad_mesh.topology_version != state['quad_mesh_version']:
+			return None
+		# a shared dense quad mesh is generated again rather than copied
+		if self.attributes['quad_mesh'].is_shared():
+			return None
+		# the strip data of the dense quad mesh would be invalidated by the update
+		if quad_mesh.attributes['strips'] or quad_mesh.attributes['polyedges']:
+			return None
+		version = (self._topology_version, self._strip_data_state())
+		if version[1] is None or version != state['version'] or self.halfedge is not state['halfedge']:
+			return None
+		if self.attributes['strips'] is not state['strips'] or self.attributes['coarse_to_dense'] is not state['coarse_to_dense']:
+			return None
+		if any([self.vertex_coordinates(vkey) != xyz for vkey, xyz in state['vertices'].items()]):
+			return None
+
+		densities = self.get_strip_densities()
+		return [skey for skey in self.strips() if densities[skey] != state['densities'].get(skey)]
+
+	def update_densification(self, skeys):
+		"""Update the dense quad mesh after changing the density of some strips.
+		The dense faces and vertices inside the coarse faces along the edges of the strips are deleted and new patches are spliced in place.
+
+		Parameters
+		----------
+		skeys : list
+			The keys of the strips with a new density.
+
+		"""
+
+		state = self._densification
+		quad_mesh = self.get_quad_mesh()
+		coarse_to_dense = self.attributes['coarse_to_dense']
+
+		# coarse edges of the strips and coarse faces along them
+		edges = []
+		visited = set()
+		for skey in skeys:
+			for u, v in self.strip_edges(skey):
+				if u != v and (u, v) not in visited:
+					visited.update([(u, v), (v, u)])
+					edges.append((u, v))
+		fkeys = set([self.halfedge[u][v] for u, v in visited if self.halfedge[u][v] is not None])
+		fkeys = [fkey for fkey in self.faces() if fkey in fkeys]
+
+		# delete the old patches and the dense vertices inside their coarse edges and faces
+		old_fkeys = [dense_fkey for fkey in fkeys for dense_fkey in state['face_dense_faces'][fkey]]
+		for dense_fkey in old_fkeys:
+			quad_mesh.delete_face(dense_fkey)
+		for u, v in edges:
+			for vkey in coarse_to_dense.polyedge(u, v)[1: -1]:
+				quad_mesh.delete_vertex(vkey)
+		for fkey in fkeys:
+			for vkey in state['face_dense_vertices'][fkey]:
+				quad_mesh.delete_vertex(vkey)
+
+		# subdivide the coarse edges with their new density
+		start = state['next_vkey']
+		for u, v in edges:
+			points = self.densification_edge_points(u, v)
+			polyedge = [coarse_to_dense.vertices[u]] + list(range(start, start + len(points))) + [coarse_to_dense.vertices[v]]
+			for x, y, z in points:
+				quad_mesh.add_vertex(key=start, x=x, y=y, z=z)
+				start += 1
+			coarse_to_dense.set_polyedge(u, v, polyedge)
+
+		# splice the new patches
+		for fkey in fkeys:
+			n, m, sides = self.densification_face_patch(fkey)
+			vertices = {vkey: quad_mesh.vertex_coordinates(vkey) for side in sides for vkey in side}
+			points, faces = densify_patch(vertices, n, m, sides, start)
+			state['face_dense_vertices'][fkey] = list(range(start, start + len(points)))
+			for x, y, z in points:
+				quad_mesh.add_vertex(key=start, x=x, y=y, z=z)
+				start += 1
+			state['face_dense_faces'][fkey] = [quad_mesh.add_face(face) for face in remove_collapsed_edges(faces)]
+
+		state['next_vkey'] = start
+		state['quad_mesh_version'] = quad_mesh.topology_version
+		state['densities'] = dict(self.get_strip_densities())
+		self.update_dense_face_data(old_fkeys, {fkey: state['face_dense_faces'][fkey] for fkey in fkeys})
 
 	# def geometrical_densification(self):
 	# 	"""Generate a denser quad mesh from the coarse quad mesh and its strip densities.
@@ -367,6 +747,233 @@ class CoarseQuadMesh(QuadMesh):
 	# 	return self.quad_mesh
 
 
+def patch_grid(n, m, sides, start):
+	"""Return the dense vertices of a patch, in the order of the points of discrete_coons_patch.
+
+	Parameters
+	----------
+	n : int
+		The number of points of the sides ab and dc.
+	m : int
+		The number of points of the sides bc and ad.
+	sides : list
+		The lists of dense vertices on the sides ab, bc, dc and ad.
+	start : int
+		The first dense vertex of the patch interior, numbered row by row.
+
+	Returns
+	-------
+	list
+		The n * m dense vertices of the patch.
+
+	"""
+
+	ab, bc, dc, ad = sides
+	grid = []
+	k = start
+	for i in range(n):
+		for j in range(m):
+			if j == 0:
+				grid.append(ab[i])
+			elif i == n - 1:
+				grid.append(bc[j])
+			elif j == m - 1:
+				grid.append(dc[i])
+			elif i == 0:
+				grid.append(ad[j])
+			else:
+				grid.append(k)
+				k += 1
+	return grid
+
+
+def patch_faces(n, m, sides, start):
+	"""Return the faces of a patch, in the order of the faces of discrete_coons_patch, without generating its points.
+
+	Parameters
+	----------
+	n : int
+		The number of points of the sides ab and dc.
+	m : int
+		The number of points of the sides bc and ad.
+	sides : list
+		The lists of dense vertices on the sides ab, bc, dc and ad.
+	start : int
+		The first dense vertex of the patch interior, numbered row by row.
+
+	Returns
+	-------
+	list
+		The (n - 1) * (m - 1) faces of the patch as lists of dense vertices.
+
+	"""
+
+	grid = patch_grid(n, m, sides, start)
+	return [[grid[i * m + j], grid[i * m + j + 1], grid[(i + 1) * m + j + 1], grid[(i + 1) * m + j]] for i in range(n - 1) for j in range(m - 1)]
+
+
+def densify_patch(vertices, n, m, sides, start):
+	"""Generate the interior points and the faces of the Coons patch of a face in the densification.
+
+	Parameters
+	----------
+	vertices : list
+		The coordinates of the dense vertices, at least on the coarse vertices and edges.
+	n : int
+		The number of points of the sides ab and dc.
+	m : int
+		The number of points of the sides bc and ad.
+	sides : list
+		The lists of dense vertices on the sides ab, bc, dc and ad.
+	start : int
+		The first dense vertex of the patch interior, numbered row by row.
+
+	Returns
+	-------
+	tuple
+		The list of the coordinates of the interior vertices, from start, and the list of the patch faces as lists of dense vertices.
+
+	"""
+
+	ab, bc, dc, ad = [[vertices[vkey] for vkey in side] for side in sides]
+	points, faces = discrete_coons_patch(ab, bc, dc, ad)
+	return [points[i * m + j] for i in range(1, n - 1) for j in range(1, m - 1)], patch_faces(n, m, sides, start)
+
+
+def remove_collapsed_edges(faces):
+	"""Remove the collapsed edges of the faces of patches at poles.
+
+	Parameters
+	----------
+	faces : list
+		Faces as lists of dense vertices.
+
+	Returns
+	-------
+	list
+		The faces without consecutive repeated vertices.
+
+	"""
+
+	return [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
+
+
+def densify_patches(vertices, patches, workers=None):
+	"""Generate the Coons patches of the densification, in the current process or in parallel.
+
+	Parameters
+	----------
+	vertices : list
+		The coordinates of the dense vertices on the coarse vertices and edges.
+	patches : list
+		The patches, as from CoarseQuadMesh.densification_patches.
+	workers : int, optional
+		A number of processes to generate the patches in parallel. Default is None, in the current process.
+
+	Returns
+	-------
+	tuple
+		The list of all the dense vertex coordinates and the list of dense faces as lists of vertex indices, without the collapsed edges at poles.
+
+	"""
+
+	if workers is not None and workers > 1:
+		vertices, faces = densify_patches_in_parallel(vertices, patches, workers)
+	else:
+		vertices, faces = _densify_patches_in_process(vertices, patches)
+
+	return vertices, remove_collapsed_edges(faces)
+
+
+def _densify_patches_in_process(vertices, patches):
+	vertices = list(vertices)
+	faces = []
+	for n, m, sides, start in patches:
+		points, patch_faces = densify_patch(vertices, n, m, sides, start)
+		vertices += points
+		faces += patch_faces
+	return vertices, faces
+
+
+def _densify_patches_in_shared_memory(args):
+	# read the coordinates on the coarse vertices and edges and write the interior coordinates of the patches in the shared buffer
+	from array import array
+
+	name, number_of_boundary_vertices, patches = args
+	shared_memory = SharedMemory(name=name)
+	buffer = None
+	try:
+		buffer = shared_memory.buf.cast('d')
+		xyz = buffer[: 3 * number_of_boundary_vertices].tolist()
+		vertices = [xyz[3 * i: 3 * i + 3] for i in range(number_of_boundary_vertices)]
+		faces = []
+		for n, m, sides, start in patches:
+			points, patch_faces = densify_patch(vertices, n, m, sides, start)
+			buffer[3 * start: 3 * (start + len(points))] = array('d', [x for point in points for x in point])
+			faces += patch_faces
+	finally:
+		# the shared memory cannot be closed while the buffer is exported
+		if buffer is not None:
+			buffer.release()
+		shared_memory.close()
+	return faces
+
+
+def densify_patches_in_parallel(vertices, patches, workers):
+	"""Generate the Coons patches of the densification with a pool of processes sharing a buffer of vertex coordinates.
+	The patches are split in contiguous chunks and the faces are gathered in the order of the patches, so the result does not depend on the number of processes.
+	Without shared memory, before Python 3.8 and in IronPython, the patches are densified in the current process.
+
+	Parameters
+	----------
+	vertices : list
+		The coordinates of the dense vertices on the coarse vertices and edges.
+	patches : list
+		The patches, as from CoarseQuadMesh.densification_patches.
+	workers : int
+		The number of processes.
+
+	Returns
+	-------
+	tuple
+		The list of all the dense vertex coordinates and the list of dense faces as lists of vertex indices.
+
+	"""
+
+	if SharedMemory is None:
+		return _densify_patches_in_process(vertices, patches)
+
+	from multiprocessing import Pool
+	from array import array
+
+	number_of_vertices = len(vertices) + sum([(n - 2) * (m - 2) for n, m, sides, start in patches])
+	size = int(ceil(len(patches) / float(4 * workers))) or 1
+	chunks = [patches[i: i + size] for i in range(0, len(patches), size)]
+
+	shared_memory = SharedMemory(create=True, size=max(1, 24 * number_of_vertices))
+	buffer = None
+	try:
+		buffer = shared_memory.buf.cast('d')
+		buffer[: 3 * len(vertices)] = array('d', [x for xyz in vertices for x in xyz])
+		pool = Pool(workers)
+		try:
+			chunk_faces = pool.map(_densify_patches_in_shared_memory, [(shared_memory.name, len(vertices), chunk) for chunk in chunks])
+		finally:
+			pool.close()
+			pool.join()
+		xyz = buffer[: 3 * number_of_vertices].tolist()
+	finally:
+		# the shared memory cannot be closed while the buffer is exported, which would hide the original error
+		if buffer is not None:
+			buffer.release()
+		shared_memory.close()
+		shared_memory.unlink()
+
+	vertices = [xyz[3 * i: 3 * i + 3] for i in range(number_of_vertices)]
+	faces = [face for faces in chunk_faces for face in faces]
+	return vertices, faces
+
+
 # def meshes_join_and_weld(meshes, precision = None, cls = None, data = False):
 # 	"""Join and and weld meshes within some precision distance.
 
@@ -440,8 +1047,7 @@ if __name__ == '__main__':
 	# mesh_0.collect_polyedges()
 	
 	# print(mesh_0.number_of_strips())
-	# print(mesh_0.data['attributes']['vertex_coarse_to_dense'])
-	# print(mesh_0.data['attributes']['edge_coarse_to_dense'])
+	# print(mesh_0.attributes['coarse_to_dense'].to_data())
 
 	# mesh_0.set_strips_density(1)
 	# mesh_0.set_strip_density(0, 6)
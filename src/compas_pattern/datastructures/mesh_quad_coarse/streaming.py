@@ -0,0 +1,121 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from struct import pack
+
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import densify_patch
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import patch_faces
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import remove_collapsed_edges
+
+__all__ = [
+	'densification_to_obj',
+	'densification_to_ply'
+]
+
+
+def densification_to_obj(coarse_quad_mesh, filepath):
+	"""Write the densification of a coarse quad mesh to an OBJ file, patch by patch, without generating the dense quad mesh.
+	The dense vertices on the coarse vertices and edges are written first and shared by the patches, as in CoarseQuadMesh.densification.
+	Then, the interior vertices and the faces of each patch are written and discarded.
+	The child-parent element data are updated.
+
+	Parameters
+	----------
+	coarse_quad_mesh : CoarseQuadMesh
+		A coarse quad mesh with strip densities.
+	filepath : str
+		The path to the OBJ file.
+
+	Returns
+	-------
+	tuple
+		The numbers of dense vertices and faces.
+
+	"""
+
+	vertices, patches = coarse_quad_mesh.densification_patches()
+	number_of_vertices = len(vertices)
+	number_of_faces = 0
+
+	with open(filepath, 'w') as f:
+		for xyz in vertices:
+			f.write('v {0!r} {1!r} {2!r}\n'.format(*xyz))
+		for n, m, sides, start in patches:
+			points, faces = densify_patch(vertices, n, m, sides, start)
+			for xyz in points:
+				f.write('v {0!r} {1!r} {2!r}\n'.format(*xyz))
+			# the vertices are numbered from 1
+			for face in remove_collapsed_edges(faces):
+				f.write('f {}\n'.format(' '.join([str(vkey + 1) for vkey in face])))
+			number_of_vertices += len(points)
+			number_of_faces += len(faces)
+
+	return number_of_vertices, number_of_faces
+
+
+def densification_to_ply(coarse_quad_mesh, filepath):
+	"""Write the densification of a coarse quad mesh to a binary PLY file, patch by patch, without generating the dense quad mesh.
+	The dense vertices on the coarse vertices and edges are written first and shared by the patches, as in CoarseQuadMesh.densification.
+	As the faces follow the vertices in the PLY format, the interior vertices of the patches are written in a first pass and the faces in a second one, without the points.
+	The child-parent element data are updated.
+
+	Parameters
+	----------
+	coarse_quad_mesh : CoarseQuadMesh
+		A coarse quad mesh with strip densities.
+	filepath : str
+		The path to the PLY file.
+
+	Returns
+	-------
+	tuple
+		The numbers of dense vertices and faces.
+
+	"""
+
+	vertices, patches = coarse_quad_mesh.densification_patches()
+	number_of_vertices = len(vertices) + sum([(n - 2) * (m - 2) for n, m, sides, start in patches])
+	number_of_faces = sum([(n - 1) * (m - 1) for n, m, sides, start in patches])
+
+	header = [
+		'ply',
+		'format binary_little_endian 1.0',
+		'element vertex {}'.format(number_of_vertices),
+		'property double x',
+		'property double y',
+		'property double z',
+		'element face {}'.format(number_of_faces),
+		'property list uchar int vertex_indices',
+		'end_header'
+	]
+
+	with open(filepath, 'wb') as f:
+		f.write(('\n'.join(header) + '\n').encode('ascii'))
+		f.write(b''.join([pack('<3d', *xyz) for xyz in vertices]))
+		for n, m, sides, start in patches:
+			points, faces = densify_patch(vertices, n, m, sides, start)
+			f.write(b''.join([pack('<3d', *xyz) for xyz in points]))
+		for n, m, sides, start in patches:
+			faces = remove_collapsed_edges(patch_faces(n, m, sides, start))
+			f.write(b''.join([pack('<B{}i'.format(len(face)), len(face), *face) for face in faces]))
+
+	return number_of_vertices, number_of_faces
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+	vertices = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0], [0.0, 3.0, 0.0], [1.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+	faces = [[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+	coarse_quad_mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+	coarse_quad_mesh.collect_strips()
+	coarse_quad_mesh.set_strips_density(10)
+
+	print(densification_to_obj(coarse_quad_mesh, 'densification.obj'))
+	print(densification_to_ply(coarse_quad_mesh, 'densification.ply'))
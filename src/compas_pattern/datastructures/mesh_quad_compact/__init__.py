@@ -0,0 +1,3 @@
+from compas_pattern.datastructures.mesh_quad_compact.mesh_quad_compact import *
+from compas_pattern.datastructures.mesh_quad_compact.polylines import *
+from compas_pattern.datastructures.mesh_quad_compact.densification import *
\ No newline at end of file
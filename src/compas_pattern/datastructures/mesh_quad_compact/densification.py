@@ -0,0 +1,162 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import numpy as np
+
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import remove_collapsed_edges
+
+
+__all__ = [
+	'coons_patches_numpy',
+	'densification_arrays_numpy',
+	'densification_numpy'
+]
+
+
+def coons_patches_numpy(ab, bc, dc, ad):
+	"""Evaluate a batch of discrete Coons patches with the same numbers of boundary points, as in compas.geometry.discrete_coons_patch.
+
+	Parameters
+	----------
+	ab : array
+		The (P, n, 3) array of the points of the boundaries ab.
+	bc : array
+		The (P, m, 3) array of the points of the boundaries bc.
+	dc : array
+		The (P, n, 3) array of the points of the boundaries dc.
+	ad : array
+		The (P, m, 3) array of the points of the boundaries ad.
+
+	Returns
+	-------
+	points : array
+		The (P, n, m, 3) array of the patch points.
+
+	"""
+
+	n, m = ab.shape[1], bc.shape[1]
+	ki = (np.arange(n) / (n - 1))[None, :, None, None]
+	kj = (np.arange(m) / (m - 1))[None, None, :, None]
+
+	# linear interpolations of the two pairs of opposite boundaries
+	points = ab[:, :, None] * (1 - kj) + dc[:, :, None] * kj + ad[:, None] * (1 - ki) + bc[:, None] * ki
+	# minus the bilinear interpolation of the four corners
+	a, b, c, d = [corner[:, None, None] for corner in (ab[:, 0], bc[:, 0], dc[:, -1], ad[:, -1])]
+	points -= a * (1 - ki) * (1 - kj) + b * ki * (1 - kj) + c * ki * kj + d * (1 - ki) * kj
+	return points
+
+
+def densification_arrays_numpy(coarse_quad_mesh):
+	"""Generate the vertex and face arrays of the dense quad mesh of a coarse quad mesh and its strip densities, as in CoarseQuadMesh.densification.
+	The Coons patches of the faces with the same densities are evaluated together.
+	The dense vertices are allocated as in CoarseQuadMesh.densification_patches, which updates the child-parent element data.
+
+	Parameters
+	----------
+	coarse_quad_mesh : CoarseQuadMesh
+		A coarse quad mesh with strip densities.
+
+	Returns
+	-------
+	xyz : array
+		The (V, 3) array of the dense vertex coordinates.
+	faces : array
+		The (F, 4) array of the dense face vertex indices.
+
+	"""
+
+	xyz, faces, face_offsets = _densification_arrays_numpy(coarse_quad_mesh)
+	return xyz, faces
+
+
+def _densification_arrays_numpy(coarse_quad_mesh):
+	# the dense faces of each coarse face from its offset
+	vertices, patches = coarse_quad_mesh.densification_patches()
+
+	# group the faces by the numbers of points of their patch
+	groups = {}
+	for i, (n, m, sides, start) in enumerate(patches):
+		groups.setdefault((n, m), []).append(i)
+
+	# the faces are assembled in the order of the coarse faces
+	face_offsets = np.zeros(len(patches) + 1, dtype=np.int64)
+	face_offsets[1:] = np.cumsum([(n - 1) * (m - 1) for n, m, sides, start in patches])
+	xyz = np.empty((len(vertices) + sum([(n - 2) * (m - 2) for n, m, sides, start in patches]), 3), dtype=np.float64)
+	xyz[: len(vertices)] = np.array(vertices, dtype=np.float64).reshape((-1, 3))
+	faces = np.empty((face_offsets[-1], 4), dtype=np.int64)
+
+	for (n, m), indices in groups.items():
+		ab, bc, dc, ad = [np.array(side, dtype=np.int64).reshape((len(indices), -1)) for side in zip(*[patches[i][2] for i in indices])]
+		starts = np.array([patches[i][3] for i in indices], dtype=np.int64)
+
+		# dense vertices of the patches, in the order of the points of discrete_coons_patch
+		grid = np.empty((len(indices), n, m), dtype=np.int64)
+		grid[:, 1: -1, 1: -1] = starts[:, None, None] + np.arange((n - 2) * (m - 2)).reshape((n - 2, m - 2))[None, :, :]
+		grid[:, :, 0] = ab
+		grid[:, n - 1, :] = bc
+		grid[:, :, m - 1] = dc
+		grid[:, 0, :] = ad
+
+		points = coons_patches_numpy(xyz[ab], xyz[bc], xyz[dc], xyz[ad])
+		xyz[grid[:, 1: -1, 1: -1].reshape(-1)] = points[:, 1: -1, 1: -1].reshape((-1, 3))
+
+		grid = grid.reshape((len(indices), n * m))
+		i, j = np.meshgrid(np.arange(n - 1), np.arange(m - 1), indexing='ij')
+		i, j = i.reshape(-1), j.reshape(-1)
+		patch_faces = np.stack([i * m + j, i * m + j + 1, (i + 1) * m + j + 1, (i + 1) * m + j], axis=1)
+		rows = face_offsets[indices][:, None] + np.arange(len(patch_faces))[None, :]
+		faces[rows.reshape(-1)] = grid[:, patch_faces].reshape((-1, 4))
+
+	return xyz, faces, face_offsets
+
+
+def densification_numpy(coarse_quad_mesh, cls=None):
+	"""Generate a denser quad mesh from a coarse quad mesh and its strip densities, as in CoarseQuadMesh.densification, from the vertex and face arrays.
+	The faces of the patches of pseudo-quads along their collapsed side are triangles, whose pole is carried over as in CoarsePseudoQuadMesh.densification.
+
+	Parameters
+	----------
+	coarse_quad_mesh : CoarseQuadMesh, CoarsePseudoQuadMesh
+		A coarse quad mesh with strip densities.
+	cls : type, optional
+		The type of the dense quad mesh, which must be a pseudo-quad mesh if the coarse quad mesh has poles. Default is the dense quad mesh type of the coarse quad mesh.
+
+	Returns
+	-------
+	QuadMesh
+		The dense quad mesh, which is also set as the quad mesh of the coarse quad mesh.
+
+	"""
+
+	if cls is None:
+		cls = coarse_quad_mesh.dense_quad_mesh_type
+	if len(coarse_quad_mesh.attributes.get('face_pole', {})) > 0 and not hasattr(cls, 'set_face_pole'):
+		raise ValueError('The dense quad mesh of a coarse quad mesh with poles must be a pseudo-quad mesh.')
+
+	xyz, faces, face_offsets = _densification_arrays_numpy(coarse_quad_mesh)
+	quad_mesh = cls.from_vertices_and_faces(xyz.tolist(), remove_collapsed_edges(faces.tolist()))
+	coarse_quad_mesh.set_quad_mesh(quad_mesh)
+
+	# the dense faces are numbered in the order of the coarse faces
+	face_dense_faces = {fkey: list(range(face_offsets[i], face_offsets[i + 1])) for i, fkey in enumerate(coarse_quad_mesh.faces())}
+	coarse_quad_mesh.update_dense_face_data([], face_dense_faces)
+	return quad_mesh
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+	vertices = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0], [0.0, 3.0, 0.0], [1.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+	faces = [[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+	coarse_quad_mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+	coarse_quad_mesh.collect_strips()
+	coarse_quad_mesh.set_strips_density(10)
+
+	xyz, faces = densification_arrays_numpy(coarse_quad_mesh)
+	print(xyz.shape, faces.shape)
@@ -0,0 +1,533 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import numpy as np
+
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+from compas_pattern.utilities.versioned_dict import VersionedDict
+
+
+__all__ = [
+	'CompactQuadMesh',
+	'singularities_from_degrees',
+	'quad_mesh_singularities_numpy'
+]
+
+
+class CompactQuadMesh(object):
+	"""Array-based halfedge topology of a quad mesh, for read-heavy topological analysis of large meshes.
+
+	Vertices, faces and halfedges are identified by integer indices.
+	Faces are stored in compressed sparse row (CSR) format.
+	The halfedges of face f are the halfedges face_offsets[f] to face_offsets[f + 1] - 1, in the face order.
+	They are followed by the boundary halfedges, which have no face (-1).
+	At a vertex shared by several fans of faces, each fan has its own boundary halfedges, as in a vertex-manifold mesh.
+
+	Parameters
+	----------
+	xyz : array
+		The vertex coordinates, as a (V, 3) array.
+	face_offsets : array
+		The offsets of the faces in face_vertices, as a (F + 1,) array.
+	face_vertices : array
+		The vertex indices of the faces, concatenated.
+	vertex_keys : list, optional
+		The vertex keys of the dict mesh, for each vertex index. Default is the vertex indices.
+	face_keys : list, optional
+		The face keys of the dict mesh, for each face index. Default is the face indices.
+
+	"""
+
+	def __init__(self, xyz, face_offsets, face_vertices, vertex_keys=None, face_keys=None):
+		self.xyz = np.asarray(xyz, dtype=np.float64).reshape((-1, 3))
+		self.face_offsets = np.asarray(face_offsets, dtype=np.int32)
+		self.face_vertices = np.asarray(face_vertices, dtype=np.int32)
+		self.vertex_keys = list(vertex_keys) if vertex_keys is not None else list(range(len(self.xyz)))
+		self.face_keys = list(face_keys) if face_keys is not None else list(range(len(self.face_offsets) - 1))
+		self.key_index = {key: index for index, key in enumerate(self.vertex_keys)}
+		self._strips = None
+		self._polyedges = None
+		self._build_halfedges()
+
+	# --------------------------------------------------------------------------
+	# constructors
+	# --------------------------------------------------------------------------
+
+	@classmethod
+	def from_vertices_and_faces(cls, vertices, faces):
+		"""Construct a compact quad mesh from a list of vertex coordinates and a list of faces as lists of vertex indices.
+		"""
+
+		face_offsets = np.zeros(len(faces) + 1, dtype=np.int32)
+		face_offsets[1:] = np.cumsum([len(face) for face in faces])
+		face_vertices = [vkey for face in faces for vkey in face]
+		return cls(vertices, face_offsets, face_vertices)
+
+	@classmethod
+	def from_quad_mesh(cls, mesh):
+		"""Freeze a dict quad mesh into a compact quad mesh.
+
+		Parameters
+		----------
+		mesh : QuadMesh
+			A quad mesh.
+
+		Returns
+		-------
+		CompactQuadMesh
+			The compact quad mesh.
+
+		"""
+
+		vertex_keys = list(mesh.vertices())
+		key_index = {vkey: i for i, vkey in enumerate(vertex_keys)}
+		xyz = [mesh.vertex_coordinates(vkey) for vkey in vertex_keys]
+
+		face_keys = list(mesh.faces())
+		faces = [mesh.face_vertices(fkey) for fkey in face_keys]
+		face_offsets = np.zeros(len(faces) + 1, dtype=np.int32)
+		face_offsets[1:] = np.cumsum([len(face) for face in faces])
+		face_vertices = [key_index[vkey] for face in faces for vkey in face]
+
+		return cls(xyz, face_offsets, face_vertices, vertex_keys, face_keys)
+
+	def to_quad_mesh(self, cls=None):
+		"""Convert back to a dict quad mesh for editing, with the vertex coordinates and the computed strip and polyedge data.
+
+		Parameters
+		----------
+		cls : QuadMesh, optional
+			The quad mesh type. Default is QuadMesh.
+
+		Returns
+		-------
+		QuadMesh
+			The quad mesh.
+
+		"""
+
+		if cls is None:
+			cls = QuadMesh
+
+		mesh = cls()
+		for vkey, (x, y, z) in zip(self.vertex_keys, self.xyz.tolist()):
+			mesh.add_vertex(vkey, attr_dict={'x': x, 'y': y, 'z': z})
+		offsets = self.face_offsets.tolist()
+		face_vertices = self.face_vertices.tolist()
+		for f, fkey in enumerate(self.face_keys):
+			mesh.add_face([self.vertex_keys[i] for i in face_vertices[offsets[f]: offsets[f + 1]]], fkey)
+
+		if self._strips is not None:
+			mesh.attributes['strips'] = VersionedDict((i, self.strip_edges(i)) for i in range(self.number_of_strips()))
+		if self._polyedges is not None:
+			mesh.attributes['polyedges'] = VersionedDict((i, self.polyedge(i)) for i in range(self.number_of_polyedges()))
+
+		return mesh
+
+	# --------------------------------------------------------------------------
+	# halfedges
+	# --------------------------------------------------------------------------
+
+	def _build_halfedges(self):
+		n = len(self.xyz)
+		face_sizes = np.diff(self.face_offsets)
+		h0 = len(self.face_vertices)
+
+		# face halfedges
+		face = np.repeat(np.arange(len(face_sizes), dtype=np.int32), face_sizes)
+		start = self.face_offsets[:-1][face]
+		nxt = start + (np.arange(h0, dtype=np.int32) - start + 1) % face_sizes[face]
+		prv = start + (np.arange(h0, dtype=np.int32) - start - 1) % face_sizes[face]
+		origin = self.face_vertices
+		dest = origin[nxt]
+
+		# twins by matching the vertex pairs
+		key = origin.astype(np.int64) * n + dest
+		twin_key = dest.astype(np.int64) * n + origin
+		order = np.argsort(key, kind='mergesort')
+		sorted_key = key[order]
+		pos = np.minimum(np.searchsorted(sorted_key, twin_key), max(h0 - 1, 0))
+		found = sorted_key[pos] == twin_key if h0 else np.zeros(0, dtype=bool)
+		twin = np.where(found, order[pos] if h0 else pos, -1).astype(np.int32)
+
+		# boundary halfedges, opposite to the face halfedges without twin
+		open_halfedges = np.nonzero(twin < 0)[0].astype(np.int32)
+		b = len(open_halfedges)
+		boundary = np.arange(h0, h0 + b, dtype=np.int32)
+		twin[open_halfedges] = boundary
+		b_origin = dest[open_halfedges]
+
+		# the next boundary halfedge leaves the end vertex on the other side of its fan of faces
+		# the rotation from the twin face halfedge does not jump to another fan at a vertex shared by several fans
+		b_next = open_halfedges.copy()
+		active = np.arange(b)
+		while len(active):
+			h = twin[prv[b_next[active]]]
+			b_next[active] = h
+			active = active[h < h0]
+
+		self.halfedge_vertex = np.concatenate((origin, b_origin)).astype(np.int32)
+		self.halfedge_next = np.concatenate((nxt, b_next)).astype(np.int32)
+		self.halfedge_twin = np.concatenate((twin, open_halfedges)).astype(np.int32)
+		self.halfedge_face = np.concatenate((face, np.full(b, -1, dtype=np.int32)))
+
+		# one edge per pair of twin halfedges
+		h = np.arange(h0 + b, dtype=np.int32)
+		first = h < self.halfedge_twin
+		edge = np.full(h0 + b, -1, dtype=np.int32)
+		edge[first] = np.arange(np.count_nonzero(first), dtype=np.int32)
+		self.halfedge_edge = edge[np.minimum(h, self.halfedge_twin)]
+
+	def halfedge_vertices(self, halfedges):
+		"""Return the start and end vertex indices of halfedges.
+		"""
+
+		halfedges = np.asarray(halfedges, dtype=np.int32)
+		return self.halfedge_vertex[halfedges], self.halfedge_vertex[self.halfedge_next[halfedges]]
+
+	# --------------------------------------------------------------------------
+	# counts
+	# --------------------------------------------------------------------------
+
+	def number_of_vertices(self):
+		return len(self.xyz)
+
+	def number_of_faces(self):
+		return len(self.face_offsets) - 1
+
+	def number_of_halfedges(self):
+		return len(self.halfedge_vertex)
+
+	def number_of_edges(self):
+		return len(self.halfedge_vertex) // 2
+
+	# --------------------------------------------------------------------------
+	# vertex classification
+	# --------------------------------------------------------------------------
+
+	def vertex_degrees(self):
+		"""Return the degree of all the vertices.
+		"""
+
+		return np.bincount(self.halfedge_vertex, minlength=self.number_of_vertices())
+
+	def vertices_on_boundary(self):
+		"""Return a mask of the vertices on the boundary.
+		"""
+
+		on_boundary = np.zeros(self.number_of_vertices(), dtype=bool)
+		on_boundary[self.halfedge_vertex[self.halfedge_face < 0]] = True
+		return on_boundary
+
+	def singularities(self, indices=False):
+		"""Return the vertices that are quad mesh singularities.
+
+		Parameters
+		----------
+		indices : bool, optional
+			Whether to return the singularity indices as well. Default is False.
+
+		Returns
+		-------
+		array, tuple
+			The indices of the singular vertices and, optionally, their singularity indices.
+
+		"""
+
+		singularities, vertex_indices = singularities_from_degrees(self.vertex_degrees(), self.vertices_on_boundary())
+		if indices:
+			return singularities, vertex_indices
+		return singularities
+
+	# --------------------------------------------------------------------------
+	# strips
+	# --------------------------------------------------------------------------
+
+	def strips(self):
+		"""Collect the strips.
+		Each strip is a sequence of halfedges oriented towards the next face of the strip, as in QuadMesh.collect_strip.
+		Strips stop at the boundaries and at non-quad faces.
+
+		Returns
+		-------
+		tuple
+			The strip offsets and the concatenated strip halfedges.
+
+		"""
+
+		if self._strips is None:
+			self._strips = self._collect_strips()
+		return self._strips
+
+	def _collect_strips(self):
+		face_sizes = np.diff(self.face_offsets)
+		face = self.halfedge_face
+		is_quad = np.zeros(len(face), dtype=bool)
+		is_quad[face >= 0] = face_sizes[face[face >= 0]] == 4
+
+		# the next strip halfedge, opposite in the quad face ahead
+		successor = np.where(is_quad, self.halfedge_twin[self.halfedge_next[self.halfedge_next]], -1)
+		open_start = is_quad & ~is_quad[self.halfedge_twin]
+
+		successor = successor.tolist()
+		is_quad = is_quad.tolist()
+		edge = self.halfedge_edge.tolist()
+		twin = self.halfedge_twin.tolist()
+		visited = [False] * self.number_of_edges()
+
+		offsets = [0]
+		halfedges = []
+
+		# open strips, then closed strips, then edges without quad faces
+		starts = np.nonzero(open_start)[0].tolist() + np.nonzero(np.array(is_quad, dtype=bool))[0].tolist() + list(range(len(edge)))
+		for h in starts:
+			if visited[edge[h]]:
+				continue
+			if not is_quad[h]:
+				if is_quad[twin[h]]:
+					continue
+				visited[edge[h]] = True
+				halfedges.append(h)
+				offsets.append(len(halfedges))
+				continue
+			h_start = h
+			while True:
+				visited[edge[h]] = True
+				halfedges.append(h)
+				if not is_quad[h]:
+					break
+				h = successor[h]
+				if h == h_start:
+					break
+			offsets.append(len(halfedges))
+
+		return np.array(offsets, dtype=np.int32), np.array(halfedges, dtype=np.int32)
+
+	def number_of_strips(self):
+		return len(self.strips()[0]) - 1
+
+	def strip_halfedges(self, i):
+		offsets, halfedges = self.strips()
+		return halfedges[offsets[i]: offsets[i + 1]]
+
+	def strip_edges(self, i):
+		"""Return the edges of a strip as pairs of vertex keys.
+		"""
+
+		u, v = self.halfedge_vertices(self.strip_halfedges(i))
+		return [(self.vertex_keys[a], self.vertex_keys[b]) for a, b in zip(u.tolist(), v.tolist())]
+
+	def edge_strips(self):
+		"""Return the strip index of each edge.
+		"""
+
+		offsets, halfedges = self.strips()
+		strips = np.full(self.number_of_edges(), -1, dtype=np.int32)
+		strips[self.halfedge_edge[halfedges]] = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+		return strips
+
+	def face_strips(self):
+		"""Return the pair of strips crossing each face, as a (F, 2) array.
+		"""
+
+		edge_strips = self.edge_strips()
+		first = self.face_offsets[:-1]
+		return np.stack((edge_strips[self.halfedge_edge[first]], edge_strips[self.halfedge_edge[first + 1]]), axis=1)
+
+	def strip_graph(self):
+		"""Compute the edges of the graph representing the strip connectivity, where each graph vertex is a strip and each graph edge a face representing the crossing of two strips.
+
+		Returns
+		-------
+		tuple
+			The number of strips and the (F, 2) array of graph edges.
+
+		"""
+
+		return self.number_of_strips(), self.face_strips()
+
+	# --------------------------------------------------------------------------
+	# polyedges
+	# --------------------------------------------------------------------------
+
+	def _straight_continuations(self):
+		# the outgoing halfedge continuing each halfedge straight accross its end vertex, -1 if none
+		twin = self.halfedge_twin
+		nxt = self.halfedge_next
+		h = np.arange(self.number_of_halfedges(), dtype=np.int32)
+		end = self.halfedge_vertex[nxt]
+
+		degree = self.vertex_degrees()
+		on_boundary = self.vertices_on_boundary()
+
+		continuation = np.full(len(h), -1, dtype=np.int32)
+
+		# across regular interior vertices, rotate twice around the vertex
+		interior = ~on_boundary[end] & (degree[end] == 4)
+		rotated = nxt[twin[nxt[h]]]
+		continuation[interior] = rotated[interior]
+
+		# along the boundary across regular boundary vertices
+		outgoing = np.full(self.number_of_vertices(), -1, dtype=np.int32)
+		incoming = np.full(self.number_of_vertices(), -1, dtype=np.int32)
+		boundary = np.nonzero(self.halfedge_face < 0)[0].astype(np.int32)
+		outgoing[self.halfedge_vertex[boundary]] = boundary
+		incoming[self.halfedge_vertex[nxt[boundary]]] = boundary
+		regular = on_boundary[end] & (degree[end] == 3)
+		edge = self.halfedge_edge
+		along_in = regular & (edge == edge[incoming[end]])
+		along_out = regular & (edge == edge[outgoing[end]])
+		continuation[along_in] = outgoing[end[along_in]]
+		continuation[along_out] = twin[incoming[end[along_out]]]
+
+		return continuation
+
+	def polyedges(self):
+		"""Collect the polyedges accross regular vertices, between boundaries and/or singularities.
+		Closed polyedges have the same first and last vertices.
+
+		Returns
+		-------
+		tuple
+			The polyedge offsets and the concatenated polyedge vertex indices.
+
+		"""
+
+		if self._polyedges is None:
+			self._polyedges = self._collect_polyedges()
+		return self._polyedges
+
+	def _collect_polyedges(self):
+		continuation = self._straight_continuations()
+		has_predecessor = np.zeros(len(continuation), dtype=bool)
+		has_predecessor[continuation[continuation >= 0]] = True
+
+		nxt = self.halfedge_next.tolist()
+		origin = self.halfedge_vertex.tolist()
+		edge = self.halfedge_edge.tolist()
+		continuation = continuation.tolist()
+		visited = [False] * self.number_of_edges()
+
+		offsets = [0]
+		vertices = []
+
+		# open polyedges from their start, then closed polyedges
+		starts = np.nonzero(~has_predecessor)[0].tolist() + list(range(len(edge)))
+		for h in starts:
+			if visited[edge[h]]:
+				continue
+			h_start = h
+			vertices.append(origin[h])
+			while h != -1:
+				visited[edge[h]] = True
+				vertices.append(origin[nxt[h]])
+				h = continuation[h]
+				if h == h_start:
+					break
+			offsets.append(len(vertices))
+
+		return np.array(offsets, dtype=np.int32), np.array(vertices, dtype=np.int32)
+
+	def number_of_polyedges(self):
+		return len(self.polyedges()[0]) - 1
+
+	def polyedge(self, i):
+		"""Return a polyedge as a list of vertex keys.
+		"""
+
+		offsets, vertices = self.polyedges()
+		return [self.vertex_keys[vkey] for vkey in vertices[offsets[i]: offsets[i + 1]].tolist()]
+
+
+# ==============================================================================
+# Singularities
+# ==============================================================================
+
+def singularities_from_degrees(degree, on_boundary):
+	"""Compute the singular vertices and their indices from the vertex degrees and boundary flags, as in QuadMesh.is_vertex_singular and QuadMesh.vertex_index.
+
+	Parameters
+	----------
+	degree : array
+		The vertex degrees.
+	on_boundary : array
+		The boolean mask of the boundary vertices.
+
+	Returns
+	-------
+	tuple
+		The array of singular vertex positions and the array of their indices.
+
+	"""
+
+	degree = np.asarray(degree)
+	regular_valency = np.where(on_boundary, 3, 4)
+	singularities = np.nonzero(degree != regular_valency)[0]
+	degree = degree[singularities]
+	regular_valency = regular_valency[singularities]
+	indices = np.where(degree == 0, 0.0, (regular_valency - degree) / 4.0)
+	return singularities, indices
+
+
+def quad_mesh_singularities_numpy(mesh):
+	"""Compute the singularities of a quad mesh and their indices in one vectorised pass over the vertex degrees and boundary flags.
+
+	The poles of a pseudo-quad mesh are singular, with the index of PseudoQuadMesh.vertex_index.
+
+	Parameters
+	----------
+	mesh : QuadMesh, PseudoQuadMesh, CompactQuadMesh
+		A quad mesh.
+
+	Returns
+	-------
+	singularities : list
+		The keys of the singular vertices, in vertex order.
+	indices : array
+		The index of each singularity.
+
+	"""
+
+	if isinstance(mesh, CompactQuadMesh):
+		vertex_keys = mesh.vertex_keys
+		degree = mesh.vertex_degrees()
+		on_boundary = mesh.vertices_on_boundary()
+	else:
+		vertex_keys = list(mesh.vertices())
+		nbrs = [mesh.halfedge[vkey] for vkey in vertex_keys]
+		degree = np.fromiter((len(halfedges) for halfedges in nbrs), dtype=np.int32, count=len(nbrs))
+		on_boundary = np.fromiter((None in halfedges.values() for halfedges in nbrs), dtype=bool, count=len(nbrs))
+
+	singularities, indices = singularities_from_degrees(degree, on_boundary)
+
+	# the degrees of the poles count their collapsed edges, their indices are computed one by one
+	poles = mesh.pole_index() if hasattr(mesh, 'pole_index') else {}
+	if len(poles) > 0:
+		key_index = {vkey: i for i, vkey in enumerate(vertex_keys)}
+		is_singular = np.zeros(len(vertex_keys), dtype=bool)
+		is_singular[singularities] = True
+		vertex_indices = np.zeros(len(vertex_keys))
+		vertex_indices[singularities] = indices
+		for pole in poles:
+			is_singular[key_index[pole]] = True
+			vertex_indices[key_index[pole]] = mesh.vertex_index(pole)
+		singularities = np.nonzero(is_singular)[0]
+		indices = vertex_indices[singularities]
+
+	return [vertex_keys[i] for i in singularities.tolist()], indices
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	n = 100
+	vertices = [[i, j, 0.0] for j in range(n + 1) for i in range(n + 1)]
+	faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(n) for i in range(n)]
+
+	mesh = CompactQuadMesh.from_vertices_and_faces(vertices, faces)
+	print(mesh.number_of_strips(), mesh.number_of_polyedges(), mesh.singularities())
+	print(quad_mesh_singularities_numpy(mesh.to_quad_mesh()))
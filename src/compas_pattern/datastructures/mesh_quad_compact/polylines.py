@@ -0,0 +1,184 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from itertools import chain
+
+import numpy as np
+
+
+__all__ = [
+	'polylines_numpy',
+	'singularity_polylines_numpy',
+	'strip_edge_midpoint_polylines_numpy',
+	'strip_face_centroid_polylines_numpy',
+	'strip_side_polylines_numpy'
+]
+
+
+def _vertex_arrays(mesh):
+	# vertex coordinate array and map from vertex keys to rows
+	vertex_keys = list(mesh.vertices())
+	key_index = {vkey: i for i, vkey in enumerate(vertex_keys)}
+	xyz = np.array([mesh.vertex_coordinates(vkey) for vkey in vertex_keys], dtype=np.float64).reshape((-1, 3))
+	return xyz, key_index
+
+
+def _ragged(lists, key_index):
+	# concatenated row indices of nested lists of keys, and their offsets
+	offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+	offsets[1:] = np.cumsum([len(items) for items in lists])
+	rows = np.fromiter((key_index[key] for key in chain.from_iterable(lists)), dtype=np.int64, count=int(offsets[-1]))
+	return rows, offsets
+
+
+def _closed(polyedges, closed):
+	# repeat the first element of the closed polyedges at their end
+	return [polyedge + polyedge[:1] if is_closed else polyedge for polyedge, is_closed in zip(polyedges, closed)]
+
+
+def polylines_numpy(mesh, polyedges=None):
+	"""Return polylines as one coordinate array and an offset array, instead of lists of point coordinates.
+	The points of polyline i are points[offsets[i]: offsets[i + 1]].
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	polyedges : list, optional
+		Polyedges as lists of vertex keys. Default are the polyedges of the mesh, as in QuadMesh.polylines.
+
+	Returns
+	-------
+	points : array
+		The (N, 3) array of polyline points.
+	offsets : array
+		The (P + 1,) array of polyline offsets.
+
+	"""
+
+	if polyedges is None:
+		polyedges = [polyedge for key, polyedge in mesh.polyedges(data=True)]
+
+	xyz, key_index = _vertex_arrays(mesh)
+	rows, offsets = _ragged(polyedges, key_index)
+	return xyz[rows], offsets
+
+
+def singularity_polylines_numpy(mesh):
+	"""Return the polylines connected to singularities as one coordinate array and an offset array, as in QuadMesh.singularity_polylines.
+	"""
+
+	return polylines_numpy(mesh, mesh.singularity_polyedges())
+
+
+def strip_edge_midpoint_polylines_numpy(mesh, skeys=None):
+	"""Return the strip polylines connecting edge midpoints as one coordinate array and an offset array, as in QuadMesh.strip_edge_midpoint_polyline.
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	skeys : list, optional
+		The strip keys. Default is all the strips.
+
+	Returns
+	-------
+	points : array
+		The (N, 3) array of polyline points.
+	offsets : array
+		The (S + 1,) array of polyline offsets.
+
+	"""
+
+	if skeys is None:
+		skeys = list(mesh.strips())
+
+	xyz, key_index = _vertex_arrays(mesh)
+	edges = _closed([list(mesh.strip_edges(skey)) for skey in skeys], [mesh.is_strip_closed(skey) for skey in skeys])
+	u, offsets = _ragged([[u for u, v in strip_edges] for strip_edges in edges], key_index)
+	v, _ = _ragged([[v for u, v in strip_edges] for strip_edges in edges], key_index)
+	return 0.5 * (xyz[u] + xyz[v]), offsets
+
+
+def strip_face_centroid_polylines_numpy(mesh, skeys=None):
+	"""Return the strip polylines connecting face centroids as one coordinate array and an offset array, as in QuadMesh.strip_face_centroid_polyline.
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	skeys : list, optional
+		The strip keys. Default is all the strips.
+
+	Returns
+	-------
+	points : array
+		The (N, 3) array of polyline points.
+	offsets : array
+		The (S + 1,) array of polyline offsets.
+
+	"""
+
+	if skeys is None:
+		skeys = list(mesh.strips())
+
+	xyz, key_index = _vertex_arrays(mesh)
+
+	# face centroids as the average of the face vertices
+	fkeys = list(mesh.faces())
+	fkey_index = {fkey: i for i, fkey in enumerate(fkeys)}
+	rows, face_offsets = _ragged([mesh.face_vertices(fkey) for fkey in fkeys], key_index)
+	centroids = np.add.reduceat(xyz[rows], face_offsets[:-1], axis=0) / np.diff(face_offsets)[:, None] if len(fkeys) else np.zeros((0, 3))
+
+	faces = _closed([mesh.strip_faces(skey) for skey in skeys], [mesh.is_strip_closed(skey) for skey in skeys])
+	rows, offsets = _ragged(faces, fkey_index)
+	return centroids[rows], offsets
+
+
+def strip_side_polylines_numpy(mesh, skeys=None):
+	"""Return the two side polylines of strips as one coordinate array and an offset array, as in QuadMesh.strip_side_polylines.
+	The side polylines of the i-th strip are the polylines 2 * i and 2 * i + 1.
+
+	Parameters
+	----------
+	mesh : QuadMesh
+		A quad mesh.
+	skeys : list, optional
+		The strip keys. Default is all the strips.
+
+	Returns
+	-------
+	points : array
+		The (N, 3) array of polyline points.
+	offsets : array
+		The (2 * S + 1,) array of polyline offsets.
+
+	"""
+
+	if skeys is None:
+		skeys = list(mesh.strips())
+
+	xyz, key_index = _vertex_arrays(mesh)
+	polyedges = [polyedge for skey in skeys for polyedge in mesh.strip_side_polyedges(skey)]
+	rows, offsets = _ragged(polyedges, key_index)
+	return xyz[rows], offsets
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+
+	n = 10
+	vertices = [[i, j, 0.0] for j in range(n + 1) for i in range(n + 1)]
+	faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(n) for i in range(n)]
+	mesh = QuadMesh.from_vertices_and_faces(vertices, faces)
+	mesh.collect_strips()
+	mesh.collect_polyedges()
+
+	points, offsets = strip_side_polylines_numpy(mesh)
+	print(points.shape, offsets)
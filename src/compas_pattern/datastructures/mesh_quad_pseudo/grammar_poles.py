@@ -6,6 +6,24 @@ __all__ = [
 
 
 def split_quad_in_pseudo_quads(mesh, fkey, vkey):
+	"""Split a quad face in two pseudo-quad faces with a pole at one of its vertices.
+	The poles of the pseudo-quad faces are set in the face pole data of the mesh.
+
+	Parameters
+	----------
+	mesh : PseudoQuadMesh
+		A pseudo-quad mesh.
+	fkey : hashable
+		The key of a quad face.
+	vkey : hashable
+		The key of the vertex of the face to use as pole.
+
+	Returns
+	-------
+	dict, None
+		The new pseudo-quad faces pointing to their pole. None if the face is not a quad.
+
+	"""
 
 	if len(mesh.face_vertices(fkey)) != 4:
 		return None
@@ -19,10 +37,30 @@ def split_quad_in_pseudo_quads(mesh, fkey, vkey):
 
 	fkey_1 = mesh.add_face([a, b, c])
 	fkey_2 = mesh.add_face([a, c, d])
+	mesh.set_face_pole(fkey_1, a)
+	mesh.set_face_pole(fkey_2, a)
 
 	return {fkey_1: a, fkey_2: a}
 
 def merge_pseudo_quads_in_quad(mesh, fkey_1, fkey_2):
+	"""Merge two adjacent pseudo-quad faces in a quad face.
+	The poles of the pseudo-quad faces are deleted from the face pole data of the mesh.
+
+	Parameters
+	----------
+	mesh : PseudoQuadMesh
+		A pseudo-quad mesh.
+	fkey_1 : hashable
+		The key of a pseudo-quad face.
+	fkey_2 : hashable
+		The key of an adjacent pseudo-quad face.
+
+	Returns
+	-------
+	hashable, None
+		The key of the new quad face. None if the faces are not adjacent.
+
+	"""
 
 	edge = mesh.face_adjacency_halfedge(fkey_1, fkey_2)
 	
@@ -35,6 +73,8 @@ def merge_pseudo_quads_in_quad(mesh, fkey_1, fkey_2):
 
 	mesh.delete_face(fkey_1)
 	mesh.delete_face(fkey_2)
+	mesh.delete_face_pole(fkey_1)
+	mesh.delete_face_pole(fkey_2)
 
 	return mesh.add_face([a, b, c, d])
 
@@ -1,9 +1,8 @@
 from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+from compas_pattern.utilities.versioned_dict import VersionedDict
 
 from compas.utilities import geometric_key
 
-from compas_pattern.utilities.lists import list_split
-
 __author__     = ['Robin Oval']
 __copyright__  = 'Copyright 2018, Block Research Group - ETH Zurich'
 __license__    = 'MIT License'
@@ -16,9 +15,19 @@ __all__ = [
 
 class PseudoQuadMesh(QuadMesh):
 
+    # the face poles are recorded in the journals by the face pole operations
+    journaled_attributes = QuadMesh.journaled_attributes + ('face_pole',)
+
+    # the face poles count the assignments and deletions of poles, to check the validity of the pole index
+    versioned_attributes = QuadMesh.versioned_attributes + ('face_pole',)
+
     def __init__(self):
         super(PseudoQuadMesh, self).__init__()
-        self.data['attributes']['face_pole'] = {}
+        self.attributes['face_pole'] = VersionedDict()
+        self._pole_index = {}
+        self._pole_index_face_pole = None
+        self._pole_index_version = None
+        self._pole_data_version = 0
 
     @classmethod
     def from_vertices_and_faces_with_poles(cls, vertices, faces, poles=[]):
@@ -27,30 +36,160 @@ class PseudoQuadMesh(QuadMesh):
         for fkey in mesh.faces():
             face_vertices = mesh.face_vertices(fkey)
             if len(face_vertices) == 3:
-                mesh.data['attributes']['face_pole'][fkey] = face_vertices[0]
+                pole = face_vertices[0]
                 for vkey in face_vertices:
                     if geometric_key(mesh.vertex_coordinates(vkey)) in pole_map:
-                        mesh.data['attributes']['face_pole'].update({fkey: vkey})
+                        pole = vkey
                         break
+                mesh.set_face_pole(fkey, pole)
         return mesh
 
     @classmethod
     def from_vertices_and_faces_with_face_poles(cls, vertices, faces, face_poles={}):
         mesh = cls.from_vertices_and_faces(vertices, faces)
-        mesh.data['attributes']['face_pole'] = face_poles
+        mesh.attributes['face_pole'] = VersionedDict(face_poles)
         return mesh
 
+    # --------------------------------------------------------------------------
+    # pole index
+    # --------------------------------------------------------------------------
+
+    def pole_index(self):
+        """Return the index of the poles pointing to their pseudo-quad faces.
+        The index is updated by the face pole operations and rebuilt after any other assignment or deletion of poles, or replacement of the face pole data.
+
+        Returns
+        -------
+        dict
+            A dictionary of poles pointing to dictionaries of their pseudo-quad faces.
+        """
+
+        if not self.is_pole_index_valid():
+            self.build_pole_index()
+        return self._pole_index
+
+    def is_pole_index_valid(self):
+        """Output whether the pole index is up to date with the face pole data.
+        Face pole data replaced by a plain dictionary are not versioned, so that the index is never valid for them.
+
+        Returns
+        -------
+        bool
+            True if the pole index is valid. False otherwise.
+        """
+
+        version = self._face_pole_state()
+        return version is not None and self._pole_index_face_pole is self.attributes['face_pole'] and self._pole_index_version == version
+
+    def _face_pole_state(self):
+        # the version of the face pole data and of their items, None if the face pole data are not versioned
+        face_pole = self.attributes['face_pole']
+        if not isinstance(face_pole, VersionedDict):
+            return None
+        return self._pole_data_version, face_pole.version
+
+    def build_pole_index(self):
+        """Build the index of the poles pointing to their pseudo-quad faces.
+        """
+
+        index = {}
+        for fkey, pole in self.attributes['face_pole'].items():
+            index.setdefault(pole, {})[fkey] = None
+
+        self._pole_index = index
+        self._pole_index_face_pole = self.attributes['face_pole']
+        self._pole_index_version = self._face_pole_state()
+
+    def invalidate_pole_index(self):
+        """Invalidate the pole index, so that it is rebuilt at the next query.
+        """
+
+        self._pole_index_face_pole = None
+        self._pole_data_version += 1
+
+    def _unindex_face_pole(self, fkey, pole):
+        faces = self._pole_index[pole]
+        del faces[fkey]
+        if len(faces) == 0:
+            del self._pole_index[pole]
+
+    # --------------------------------------------------------------------------
+    # face pole operations
+    # --------------------------------------------------------------------------
+
+    def set_face_pole(self, fkey, vkey):
+        """Set the pole of a pseudo-quad face, updating the pole index.
+
+        Parameters
+        ----------
+        fkey : hashable
+            A face key.
+        vkey : hashable
+            The vertex key of the pole.
+
+        """
+
+        if self._journal is not None:
+            self._journal_attribute_item('face_pole', fkey)
+
+        face_pole = self.attributes['face_pole']
+        is_valid = self.is_pole_index_valid()
+
+        if is_valid and fkey in face_pole:
+            self._unindex_face_pole(fkey, face_pole[fkey])
+        face_pole[fkey] = vkey
+
+        if is_valid:
+            self._pole_index_version = self._face_pole_state()
+            self._pole_index.setdefault(vkey, {})[fkey] = None
+
+    def delete_face_pole(self, fkey):
+        """Delete the pole of a pseudo-quad face, if any, updating the pole index.
+
+        Parameters
+        ----------
+        fkey : hashable
+            A face key.
+
+        """
+
+        face_pole = self.attributes['face_pole']
+        if fkey not in face_pole:
+            return
+        if self._journal is not None:
+            self._journal_attribute_item('face_pole', fkey, delete=True)
+        is_valid = self.is_pole_index_valid()
+
+        pole = face_pole.pop(fkey)
+
+        if is_valid:
+            self._pole_index_version = self._face_pole_state()
+            self._unindex_face_pole(fkey, pole)
+
+    # --------------------------------------------------------------------------
+    # journal
+    # --------------------------------------------------------------------------
+
+    def apply_journal(self, journal):
+        inverse = super(PseudoQuadMesh, self).apply_journal(journal)
+        self._apply_journal_attribute(journal, inverse, 'face_pole', self.set_face_pole, self.delete_face_pole)
+        return inverse
+
+    # --------------------------------------------------------------------------
+    # poles
+    # --------------------------------------------------------------------------
+
     def poles(self):
-        return list(set(self.data['attributes']['face_pole'].values()))
+        return list(self.pole_index())
 
     def is_pole(self, vkey):
-        return vkey in set(self.poles())
+        return vkey in self.pole_index()
 
     def is_face_pseudo_quad(self, fkey):
-        return fkey in set(self.data['attributes']['face_pole'].keys())
+        return fkey in self.attributes['face_pole']
 
     def is_vertex_pole(self, vkey):
-        return vkey in set(self.data['attributes']['face_pole'].values())
+        return vkey in self.pole_index()
 
     def is_vertex_full_pole(self, vkey):
         return all([self.is_face_pseudo_quad(fkey) for fkey in self.vertex_faces(vkey)])
@@ -59,7 +198,7 @@ class PseudoQuadMesh(QuadMesh):
         return self.is_vertex_pole(vkey) and not self.is_vertex_full_pole(vkey)
 
     def vertex_pole_faces(self, vkey):
-        return [fkey for fkey, pole in self.data['attributes']['face_pole'].items() if pole == vkey]
+        return list(self.pole_index().get(vkey, {}))
 
     def face_opposite_edge(self, u, v):
             """Returns the opposite edge in the quad face.
@@ -86,7 +225,7 @@ class PseudoQuadMesh(QuadMesh):
                 return (w, x)
             #if pseudo quad
             if len(self.face_vertices(fkey)) == 3:
-                pole = self.data['attributes']['face_pole'][fkey]
+                pole = self.attributes['face_pole'][fkey]
                 w = self.face_vertex_descendant(fkey, v)
                 if u == pole:
                     return (w, u)
@@ -117,7 +256,8 @@ class PseudoQuadMesh(QuadMesh):
             
         edges = [(u0, v0)]
 
-        count = self.number_of_edges()
+        # a strip crosses each face at most twice
+        count = 2 * len(self.face) + 2
         while count > 0:
             count -= 1
 
@@ -137,37 +277,9 @@ class PseudoQuadMesh(QuadMesh):
 
         return edges
 
-    def collect_strips(self):
-        """Collect the strip data.
-
-        Returns
-        -------
-        strip : int
-            The number of strips.
-
-        """
-
-        edges = [(u, v) if self.halfedge[u][v] is not None else (v, u) for u, v in self.edges()]
-
-        nb_strip = -1
-        while len(edges) > 0:
-            nb_strip += 1
-
-            u0, v0 = edges.pop()
-            strip_edges = self.collect_strip(u0, v0)
-            self.data['attributes']['strips'].update({nb_strip: strip_edges})
-
-            for u, v in strip_edges:
-                if u != v:
-                    if (u, v) in edges:
-                        edges.remove((u, v))
-                    elif (v, u) in edges:
-                        edges.remove((v, u))
-
-        return self.strips(data=True)
-
     def has_strip_poles(self, skey):
-        return self.data['attributes']['strips'][skey][0][0] == self.data['attributes']['strips'][skey][0][1] or self.data['attributes']['strips'][skey][-1][0] == self.data['attributes']['strips'][skey][-1][1]
+        edges = self.strip_edges(skey)
+        return edges[0][0] == edges[0][1] or edges[-1][0] == edges[-1][1]
 
     def is_strip_closed(self, skey):
         """Output whether a strip is closed.
@@ -184,7 +296,7 @@ class PseudoQuadMesh(QuadMesh):
 
         """
 
-        return not self.has_strip_poles(skey) and not self.is_edge_on_boundary(*self.data['attributes']['strips'][skey][0])
+        return not self.has_strip_poles(skey) and not self.is_edge_on_boundary(*self.strip_edges(skey)[0])
 
     def is_vertex_singular(self, vkey):
         """Output whether a vertex is quad mesh singularity.
@@ -204,11 +316,9 @@ class PseudoQuadMesh(QuadMesh):
 
         if self.is_vertex_pole(vkey):
             return True
-        elif (self.is_vertex_on_boundary(vkey) and self.vertex_degree(vkey) != 3) or (not self.is_vertex_on_boundary(vkey) and self.vertex_degree(vkey) != 4):
-            return True
 
-        else:
-            return False
+        # cached classification without poles
+        return super(PseudoQuadMesh, self).is_vertex_singular(vkey)
 
 
     def vertex_index(self, vkey):
@@ -289,7 +399,7 @@ class PseudoQuadMesh(QuadMesh):
         """
 
         if self.is_face_pseudo_quad(fkey):
-            pole = self.data['attributes']['face_pole'][fkey]
+            pole = self.attributes['face_pole'][fkey]
             #print(pole, fkey, self.face_vertices(fkey))
             u = self.face_vertex_descendant(fkey, pole)
             v = self.face_vertex_descendant(fkey, u)
@@ -302,14 +412,16 @@ class PseudoQuadMesh(QuadMesh):
 
         Parameters
         ----------
-        old_vkey : hashable
-            The old vertex key.
-        new_vkey : hashable
-            The new vertex key.
+        fkey : hashable
+            The face key.
 
         """
 
-        self.data['attributes']['strips'] = {skey: [(u, v) for u, v in self.strip_edges(skey) if u == v or (self.halfedge[u][v] != fkey and self.halfedge[v][u] != fkey)] for skey in self.strips()}
+        for skey in self._face_halfedge_strips(fkey):
+            edges = self.strip_edges(skey)
+            new_edges = [(u, v) for u, v in edges if u == v or (self.halfedge[u][v] != fkey and self.halfedge[v][u] != fkey)]
+            if len(new_edges) != len(edges):
+                self.set_strip_edges(skey, new_edges)
 
 
     def singularity_polyedges(self):
@@ -322,16 +434,15 @@ class PseudoQuadMesh(QuadMesh):
 
         """
 
-        poles = set(self.poles())
         # keep only polyedges connected to singularities or along the boundary      
-        polyedges = [polyedge for key, polyedge in self.polyedges(data=True) if (self.is_vertex_singular(polyedge[0]) and not self.is_pole(polyedge[0])) or (self.is_vertex_singular(polyedge[-1]) and not self.is_pole(polyedge[-1])) or self.is_edge_on_boundary(polyedge[0], polyedge[1])]                                    
+        keys = [key for key, polyedge in self.polyedges(data=True) if (self.is_vertex_singular(polyedge[0]) and not self.is_pole(polyedge[0])) or (self.is_vertex_singular(polyedge[-1]) and not self.is_pole(polyedge[-1])) or self.is_edge_on_boundary(polyedge[0], polyedge[1])]
+        polyedges = [self.attributes['polyedges'][key] for key in keys]
 
         # get intersections between polyedges for split
-        vertices = [vkey for polyedge in polyedges for vkey in set(polyedge)]
-        split_vertices = [vkey for vkey in self.vertices() if vertices.count(vkey) > 1]
+        split_vertices = self._polyedges_split_vertices(keys)
         
         # split singularity polyedges
-        return [split_polyedge for polyedge in polyedges for split_polyedge in list_split(polyedge, [polyedge.index(vkey) for vkey in split_vertices if vkey in polyedge])]
+        return self._split_polyedges(polyedges, split_vertices)
 
     # def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
     #     """Add a face to the mesh object. Allow [a, b, c, c] faces.
@@ -1,24 +1,27 @@
 from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
 from compas_pattern.datastructures.mesh_quad_pseudo.mesh_quad_pseudo import PseudoQuadMesh
 
-from compas.geometry import discrete_coons_patch
-from compas.datastructures.mesh import meshes_join_and_weld
-
-from compas.utilities import geometric_key
-from compas.utilities import pairwise
-
 
 __all__ = [	'CoarsePseudoQuadMesh']
 
 
 class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
 
+	dense_quad_mesh_type = PseudoQuadMesh
+
 	def __init__(self):
 		super(CoarsePseudoQuadMesh, self).__init__()
 
 	
-	def densification(self):
+	def densification(self, workers=None):
 		"""Generate a denser quad mesh from the coarse quad mesh and its strip densities.
+		The patches of the faces share the dense vertices of their coarse vertices and edges, which are also stored as child-parent element data.
+		After changing only strip densities, the patches along the strips with a new density are updated in place, as in CoarseQuadMesh.densification.
+
+		Parameters
+		----------
+		workers : int, optional
+			A number of processes to generate the face patches in parallel. Default is None, in the current process.
 
 		Returns
 		-------
@@ -27,54 +30,46 @@ class CoarsePseudoQuadMesh(PseudoQuadMesh, CoarseQuadMesh):
 
 		"""
 
-		edge_strip = {}
-		for skey, edges in self.strips(data=True):
-		    for edge in edges:
-		        edge_strip[edge] = skey
-		        edge_strip[tuple(reversed(edge))] = skey
-
-		pole_map = tuple([geometric_key(self.vertex_coordinates(pole)) for pole in self.poles()])
-
-		meshes = []
-		for fkey in self.faces():
-			polylines = [[self.edge_point(u, v, float(i) / float(self.get_strip_density(edge_strip[(u, v)]))) for i in range(0, self.get_strip_density(edge_strip[(u, v)]) + 1)] for u, v in self.face_halfedges(fkey)]
-			if self.is_face_pseudo_quad(fkey):
-				pole = self.data['attributes']['face_pole'][fkey]
-				idx = self.face_vertices(fkey).index(pole)
-				polylines.insert(idx, None)
-			ab, bc, cd, da = polylines
-			if cd is not None:
-				dc = list(reversed(cd))
-			else:
-				dc = None
-			if da is not None:
-				ad = list(reversed(da))
-			else:
-				ad = None
-			vertices, faces = discrete_coons_patch(ab, bc, dc, ad)
-			faces = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
-			mesh = PseudoQuadMesh.from_vertices_and_faces_with_face_poles(vertices, faces)
-			meshes.append(mesh)
-		
-		face_pole_map = {}
-		for mesh in meshes:
-			for fkey in mesh.faces():
-				for u, v in pairwise(mesh.face_vertices(fkey) + mesh.face_vertices(fkey)[: 1]):
-					if geometric_key(mesh.vertex_coordinates(u)) in pole_map and geometric_key(mesh.vertex_coordinates(u)) == geometric_key(mesh.vertex_coordinates(v)):
-						face_pole_map[geometric_key(mesh.face_center(fkey))] = geometric_key(mesh.vertex_coordinates(u))
-						break
-
-		self.set_quad_mesh(meshes_join_and_weld(meshes))
-
-		face_pole = {}
-		for fkey in self.get_quad_mesh().faces():
-			if geometric_key(self.get_quad_mesh().face_center(fkey)) in face_pole_map:
-				for vkey in self.get_quad_mesh().face_vertices(fkey):
-					if geometric_key(self.get_quad_mesh().vertex_coordinates(vkey)) == face_pole_map[geometric_key(self.get_quad_mesh().face_center(fkey))]:
-						face_pole[fkey] = vkey
-						break
-		self.get_quad_mesh().data['attributes']['face_pole'] = face_pole
+		super(CoarsePseudoQuadMesh, self).densification(workers)
 		return self.get_quad_mesh()
+
+	def update_dense_face_data(self, old_fkeys, face_dense_faces):
+		"""Update the poles of the pseudo-quads of the dense quad mesh after the densification of some patches.
+		The pseudo-quads are the faces of the patches of coarse pseudo-quads along their collapsed side, whose pole is the dense vertex of the coarse pole.
+
+		Parameters
+		----------
+		old_fkeys : list
+			The keys of the deleted dense faces.
+		face_dense_faces : dict
+			The coarse faces with a new patch pointing to the keys of their dense faces.
+
+		"""
+
+		quad_mesh = self.get_quad_mesh()
+		for fkey in old_fkeys:
+			quad_mesh.delete_face_pole(fkey)
+
+		face_pole = self.attributes['face_pole']
+		for fkey, dense_fkeys in face_dense_faces.items():
+			if fkey not in face_pole:
+				continue
+			pole = self.coarse_vertex_dense_vertex(face_pole[fkey])
+			for dense_fkey in dense_fkeys:
+				vertices = quad_mesh.face_vertices(dense_fkey)
+				if len(vertices) == 3 and pole in vertices:
+					quad_mesh.set_face_pole(dense_fkey, pole)
+
+	def densification_face_vertices(self, fkey):
+		"""Return the four vertices of the patch of a face in the densification, with the pole repeated in pseudo-quads.
+		"""
+
+		vertices = self.face_vertices(fkey)
+		if self.is_face_pseudo_quad(fkey):
+			pole = self.attributes['face_pole'][fkey]
+			idx = vertices.index(pole)
+			vertices = vertices[: idx + 1] + [pole] + vertices[idx + 1:]
+		return vertices
 	
 
 # ==============================================================================
@@ -104,9 +99,9 @@ if __name__ == '__main__':
 	mesh.collect_strips()
 	mesh.set_strips_density(2)
 	mesh.densification()
-	dense_mesh = mesh.get_quad_mesh()
+	dense_mesh = mesh.peek_quad_mesh()
 	mesh.set_quad_mesh(mesh_weld(dense_mesh, precision='1f'))
-	dense_mesh = mesh.get_quad_mesh()
+	dense_mesh = mesh.peek_quad_mesh()
 	# # print(mesh_weld(dense_mesh, precision='2f').is_manifold())
 	print(mesh.is_manifold())
 	print(dense_mesh.is_manifold())
@@ -18,6 +18,19 @@ Coloring elements based on their topology.
     is_adjacency_two_colorable
 
 
+Components
+====
+
+Connected components of graphs.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    UnionFind
+    union_find_components
+
+
 """
 
 from __future__ import absolute_import
@@ -25,6 +38,7 @@ from __future__ import division
 from __future__ import print_function
 
 from .coloring import *
+from .components import *
 
 __all__ = [name for name in dir() if not name.startswith('_')]
 
@@ -0,0 +1,94 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+__all__ = [
+	'UnionFind',
+	'union_find_components'
+]
+
+
+class UnionFind(object):
+	"""A union-find of hashable keys, to merge them in groups incrementally without building an adjacency or a network.
+	The keys that are not in the union-find yet are added on their own when they are first found.
+
+	Parameters
+	----------
+	keys : list, optional
+		The initial keys.
+
+	Attributes
+	----------
+	parent : dict
+		The keys pointing to their parent, the roots pointing to themselves.
+
+	"""
+
+	def __init__(self, keys=None):
+		self.parent = {key: key for key in keys} if keys is not None else {}
+
+	def find(self, key):
+		"""Return the root of the group of a key.
+		"""
+
+		parent = self.parent
+		parent.setdefault(key, key)
+		# path halving
+		while parent[key] != key:
+			parent[key] = parent[parent[key]]
+			key = parent[key]
+		return key
+
+	def union(self, u, v):
+		"""Merge the groups of two keys, under the root of the second one.
+		"""
+
+		root_u = self.find(u)
+		root_v = self.find(v)
+		if root_u != root_v:
+			self.parent[root_u] = root_v
+
+
+def union_find_components(keys, edges):
+	"""Compute the connected components of a graph with a union-find, without building an adjacency or a network.
+	The components are listed in the same order as by compas.topology.connected_components on an adjacency with the keys in the same order, although the keys of each component may be in another order.
+
+	Parameters
+	----------
+	keys : list
+		The keys of the graph vertices.
+	edges : list
+		The graph edges as pairs of vertex keys.
+
+	Returns
+	-------
+	list
+		The components as lists of vertex keys.
+
+	"""
+
+	union_find = UnionFind(keys)
+	for u, v in edges:
+		union_find.union(u, v)
+
+	members = {}
+	for key in keys:
+		members.setdefault(union_find.find(key), []).append(key)
+
+	# the same sequence of roots as connected_components, which pops them from a set built from a dictionary of the keys
+	components = []
+	tovisit = set(union_find.parent)
+	while tovisit:
+		component = members[union_find.find(tovisit.pop())]
+		tovisit.difference_update(component)
+		components.append(list(set(component)))
+	return components
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	print(union_find_components([0, 1, 2, 3, 4], [(0, 1), (3, 4)]))
@@ -35,6 +35,42 @@ Some utilities to extract Pareto fronts.
     is_dominating
 
 
+Copy-on-write
+====
+
+A reference sharing an object until it is modified.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    CopyOnWrite
+
+
+Persistent
+====
+
+An immutable map sharing its unchanged data with the maps derived from it.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    PersistentMap
+
+
+Versioned
+====
+
+A dictionary counting the modifications of its items.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    VersionedDict
+
+
 """
 
 from __future__ import absolute_import
@@ -43,6 +79,9 @@ from __future__ import print_function
 
 from .lists import *
 from .pareto import *
+from .copy_on_write import *
+from .persistent import *
+from .versioned_dict import *
 
 __all__ = [name for name in dir() if not name.startswith('_')]
 
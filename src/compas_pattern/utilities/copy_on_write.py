@@ -0,0 +1,103 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from weakref import WeakSet
+
+__all__ = [
+	'CopyOnWrite'
+]
+
+
+class CopyOnWrite(object):
+	"""A copy-on-write reference to an object with a copy method, such as a mesh.
+	The references shared with share, or through a deep copy, point to the same object until it is accessed for modification through one of them.
+	This reference then points to its own copy of the object, and the other references keep sharing the former one.
+
+	Parameters
+	----------
+	value : object
+		The referenced object.
+
+	"""
+
+	def __init__(self, value):
+		self._value = value
+		# the references pointing to the same object, dropped when collected
+		self._sharing = WeakSet([self])
+
+	def __deepcopy__(self, memo):
+		reference = self.share()
+		memo[id(self)] = reference
+		return reference
+
+	def share(self):
+		"""Return a new reference sharing the object.
+
+		Returns
+		-------
+		CopyOnWrite
+			A reference to the same object.
+
+		"""
+
+		reference = CopyOnWrite.__new__(CopyOnWrite)
+		reference._value = self._value
+		reference._sharing = self._sharing
+		self._sharing.add(reference)
+		return reference
+
+	def is_shared(self):
+		"""Check if the object is shared with other references.
+
+		Returns
+		-------
+		bool
+			True if other references point to the same object, False otherwise.
+
+		"""
+
+		return len(self._sharing) > 1
+
+	def peek(self):
+		"""Return the object without copying it, for reading only.
+
+		Returns
+		-------
+		object
+			The referenced object, which may be shared.
+
+		"""
+
+		return self._value
+
+	def get(self):
+		"""Return the object for modification, after copying it if it is shared.
+
+		Returns
+		-------
+		object
+			The referenced object, which is not shared with other references.
+
+		"""
+
+		if self.is_shared():
+			self._sharing.discard(self)
+			self._value = self._value.copy()
+			self._sharing = WeakSet([self])
+		return self._value
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	from copy import deepcopy
+
+	a = CopyOnWrite([1, 2, 3])
+	b = deepcopy(a)
+	print(a.peek() is b.peek(), a.is_shared())
+	b.get().append(4)
+	print(a.peek(), b.peek(), a.is_shared())
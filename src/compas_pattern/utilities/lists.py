@@ -42,7 +42,7 @@ def list_split(l, indices):
     else:
         closed = False
 
-    indices = list(sorted(set(indices)))
+    indices = set(indices)
 
     split_lists = []
     current_list = []
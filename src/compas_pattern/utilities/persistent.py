@@ -0,0 +1,282 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+__all__ = [
+	'PersistentMap'
+]
+
+
+# the nodes of the trie branch on 5 bits of the key hashes and end in buckets of a few items, split in a deeper node when full
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_BUCKET_SIZE = 8
+# the buckets past the bits of the 64-bit hashes hold all the keys with the same hash
+_MAX_LEVEL = 64 // _BITS
+
+_MISSING = object()
+
+
+class PersistentMap(object):
+	"""An immutable map sharing its unchanged nodes with the maps derived from it.
+	The items are stored in a trie over the key hashes, whose buckets are split in deeper nodes as they fill up, so that the trie grows with the derived maps.
+	Setting or deleting items copies the path to their buckets only, the rest of the trie being shared with the former map.
+	The items are not iterated in insertion order.
+
+	Parameters
+	----------
+	items : dict or list, optional
+		The items of the map, as a dictionary or a list of key-value pairs.
+
+	"""
+
+	__slots__ = ('_root', '_size')
+
+	def __init__(self, items=None):
+		items = dict(items) if items else {}
+		self._root = [None] * _WIDTH
+		self._size = 0
+		owned = set([id(self._root)])
+		for key, value in items.items():
+			self._size += _set(self._root, owned, key, value)
+
+	@classmethod
+	def _from_root(cls, root, size):
+		persistent_map = cls.__new__(cls)
+		persistent_map._root = root
+		persistent_map._size = size
+		return persistent_map
+
+	def __len__(self):
+		return self._size
+
+	def __contains__(self, key):
+		return _get(self._root, key, _MISSING) is not _MISSING
+
+	def __getitem__(self, key):
+		value = _get(self._root, key, _MISSING)
+		if value is _MISSING:
+			raise KeyError(key)
+		return value
+
+	def __iter__(self):
+		for key, value in self.items():
+			yield key
+
+	def __repr__(self):
+		return '{}({})'.format(self.__class__.__name__, self.to_dict())
+
+	def get(self, key, default=None):
+		"""Return the value of a key, or a default value if the key is not in the map.
+
+		Parameters
+		----------
+		key : hashable
+			The key.
+		default : object, optional
+			The default value.
+
+		Returns
+		-------
+		object
+			The value of the key or the default value.
+
+		"""
+
+		return _get(self._root, key, default)
+
+	def keys(self):
+		"""Iterate over the keys of the map.
+		"""
+
+		for key, value in self.items():
+			yield key
+
+	def values(self):
+		"""Iterate over the values of the map.
+		"""
+
+		for key, value in self.items():
+			yield value
+
+	def items(self):
+		"""Iterate over the items of the map.
+		"""
+
+		return _items(self._root)
+
+	def set(self, key, value):
+		"""Return a map with an item set.
+
+		Parameters
+		----------
+		key : hashable
+			The key.
+		value : object
+			The value.
+
+		Returns
+		-------
+		PersistentMap
+			The new map, sharing the other items with this one.
+
+		"""
+
+		return self.update({key: value})
+
+	def delete(self, key):
+		"""Return a map without an item.
+
+		Parameters
+		----------
+		key : hashable
+			The key, which must be in the map.
+
+		Returns
+		-------
+		PersistentMap
+			The new map, sharing the other items with this one.
+
+		"""
+
+		if key not in self:
+			raise KeyError(key)
+		return self.update(deleted=[key])
+
+	def update(self, items=None, deleted=None):
+		"""Return a map with several items set and deleted, copying each modified node once.
+		Items set to their current value are left shared.
+
+		Parameters
+		----------
+		items : dict or list, optional
+			The items to set, as a dictionary or a list of key-value pairs.
+		deleted : list, optional
+			The keys to delete. Keys not in the map are ignored.
+
+		Returns
+		-------
+		PersistentMap
+			The new map, sharing the other items with this one.
+
+		"""
+
+		if hasattr(items, 'items'):
+			items = items.items()
+		root = list(self._root)
+		owned = set([id(root)])
+		size = self._size
+		for key, value in items or []:
+			if _get(root, key, _MISSING) is value:
+				continue
+			size += _set(root, owned, key, value)
+		for key in deleted or []:
+			if _get(root, key, _MISSING) is not _MISSING:
+				size -= _delete(root, owned, key)
+		return PersistentMap._from_root(root, size)
+
+	def to_dict(self):
+		"""Return the items of the map as a dictionary.
+
+		Returns
+		-------
+		dict
+			The items.
+
+		"""
+
+		return dict(self.items())
+
+
+def _get(root, key, default):
+	node = root
+	h = hash(key)
+	level = 0
+	while isinstance(node, list):
+		node = node[(h >> (_BITS * level)) & _MASK]
+		if node is None:
+			return default
+		level += 1
+	return node.get(key, default)
+
+
+def _path(root, owned, key):
+	# the node holding the bucket of a key, its slot and its level, after copying the nodes on its path that are not owned by the map being built
+	node = root
+	h = hash(key)
+	level = 0
+	while True:
+		slot = (h >> (_BITS * level)) & _MASK
+		child = node[slot]
+		if child is None:
+			child = {}
+			owned.add(id(child))
+			node[slot] = child
+		elif id(child) not in owned:
+			child = dict(child) if isinstance(child, dict) else list(child)
+			owned.add(id(child))
+			node[slot] = child
+		if isinstance(child, dict):
+			return node, slot, level
+		node = child
+		level += 1
+
+
+def _split(bucket, level, owned):
+	# the node of the items of a full bucket at the next level, splitting its own full buckets as well
+	node = [None] * _WIDTH
+	owned.add(id(node))
+	for key, value in bucket.items():
+		slot = (hash(key) >> (_BITS * level)) & _MASK
+		if node[slot] is None:
+			node[slot] = {}
+			owned.add(id(node[slot]))
+		node[slot][key] = value
+	if level < _MAX_LEVEL:
+		for slot, child in enumerate(node):
+			if child is not None and len(child) > _BUCKET_SIZE:
+				node[slot] = _split(child, level + 1, owned)
+	return node
+
+
+def _set(root, owned, key, value):
+	node, slot, level = _path(root, owned, key)
+	bucket = node[slot]
+	is_new = key not in bucket
+	bucket[key] = value
+	if len(bucket) > _BUCKET_SIZE and level < _MAX_LEVEL:
+		node[slot] = _split(bucket, level + 1, owned)
+	return int(is_new)
+
+
+def _delete(root, owned, key):
+	node, slot, level = _path(root, owned, key)
+	bucket = node[slot]
+	del bucket[key]
+	if len(bucket) == 0:
+		node[slot] = None
+	return 1
+
+
+def _items(node):
+	if isinstance(node, dict):
+		for item in node.items():
+			yield item
+		return
+	for child in node:
+		if child is not None:
+			for item in _items(child):
+				yield item
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	a = PersistentMap({i: i ** 2 for i in range(10000)})
+	b = a.update({3: 0, 10000: 1}, deleted=[4])
+	print(len(a), len(b), a[3], b[3], 4 in a, 4 in b, b[10000])
+	print(a._root[5] is b._root[5], a._root[3] is b._root[3])
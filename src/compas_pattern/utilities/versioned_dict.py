@@ -0,0 +1,70 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+__all__ = [
+	'VersionedDict'
+]
+
+
+class VersionedDict(dict):
+	"""A dictionary counting the assignments and deletions of its items, to check the validity of the data derived from it.
+	The modifications of the values in place, for instance appending to a list value, are not counted.
+
+	Attributes
+	----------
+	version : int
+		A counter incremented by each assignment or deletion of items.
+
+	"""
+
+	version = 0
+
+	def __setitem__(self, key, value):
+		self.version += 1
+		super(VersionedDict, self).__setitem__(key, value)
+
+	def __delitem__(self, key):
+		self.version += 1
+		super(VersionedDict, self).__delitem__(key)
+
+	def __ior__(self, other):
+		self.update(other)
+		return self
+
+	def pop(self, key, *default):
+		self.version += 1
+		return super(VersionedDict, self).pop(key, *default)
+
+	def popitem(self):
+		self.version += 1
+		return super(VersionedDict, self).popitem()
+
+	def setdefault(self, key, default=None):
+		if key not in self:
+			self.version += 1
+		return super(VersionedDict, self).setdefault(key, default)
+
+	def update(self, *args, **kwargs):
+		self.version += 1
+		super(VersionedDict, self).update(*args, **kwargs)
+
+	def clear(self):
+		self.version += 1
+		super(VersionedDict, self).clear()
+
+	def copy(self):
+		return VersionedDict(self)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+	strips = VersionedDict({0: [(0, 1)]})
+	print(strips.version)
+	strips[1] = [(1, 2)]
+	del strips[0]
+	print(strips, strips.version)
@@ -0,0 +1,28 @@
+import pytest
+
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+
+
+def _grid_quad_mesh(n, m=None, cls=QuadMesh):
+    m = m or n
+    vertices = [[float(i), float(j), 0.0] for j in range(m + 1) for i in range(n + 1)]
+    faces = [[j * (n + 1) + i, j * (n + 1) + i + 1, (j + 1) * (n + 1) + i + 1, (j + 1) * (n + 1) + i] for j in range(m) for i in range(n)]
+    mesh = cls.from_vertices_and_faces(vertices, faces)
+    mesh.collect_strips()
+    return mesh
+
+
+@pytest.fixture
+def grid_quad_mesh():
+    """Factory of grid quad meshes with n x m faces and their strips."""
+    return _grid_quad_mesh
+
+
+@pytest.fixture
+def irregular_quad_mesh():
+    """Quad mesh with singularities and its strips."""
+    vertices = [[1.9, 11.2, 0.0], [9.7, 9.0, 0.0], [4.3, 4.7, 0.0], [3.8, 13.2, 0.0], [1.9, 13.2, 0.0], [4.7, 2.2, 0.0], [5.7, 9.4, 0.0], [9.1, 6.4, 0.0], [14.2, 5.2, 0.0], [14.2, 2.2, 0.0], [14.2, 13.2, 0.0], [1.9, 2.2, 0.0], [4.1, 10.9, 0.0], [11.5, 5.0, 0.0], [11.4, 2.2, 0.0], [5.7, 6.7, 0.0], [14.2, 10.2, 0.0], [1.9, 4.2, 0.0], [11.4, 13.2, 0.0], [11.7, 10.6, 0.0]]
+    faces = [[7, 15, 2, 13], [15, 6, 12, 2], [6, 1, 19, 12], [1, 7, 13, 19], [8, 16, 19, 13], [16, 10, 18, 19], [18, 3, 12, 19], [3, 4, 0, 12], [0, 17, 2, 12], [17, 11, 5, 2], [5, 14, 13, 2], [14, 9, 8, 13]]
+    mesh = QuadMesh.from_vertices_and_faces(vertices, faces)
+    mesh.collect_strips()
+    return mesh
@@ -0,0 +1,29 @@
+from compas_pattern.datastructures.mesh_quad_coarse.coarse_to_dense import CoarseToDense
+
+
+def test_polyedges():
+    coarse_to_dense = CoarseToDense()
+    coarse_to_dense.set_polyedge(0, 1, [0, 4, 5, 1])
+    coarse_to_dense.set_polyedge(2, 1, [2, 6, 1])
+    assert coarse_to_dense.has_edge(1, 0)
+    assert coarse_to_dense.polyedge(1, 0) == [1, 5, 4, 0]
+    assert coarse_to_dense.polyedge_length(1, 2) == 3
+    # the same length is replaced in place and another length appended
+    coarse_to_dense.set_polyedge(1, 0, [1, 7, 8, 0])
+    assert coarse_to_dense.polyedge(0, 1) == [0, 8, 7, 1]
+    coarse_to_dense.set_polyedge(1, 2, [1, 9, 10, 2])
+    assert coarse_to_dense.polyedge(2, 1) == [2, 10, 9, 1]
+    assert coarse_to_dense._garbage == 3
+    coarse_to_dense.compact()
+    assert coarse_to_dense._garbage == 0
+    assert coarse_to_dense.polyedge(0, 1) == [0, 8, 7, 1]
+    assert coarse_to_dense.polyedge(1, 2) == [1, 9, 10, 2]
+
+
+def test_data():
+    coarse_to_dense = CoarseToDense.from_dicts({0: 0, 1: 1, 2: 2}, {0: {1: [0, 3, 1]}, 2: {1: [2, 4, 1]}})
+    assert coarse_to_dense.polyedge(1, 2) == [1, 4, 2]
+    coarse_to_dense = CoarseToDense.from_data(coarse_to_dense.to_data())
+    assert coarse_to_dense.vertices == {0: 0, 1: 1, 2: 2}
+    assert sorted(coarse_to_dense.edges()) == [(0, 1), (2, 1)]
+    assert coarse_to_dense.polyedge(1, 0) == [1, 3, 0]
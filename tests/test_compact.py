@@ -0,0 +1,62 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from compas_pattern.datastructures.mesh_quad_compact.mesh_quad_compact import CompactQuadMesh
+
+
+def test_compact_halfedges(irregular_quad_mesh):
+    mesh = CompactQuadMesh.from_quad_mesh(irregular_quad_mesh)
+    h = np.arange(mesh.number_of_halfedges())
+    assert (mesh.halfedge_twin[mesh.halfedge_twin] == h).all()
+    assert (mesh.halfedge_edge == mesh.halfedge_edge[mesh.halfedge_twin]).all()
+    assert mesh.number_of_edges() == irregular_quad_mesh.number_of_edges()
+    # the next halfedge starts at the end of the halfedge
+    u, v = mesh.halfedge_vertices(h)
+    assert (v == mesh.halfedge_vertex[mesh.halfedge_twin]).all()
+    boundary = mesh.halfedge_face < 0
+    assert (mesh.halfedge_face[mesh.halfedge_next[boundary]] < 0).all()
+
+
+def test_compact_vertex_classification(irregular_quad_mesh):
+    mesh = CompactQuadMesh.from_quad_mesh(irregular_quad_mesh)
+    assert mesh.vertex_degrees().tolist() == [irregular_quad_mesh.vertex_degree(vkey) for vkey in mesh.vertex_keys]
+    assert mesh.vertices_on_boundary().tolist() == [irregular_quad_mesh.is_vertex_on_boundary(vkey) for vkey in mesh.vertex_keys]
+    assert [mesh.vertex_keys[i] for i in mesh.singularities()] == irregular_quad_mesh.singularities()
+
+
+def _edge_sets(edge_lists):
+    return sorted(sorted(set(tuple(sorted(edge)) for edge in edges)) for edges in edge_lists)
+
+
+def test_compact_strips_and_polyedges(irregular_quad_mesh):
+    irregular_quad_mesh.collect_polyedges()
+    mesh = CompactQuadMesh.from_quad_mesh(irregular_quad_mesh)
+    assert mesh.number_of_strips() == irregular_quad_mesh.number_of_strips()
+    strips = [[(mesh.vertex_keys[u], mesh.vertex_keys[v]) for u, v in mesh.strip_edges(i)] for i in range(mesh.number_of_strips())]
+    assert _edge_sets(strips) == _edge_sets(edges for skey, edges in irregular_quad_mesh.strips(data=True))
+    polyedges = [[mesh.vertex_keys[i] for i in mesh.polyedge(j)] for j in range(mesh.number_of_polyedges())]
+    assert sorted(map(sorted, polyedges)) == sorted(sorted(polyedge) for key, polyedge in irregular_quad_mesh.polyedges(data=True))
+
+
+def test_compact_round_trip(irregular_quad_mesh):
+    mesh = CompactQuadMesh.from_quad_mesh(irregular_quad_mesh)
+    mesh.strips()
+    quad_mesh = mesh.to_quad_mesh()
+    assert [quad_mesh.face_vertices(fkey) for fkey in quad_mesh.faces()] == [irregular_quad_mesh.face_vertices(fkey) for fkey in irregular_quad_mesh.faces()]
+    assert quad_mesh.vertex_coordinates(0) == irregular_quad_mesh.vertex_coordinates(0)
+    assert quad_mesh.number_of_strips() == irregular_quad_mesh.number_of_strips()
+
+
+def test_compact_boundary_at_vertex_shared_by_two_fans():
+    # two quads sharing the vertex 2 only
+    mesh = CompactQuadMesh.from_vertices_and_faces([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]], [[0, 1, 2, 3], [2, 4, 5, 6]])
+    assert sorted(mesh.halfedge_next.tolist()) == list(range(mesh.number_of_halfedges()))
+    boundary = np.nonzero(mesh.halfedge_face < 0)[0]
+    # each boundary loop goes around one face
+    for h in boundary:
+        loop = [h]
+        while mesh.halfedge_next[loop[-1]] != h:
+            loop.append(mesh.halfedge_next[loop[-1]])
+        assert len(loop) == 4
+        assert len(set(mesh.halfedge_face[mesh.halfedge_twin[loop]].tolist())) == 1
@@ -0,0 +1,41 @@
+from copy import deepcopy
+
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+from compas_pattern.utilities.copy_on_write import CopyOnWrite
+
+
+def test_copy_on_write_reference():
+    a = CopyOnWrite([1, 2, 3])
+    b = deepcopy(a)
+    assert a.is_shared() and a.peek() is b.peek()
+    b.get().append(4)
+    assert a.peek() == [1, 2, 3] and b.peek() == [1, 2, 3, 4]
+    assert not a.is_shared()
+
+
+def test_peek_does_not_copy_shared_meshes(irregular_quad_mesh):
+    dense_mesh = irregular_quad_mesh
+    mesh = CoarseQuadMesh.from_quad_mesh(dense_mesh)
+    assert mesh.peek_quad_mesh() is dense_mesh
+    assert mesh.peek_polygonal_mesh() is dense_mesh
+    copy_mesh = mesh.copy()
+    assert copy_mesh.peek_quad_mesh() is dense_mesh
+
+
+def test_get_copies_shared_meshes(irregular_quad_mesh):
+    dense_mesh = irregular_quad_mesh
+    mesh = CoarseQuadMesh.from_quad_mesh(dense_mesh)
+    polygonal_mesh = mesh.get_polygonal_mesh()
+    assert polygonal_mesh is not dense_mesh
+    polygonal_mesh.vertex[0]['x'] += 1.0
+    assert mesh.peek_quad_mesh().vertex_coordinates(0) != polygonal_mesh.vertex_coordinates(0)
+    # the quad mesh is not shared anymore
+    assert mesh.get_quad_mesh() is dense_mesh
+
+
+def test_from_quad_mesh_copy_keeps_the_argument_independent(irregular_quad_mesh):
+    dense_mesh = irregular_quad_mesh
+    mesh = CoarseQuadMesh.from_quad_mesh(dense_mesh.copy())
+    x = mesh.peek_polygonal_mesh().vertex[5]['x']
+    dense_mesh.vertex[5]['x'] = 99.0
+    assert mesh.peek_polygonal_mesh().vertex[5]['x'] == mesh.peek_quad_mesh().vertex[5]['x'] == x
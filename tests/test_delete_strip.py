@@ -0,0 +1,36 @@
+import itertools
+
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strips
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strips_at_once
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import strip_edge_network
+from compas_pattern.topology.components import UnionFind
+from compas_pattern.topology.components import union_find_components
+
+
+def test_union_find():
+    union_find = UnionFind([0, 1, 2])
+    union_find.union(0, 1)
+    union_find.union(3, 4)
+    assert union_find.find(0) == union_find.find(1) != union_find.find(2)
+    assert union_find.find(3) == union_find.find(4)
+    assert sorted(sorted(component) for component in union_find_components([0, 1, 2, 3, 4], [(0, 1), (3, 4)])) == [[0, 1], [2], [3, 4]]
+
+
+def test_delete_strips_at_once_as_one_by_one(irregular_quad_mesh):
+    for skeys in itertools.combinations(irregular_quad_mesh.strips(), 2):
+        mesh_1 = irregular_quad_mesh.copy()
+        delete_strips(mesh_1, skeys)
+        mesh_2 = irregular_quad_mesh.copy()
+        delete_strips_at_once(mesh_2, skeys)
+        assert mesh_1.number_of_vertices() == mesh_2.number_of_vertices()
+        assert mesh_1.number_of_faces() == mesh_2.number_of_faces()
+        assert mesh_1.number_of_strips() == mesh_2.number_of_strips()
+        assert mesh_1.euler() == mesh_2.euler()
+
+
+def test_strip_edge_network(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    skey = mesh.edge_strip((0, 1))
+    network = strip_edge_network(mesh, skey)
+    assert sorted(network.vertices()) == sorted(set(vkey for edge in mesh.strip_edges(skey) for vkey in edge))
+    assert network.number_of_edges() == len(mesh.strip_edges(skey))
@@ -0,0 +1,132 @@
+import pytest
+
+from compas_pattern.datastructures.mesh_quad_coarse import mesh_quad_coarse
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import densify_patches
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import densify_patches_in_parallel
+from compas_pattern.datastructures.mesh_quad_pseudo_coarse.mesh_quad_pseudo_coarse import CoarsePseudoQuadMesh
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+
+
+@pytest.fixture
+def coarse_quad_mesh(grid_quad_mesh):
+    mesh = grid_quad_mesh(3, 2, cls=CoarseQuadMesh)
+    mesh.set_strips_density(3)
+    return mesh
+
+
+def test_parallel_densification_equals_serial(coarse_quad_mesh):
+    vertices, patches = coarse_quad_mesh.densification_patches()
+    assert densify_patches(vertices, patches, workers=2) == densify_patches(vertices, patches)
+
+
+def test_parallel_densification_without_shared_memory(coarse_quad_mesh, monkeypatch):
+    vertices, patches = coarse_quad_mesh.densification_patches()
+    expected = densify_patches(vertices, patches)
+    monkeypatch.setattr(mesh_quad_coarse, 'SharedMemory', None)
+    assert densify_patches(vertices, patches, workers=2) == expected
+
+
+def test_parallel_densification_raises_original_error(coarse_quad_mesh):
+    vertices, patches = coarse_quad_mesh.densification_patches()
+    # a patch side pointing to a missing vertex fails in the worker
+    n, m, sides, start = patches[0]
+    sides = [[len(vertices) * 10] + list(side[1:]) for side in sides]
+    patches[0] = (n, m, sides, start)
+    if mesh_quad_coarse.SharedMemory is None:
+        pytest.skip('no shared memory')
+    with pytest.raises(IndexError):
+        densify_patches_in_parallel(vertices, patches, 2)
+
+
+def test_numpy_densification_carries_poles_over():
+    pytest.importorskip('numpy')
+    from compas_pattern.datastructures.mesh_quad_compact.densification import densification_numpy
+    vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0]]
+    faces = [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 1]]
+    meshes = []
+    for i in range(2):
+        mesh = CoarsePseudoQuadMesh.from_vertices_and_faces_with_poles(vertices, faces, [[0.0, 0.0, 0.0]])
+        mesh.collect_strips()
+        mesh.set_strips_density(3)
+        meshes.append(mesh)
+    expected = meshes[0].densification()
+    dense_mesh = densification_numpy(meshes[1])
+    assert len(dense_mesh.attributes['face_pole']) == 4 * 3
+    assert dense_mesh.attributes['face_pole'] == expected.attributes['face_pole']
+    assert [dense_mesh.face_vertices(fkey) for fkey in dense_mesh.faces()] == [expected.face_vertices(fkey) for fkey in expected.faces()]
+
+
+def test_numpy_densification_rejects_poles_without_pseudo_quads():
+    pytest.importorskip('numpy')
+    from compas_pattern.datastructures.mesh_quad_compact.densification import densification_numpy
+    mesh = CoarsePseudoQuadMesh.from_vertices_and_faces_with_poles([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], [[0, 1, 2]], [[0.0, 0.0, 0.0]])
+    mesh.collect_strips()
+    mesh.set_strips_density(2)
+    with pytest.raises(ValueError):
+        densification_numpy(mesh, cls=QuadMesh)
+
+
+def _faces_coordinates(mesh):
+    # the faces as sets of rounded vertex coordinates, independently of the vertex keys
+    return sorted(sorted(tuple(round(x, 6) for x in mesh.vertex_coordinates(vkey)) for vkey in mesh.face_vertices(fkey)) for fkey in mesh.faces())
+
+
+def test_densification_welds_patches(coarse_quad_mesh):
+    coarse_quad_mesh.densification()
+    dense_mesh = coarse_quad_mesh.get_quad_mesh()
+    assert dense_mesh.number_of_vertices() == 10 * 7
+    assert dense_mesh.number_of_faces() == 9 * 6
+    assert len(set(tuple(round(x, 6) for x in dense_mesh.vertex_coordinates(vkey)) for vkey in dense_mesh.vertices())) == 10 * 7
+    for u, v in coarse_quad_mesh.edges():
+        polyedge = coarse_quad_mesh.coarse_edge_dense_edges(u, v)
+        assert polyedge[0] == coarse_quad_mesh.coarse_vertex_dense_vertex(u)
+        assert polyedge[-1] == coarse_quad_mesh.coarse_vertex_dense_vertex(v)
+
+
+def test_incremental_densification_equals_full_densification(coarse_quad_mesh):
+    coarse_quad_mesh.densification()
+    dense_mesh = coarse_quad_mesh.get_quad_mesh()
+    skey = next(coarse_quad_mesh.strips())
+    coarse_quad_mesh.set_strip_density(skey, 5)
+    assert coarse_quad_mesh.densification_changed_strips() == [skey]
+    coarse_quad_mesh.densification()
+    assert coarse_quad_mesh.get_quad_mesh() is dense_mesh
+    expected = coarse_quad_mesh.copy()
+    expected._densification = None
+    expected.densification()
+    assert _faces_coordinates(dense_mesh) == _faces_coordinates(expected.get_quad_mesh())
+
+
+def test_densification_after_topological_modification(coarse_quad_mesh):
+    coarse_quad_mesh.densification()
+    coarse_quad_mesh.delete_face(0)
+    assert coarse_quad_mesh.densification_changed_strips() is None
+
+
+def test_numpy_densification_equals_densification(coarse_quad_mesh):
+    pytest.importorskip('numpy')
+    from compas_pattern.datastructures.mesh_quad_compact.densification import densification_numpy
+    dense_mesh = densification_numpy(coarse_quad_mesh)
+    coarse_quad_mesh.densification()
+    expected = coarse_quad_mesh.get_quad_mesh()
+    assert [dense_mesh.face_vertices(fkey) for fkey in dense_mesh.faces()] == [expected.face_vertices(fkey) for fkey in expected.faces()]
+    assert all(dense_mesh.vertex_coordinates(vkey) == pytest.approx(expected.vertex_coordinates(vkey)) for vkey in expected.vertices())
+
+
+def test_from_quad_mesh():
+    vertices = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0], [0.0, 3.0, 0.0], [1.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+    faces = [[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+    coarse_quad_mesh = CoarseQuadMesh.from_vertices_and_faces(vertices, faces)
+    coarse_quad_mesh.collect_strips()
+    coarse_quad_mesh.set_strips_density(3)
+    coarse_quad_mesh.densification()
+    dense_mesh = coarse_quad_mesh.get_quad_mesh()
+    dense_mesh.collect_strips()
+    mesh = CoarseQuadMesh.from_quad_mesh(dense_mesh)
+    assert mesh.number_of_vertices() == 8
+    assert mesh.number_of_faces() == 5
+    assert mesh.peek_quad_mesh() is dense_mesh
+    # the density attribute is the number of dense vertices along the strip edges
+    assert mesh.get_strip_densities() == {0: 4, 1: 4, 2: 4}
+    assert all(len(mesh.coarse_edge_dense_edges(u, v)) == 4 for u, v in mesh.edges())
@@ -0,0 +1,38 @@
+import pytest
+
+from compas_pattern.datastructures.mesh_quad_coarse.density import greedy_strips_density
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+
+
+@pytest.fixture
+def coarse_quad_mesh(grid_quad_mesh):
+    return grid_quad_mesh(3, 2, cls=CoarseQuadMesh)
+
+
+def _number_of_dense_faces(mesh, densities):
+    return sum(densities[i] * densities[j] for i, j in (mesh.face_strips(fkey) for fkey in mesh.faces()))
+
+
+def test_greedy_strips_density_target(coarse_quad_mesh):
+    # unit coarse edges for a target length of 0.25
+    assert set(greedy_strips_density(coarse_quad_mesh, target=0.25).values()) == set([4])
+    assert set(greedy_strips_density(coarse_quad_mesh, target=lambda xyz: 0.5).values()) == set([2])
+
+
+def test_greedy_strips_density_budget(coarse_quad_mesh):
+    densities = greedy_strips_density(coarse_quad_mesh, nb_faces=100)
+    assert _number_of_dense_faces(coarse_quad_mesh, densities) <= 100
+    assert _number_of_dense_faces(coarse_quad_mesh, densities) > 6 * 3 * 3
+    densities = greedy_strips_density(coarse_quad_mesh, target=0.1, nb_faces=24, min_density=2)
+    assert _number_of_dense_faces(coarse_quad_mesh, densities) == 24
+    assert min(densities.values()) == 2
+
+
+def test_greedy_strips_density_without_target_or_budget(coarse_quad_mesh):
+    with pytest.raises(ValueError):
+        greedy_strips_density(coarse_quad_mesh)
+
+
+def test_set_strips_density_greedy(coarse_quad_mesh):
+    coarse_quad_mesh.set_strips_density_greedy(target=0.5)
+    assert coarse_quad_mesh.get_strip_densities() == {skey: 2 for skey in coarse_quad_mesh.strips()}
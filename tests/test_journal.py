@@ -0,0 +1,69 @@
+from compas_pattern.datastructures.mesh_quad.grammar_pattern import add_strip
+from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
+from compas_pattern.algorithms.coloring.two_coloring import TwoColourableProjection
+
+
+def state(mesh):
+    return {
+        'vertices': [(vkey, dict(attr)) for vkey, attr in mesh.vertex.items()],
+        'faces': [(fkey, mesh.face_vertices(fkey)) for fkey in mesh.faces()],
+        'halfedge': [(u, list(nbrs.items())) for u, nbrs in mesh.halfedge.items()],
+        'edgedata': list(mesh.edgedata.items()),
+        'strips': [(skey, list(edges)) for skey, edges in mesh.strips(data=True)],
+        'max': (mesh._max_int_key, mesh._max_int_fkey),
+    }
+
+
+def test_rollback_restores_elements_and_order(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    before = state(mesh)
+    for skey in list(mesh.strips()):
+        mesh.begin_journal()
+        try:
+            delete_strips(mesh, [skey], preserve_boundaries=True)
+        finally:
+            mesh.rollback_journal()
+        assert state(mesh) == before
+
+
+def test_rollback_after_adding_strip(grid_quad_mesh):
+    mesh = grid_quad_mesh(3)
+    before = state(mesh)
+    mesh.begin_journal()
+    add_strip(mesh, [1, 5, 9, 13])
+    assert mesh.number_of_faces() > 9
+    mesh.rollback_journal()
+    assert state(mesh) == before
+
+
+def test_apply_redo_journal(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    before = state(mesh)
+    skey = list(mesh.strips())[0]
+    mesh.begin_journal()
+    delete_strips(mesh, [skey], preserve_boundaries=True)
+    after = state(mesh)
+    redo = mesh.rollback_journal()
+    undo = mesh.apply_journal(redo)
+    assert state(mesh) == after
+    mesh.apply_journal(undo)
+    assert state(mesh) == before
+
+
+def test_end_journal_keeps_modifications(grid_quad_mesh):
+    mesh = grid_quad_mesh(3)
+    mesh.begin_journal()
+    delete_strips(mesh, [list(mesh.strips())[0]])
+    journal = mesh.end_journal()
+    assert not mesh.is_journaling()
+    assert mesh.number_of_faces() == 6
+    mesh.apply_journal(journal)
+    assert mesh.number_of_faces() == 9
+
+
+def test_projection_leaves_input_mesh_untouched(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    before = state(mesh)
+    projection = TwoColourableProjection(mesh)
+    projection.projection(kmax=2)
+    assert state(mesh) == before
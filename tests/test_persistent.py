@@ -0,0 +1,56 @@
+from compas_pattern.utilities.persistent import PersistentMap
+
+
+def test_update_inserts_and_deletes():
+    a = PersistentMap({i: i ** 2 for i in range(1000)})
+    b = a.update({3: 0, 1000: 1}, deleted=[4, 2000])
+    assert len(a) == 1000 and len(b) == 1000
+    assert a[3] == 9 and b[3] == 0
+    assert 4 in a and 4 not in b
+    assert 1000 not in a and b[1000] == 1
+    assert b.to_dict() == dict([(i, i ** 2) for i in range(1000) if i not in (3, 4)] + [(3, 0), (1000, 1)])
+
+
+def test_update_shares_unchanged_nodes():
+    a = PersistentMap({i: [i] for i in range(1000)})
+    b = a.update({0: [1]})
+    assert sum([x is y for x, y in zip(a._root, b._root)]) == len(a._root) - 1
+    assert all([b[i] is a[i] for i in range(1, 1000)])
+    # the current values are left shared
+    assert a.update({1: a[1]})._root[1] is a._root[1]
+
+
+def test_trie_grows_with_derived_maps():
+    a = PersistentMap()
+    for i in range(10000):
+        a = a.set(i, i)
+    assert len(a) == 10000 and a.to_dict() == {i: i for i in range(10000)}
+    # the buckets are split instead of growing with the map
+    buckets = []
+    nodes = [a._root]
+    while nodes:
+        node = nodes.pop()
+        for child in node:
+            if isinstance(child, dict):
+                buckets.append(child)
+            elif child is not None:
+                nodes.append(child)
+    assert max([len(bucket) for bucket in buckets]) <= 32
+    for i in range(0, 10000, 2):
+        a = a.delete(i)
+    assert len(a) == 5000 and sorted(a.keys()) == list(range(1, 10000, 2))
+
+
+def test_keys_with_the_same_hash():
+    class Key(object):
+        def __init__(self, i):
+            self.i = i
+
+        def __hash__(self):
+            return 0
+
+        def __eq__(self, other):
+            return self.i == other.i
+
+    a = PersistentMap([(Key(i), i) for i in range(100)])
+    assert len(a) == 100 and all([a[Key(i)] == i for i in range(100)])
@@ -0,0 +1,79 @@
+import pytest
+
+from compas_pattern.datastructures.mesh_quad_pseudo.mesh_quad_pseudo import PseudoQuadMesh
+from compas_pattern.datastructures.mesh_quad_pseudo_coarse.mesh_quad_pseudo_coarse import CoarsePseudoQuadMesh
+from compas_pattern.utilities.versioned_dict import VersionedDict
+
+
+VERTICES = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0]]
+FACES = [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 1]]
+
+
+@pytest.fixture
+def coarse_pseudo_quad_mesh():
+    mesh = CoarsePseudoQuadMesh.from_vertices_and_faces_with_poles(VERTICES, FACES, [[0.0, 0.0, 0.0]])
+    mesh.collect_strips()
+    mesh.set_strips_density(3)
+    return mesh
+
+
+def test_pole_index():
+    mesh = PseudoQuadMesh.from_vertices_and_faces_with_poles(VERTICES, FACES, [[0.0, 0.0, 0.0]])
+    assert mesh.pole_index() == {0: {0: None, 1: None, 2: None, 3: None}}
+    mesh.delete_face_pole(0)
+    mesh.set_face_pole(1, 2)
+    assert mesh.is_pole_index_valid()
+    assert mesh.pole_index() == {0: {2: None, 3: None}, 2: {1: None}}
+    assert sorted(mesh.poles()) == [0, 2]
+
+
+def test_pole_index_rebuilt_after_replacing_face_pole_data():
+    mesh = PseudoQuadMesh.from_vertices_and_faces_with_poles(VERTICES, FACES, [[0.0, 0.0, 0.0]])
+    mesh.pole_index()
+    mesh.attributes['face_pole'] = {0: 1}
+    assert not mesh.is_pole_index_valid()
+    assert mesh.poles() == [1]
+    mesh.attributes['face_pole'][1] = 2
+    mesh.invalidate_pole_index()
+    assert mesh.pole_index() == {1: {0: None}, 2: {1: None}}
+
+
+def test_pole_index_rebuilt_after_in_place_assignment():
+    mesh = PseudoQuadMesh.from_vertices_and_faces_with_poles(VERTICES, FACES, [[0.0, 0.0, 0.0]])
+    mesh.pole_index()
+    mesh.attributes['face_pole'][1] = 2
+    assert not mesh.is_pole_index_valid()
+    assert mesh.pole_index() == {0: {0: None, 2: None, 3: None}, 2: {1: None}}
+    del mesh.attributes['face_pole'][0]
+    assert mesh.pole_index() == {0: {2: None, 3: None}, 2: {1: None}}
+    mesh = PseudoQuadMesh.from_data(mesh.to_data())
+    assert isinstance(mesh.attributes['face_pole'], VersionedDict)
+    mesh.pole_index()
+    mesh.attributes['face_pole'][2] = 4
+    assert sorted(mesh.poles()) == [0, 2, 4]
+
+
+def test_densification_carries_poles_over(coarse_pseudo_quad_mesh):
+    dense_mesh = coarse_pseudo_quad_mesh.densification()
+    pole = coarse_pseudo_quad_mesh.coarse_vertex_dense_vertex(0)
+    assert dense_mesh.poles() == [pole]
+    assert sorted(dense_mesh.attributes['face_pole']) == sorted(fkey for fkey in dense_mesh.faces() if len(dense_mesh.face_vertices(fkey)) == 3)
+    assert len(dense_mesh.attributes['face_pole']) == 4 * 3
+
+
+def test_incremental_densification_carries_poles_over(coarse_pseudo_quad_mesh):
+    dense_mesh = coarse_pseudo_quad_mesh.densification()
+    dense_mesh.pole_index()
+    skey = next(skey for skey, edges in coarse_pseudo_quad_mesh.strips(data=True) if any(u == v for u, v in edges))
+    coarse_pseudo_quad_mesh.set_strip_density(skey, 5)
+    assert coarse_pseudo_quad_mesh.densification() is dense_mesh
+    assert sorted(dense_mesh.attributes['face_pole']) == sorted(fkey for fkey in dense_mesh.faces() if len(dense_mesh.face_vertices(fkey)) == 3)
+    assert dense_mesh.is_pole_index_valid()
+    index = dense_mesh.pole_index()
+    dense_mesh.build_pole_index()
+    assert index == dense_mesh.pole_index()
+    expected = CoarsePseudoQuadMesh.from_vertices_and_faces_with_poles(VERTICES, FACES, [[0.0, 0.0, 0.0]])
+    expected.collect_strips()
+    for skey, d in coarse_pseudo_quad_mesh.get_strip_densities().items():
+        expected.set_strip_density(skey, d)
+    assert len(dense_mesh.attributes['face_pole']) == len(expected.densification().attributes['face_pole'])
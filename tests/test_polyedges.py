@@ -0,0 +1,51 @@
+from compas_pattern.datastructures.mesh_quad.mesh_quad import QuadMesh
+
+
+def test_collect_polyedges(grid_quad_mesh):
+    mesh = grid_quad_mesh(3, 2)
+    polyedges = list(mesh.collect_polyedges())
+    assert sorted(len(polyedge) for key, polyedge in polyedges) == [3, 3, 3, 3, 4, 4, 4]
+    edges = [frozenset(edge) for key, polyedge in polyedges for edge in zip(polyedge[:-1], polyedge[1:])]
+    assert len(edges) == len(set(edges)) == mesh.number_of_edges()
+
+
+def test_polyedge_index(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    mesh.collect_polyedges()
+    for vkey in mesh.vertices():
+        assert mesh.vertex_polyedges(vkey) == [key for key, polyedge in mesh.polyedges(data=True) if vkey in polyedge]
+    mesh.attributes['polyedges'] = {0: [0, 12, 2]}
+    assert mesh.vertex_polyedges(12) == [0]
+    assert mesh.vertex_polyedges(1) == []
+
+
+def test_polyedge_index_rebuilt_after_in_place_assignment(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    mesh.collect_polyedges()
+    key = mesh.vertex_polyedges(12)[0]
+    mesh.polyedge_index()[12].append(-1)
+    assert mesh.vertex_polyedges(12) == mesh.polyedge_index()[12]
+    mesh.attributes['polyedges'][key] = [0, 1]
+    assert key not in mesh.vertex_polyedges(12)
+    assert key in mesh.vertex_polyedges(1)
+    mesh.attributes['polyedges'][key].append(12)
+    mesh.invalidate_polyedge_index()
+    assert key in mesh.vertex_polyedges(12)
+
+
+def test_split_polyedges():
+    mesh = QuadMesh()
+    assert mesh._split_polyedges([[0, 1, 2, 3], [4, 2, 5], [6, 7]]) == [[0, 1, 2], [2, 3], [4, 2], [2, 5], [6, 7]]
+    # a closed polyedge is reopened at a shared vertex
+    assert mesh._split_polyedges([[0, 1, 2, 0], [1, 3]]) == [[1, 2, 0, 1], [1, 3]]
+
+
+def test_singularity_polyedges(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    mesh.collect_polyedges()
+    polyedges = mesh.singularity_polyedges()
+    singularities = set(mesh.singularities())
+    edges = [frozenset(edge) for polyedge in polyedges for edge in zip(polyedge[:-1], polyedge[1:])]
+    assert len(edges) == len(set(edges))
+    # the polyedges are split at the singularities they pass through
+    assert all(vkey not in singularities for polyedge in polyedges for vkey in polyedge[1: -1])
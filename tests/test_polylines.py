@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from compas_pattern.datastructures.mesh_quad_compact.polylines import polylines_numpy
+from compas_pattern.datastructures.mesh_quad_compact.polylines import strip_edge_midpoint_polylines_numpy
+from compas_pattern.datastructures.mesh_quad_compact.polylines import strip_face_centroid_polylines_numpy
+from compas_pattern.datastructures.mesh_quad_compact.polylines import strip_side_polylines_numpy
+
+
+def _split(points, offsets):
+    return [points[i: j].tolist() for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def test_polylines_numpy(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    mesh.collect_polyedges()
+    assert _split(*polylines_numpy(mesh)) == mesh.polylines()
+
+
+def test_strip_polylines_numpy(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    skeys = list(mesh.strips())
+    for polylines, func in [(strip_edge_midpoint_polylines_numpy(mesh), mesh.strip_edge_midpoint_polyline), (strip_face_centroid_polylines_numpy(mesh), mesh.strip_face_centroid_polyline)]:
+        for polyline, skey in zip(_split(*polylines), skeys):
+            assert np.allclose(polyline, func(skey))
+    sides = _split(*strip_side_polylines_numpy(mesh))
+    for i, skey in enumerate(skeys):
+        assert sides[2 * i: 2 * i + 2] == list(mesh.strip_side_polylines(skey))
@@ -0,0 +1,32 @@
+import pytest
+
+from compas_pattern.datastructures.mesh_quad_pseudo.mesh_quad_pseudo import PseudoQuadMesh
+from compas_pattern.datastructures.mesh_quad_compact.mesh_quad_compact import CompactQuadMesh
+from compas_pattern.datastructures.mesh_quad_compact.mesh_quad_compact import quad_mesh_singularities_numpy
+
+
+@pytest.fixture
+def pseudo_quad_disc():
+    vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [-2.0, 0.0, 0.0], [0.0, -2.0, 0.0]]
+    faces = [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 1], [1, 5, 6, 2], [2, 6, 7, 3], [3, 7, 8, 4], [4, 8, 5, 1]]
+    return PseudoQuadMesh.from_vertices_and_faces_with_poles(vertices, faces, [[0.0, 0.0, 0.0]])
+
+
+def test_singularities_of_quad_mesh(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    singularities, indices = quad_mesh_singularities_numpy(mesh)
+    assert singularities == mesh.singularities()
+    assert indices.tolist() == [mesh.vertex_index(vkey) for vkey in singularities]
+
+
+def test_singularities_of_compact_quad_mesh(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    singularities, indices = quad_mesh_singularities_numpy(CompactQuadMesh.from_quad_mesh(mesh))
+    assert singularities == mesh.singularities()
+
+
+def test_singularities_of_pseudo_quad_mesh(pseudo_quad_disc):
+    mesh = pseudo_quad_disc
+    singularities, indices = quad_mesh_singularities_numpy(mesh)
+    assert singularities == mesh.singularities() == [0]
+    assert indices.tolist() == [mesh.vertex_index(0)] == [1.0]
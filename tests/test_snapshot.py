@@ -0,0 +1,48 @@
+from compas_pattern.datastructures.mesh.snapshot import MeshSnapshot
+from compas_pattern.datastructures.mesh_quad.grammar_pattern import delete_strips
+
+
+def state(mesh):
+    return {
+        'vertices': [(vkey, dict(attr)) for vkey, attr in mesh.vertex.items()],
+        'faces': [(fkey, mesh.face_vertices(fkey)) for fkey in mesh.faces()],
+        'halfedge': [(u, list(nbrs.items())) for u, nbrs in mesh.halfedge.items()],
+        'strips': [(skey, list(edges)) for skey, edges in mesh.strips(data=True)],
+        'max': (mesh._max_int_key, mesh._max_int_fkey),
+    }
+
+
+def test_snapshot_round_trip(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    assert state(MeshSnapshot.from_mesh(mesh).to_mesh()) == state(mesh)
+
+
+def test_snapshot_apply_journal_round_trip(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    snapshot = MeshSnapshot.from_mesh(mesh)
+    for skey in list(mesh.strips()):
+        mesh.begin_journal()
+        try:
+            delete_strips(mesh, [skey], preserve_boundaries=True)
+            expected = state(mesh)
+        finally:
+            journal = mesh.rollback_journal()
+        variant = snapshot.apply_journal(journal)
+        rebuilt = variant.to_mesh()
+        assert type(rebuilt) is type(mesh)
+        assert state(rebuilt) == expected
+        assert variant.number_of_faces() == len(expected['faces'])
+    # the snapshot itself is left unchanged
+    assert state(snapshot.to_mesh()) == state(mesh)
+
+
+def test_snapshots_derived_in_chain(grid_quad_mesh):
+    mesh = grid_quad_mesh(4)
+    snapshot = MeshSnapshot.from_mesh(mesh)
+    for skey in list(mesh.strips())[:2]:
+        mesh.begin_journal()
+        delete_strips(mesh, [skey])
+        redo = mesh.rollback_journal()
+        snapshot = snapshot.apply_journal(redo)
+        mesh.apply_journal(redo)
+    assert state(snapshot.to_mesh()) == state(mesh)
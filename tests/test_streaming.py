@@ -0,0 +1,53 @@
+from struct import unpack
+
+import pytest
+
+from compas_pattern.datastructures.mesh_quad_coarse.mesh_quad_coarse import CoarseQuadMesh
+from compas_pattern.datastructures.mesh_quad_coarse.streaming import densification_to_obj
+from compas_pattern.datastructures.mesh_quad_coarse.streaming import densification_to_ply
+
+
+@pytest.fixture
+def coarse_quad_mesh(grid_quad_mesh):
+    mesh = grid_quad_mesh(3, 2, cls=CoarseQuadMesh)
+    mesh.set_strips_density(3)
+    return mesh
+
+
+def _dense_vertices_and_faces(coarse_quad_mesh):
+    coarse_quad_mesh.densification()
+    dense_mesh = coarse_quad_mesh.get_quad_mesh()
+    return [dense_mesh.vertex_coordinates(vkey) for vkey in dense_mesh.vertices()], [dense_mesh.face_vertices(fkey) for fkey in dense_mesh.faces()]
+
+
+def test_densification_to_obj(coarse_quad_mesh, tmp_path):
+    filepath = str(tmp_path / 'dense.obj')
+    nv, nf = densification_to_obj(coarse_quad_mesh, filepath)
+    vertices, faces = [], []
+    with open(filepath) as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] == 'v':
+                vertices.append([float(x) for x in parts[1:]])
+            elif parts[0] == 'f':
+                faces.append([int(i) - 1 for i in parts[1:]])
+    assert (nv, nf) == (len(vertices), len(faces))
+    assert (vertices, faces) == _dense_vertices_and_faces(coarse_quad_mesh)
+
+
+def test_densification_to_ply(coarse_quad_mesh, tmp_path):
+    filepath = str(tmp_path / 'dense.ply')
+    nv, nf = densification_to_ply(coarse_quad_mesh, filepath)
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    header, body = data.split(b'end_header\n')
+    assert 'element vertex {}'.format(nv).encode() in header
+    vertices = [list(unpack('<3d', body[24 * i: 24 * i + 24])) for i in range(nv)]
+    faces = []
+    offset = 24 * nv
+    for i in range(nf):
+        n = body[offset]
+        faces.append(list(unpack('<{}i'.format(n), body[offset + 1: offset + 1 + 4 * n])))
+        offset += 1 + 4 * n
+    assert offset == len(body)
+    assert (vertices, faces) == _dense_vertices_and_faces(coarse_quad_mesh)
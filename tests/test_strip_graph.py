@@ -0,0 +1,21 @@
+import itertools
+
+from compas.topology import adjacency_from_edges
+
+
+def test_strip_connectivity_is_cached(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    graph = mesh.strip_connectivity()
+    assert mesh.strip_connectivity() is graph
+    assert graph.adjacency() == adjacency_from_edges(mesh.strip_graph()[1])
+
+
+def test_reduced_adjacency(irregular_quad_mesh):
+    graph = irregular_quad_mesh.strip_connectivity()
+    for k in range(1, 3):
+        for combination in itertools.combinations(graph.skeys, k):
+            new_edges = [(u, v) for u, v in graph.edges if u not in combination and v not in combination]
+            adjacency = graph.reduced_adjacency(combination)
+            assert adjacency == adjacency_from_edges(new_edges)
+            if new_edges:
+                assert next(iter(adjacency)) == new_edges[0][0]
@@ -0,0 +1,123 @@
+from compas_pattern.datastructures.mesh_quad.grammar.add_strip import add_strip
+from compas_pattern.datastructures.mesh_quad.grammar.delete_strip import delete_strip
+
+
+def test_collect_strips(grid_quad_mesh):
+    mesh = grid_quad_mesh(3, 2)
+    assert mesh.number_of_strips() == 5
+    assert sorted(len(edges) for edges in mesh.attributes['strips'].values()) == [3, 3, 3, 4, 4]
+    edges = [frozenset(edge) for skey, edges in mesh.strips(data=True) for edge in edges]
+    assert len(edges) == len(set(edges)) == mesh.number_of_edges()
+
+
+def test_strip_index_queries(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    for skey, edges in mesh.strips(data=True):
+        for u, v in edges:
+            assert mesh.edge_strip((u, v)) == mesh.edge_strip((v, u)) == skey
+    for fkey in mesh.faces():
+        assert sorted(mesh.face_strips(fkey)) == sorted(skey for skey, edges in mesh.strips(data=True) if any(mesh.halfedge[u][v] == fkey or mesh.halfedge[v][u] == fkey for u, v in edges))
+    for vkey in mesh.vertices():
+        assert sorted(mesh.vertex_strips(vkey)) == sorted(skey for skey, edges in mesh.strips(data=True) if any(vkey in edge for edge in edges))
+
+
+def test_strip_data_operations_update_index(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    skey = next(mesh.strips())
+    edges = mesh.strip_edges(skey)
+    mesh.strip_index()
+    mesh.delete_strip_data(skey)
+    assert mesh.is_strip_index_valid()
+    assert all((u, v) not in mesh.strip_index() for u, v in edges)
+    mesh.set_strip_edges(skey, edges)
+    assert mesh.is_strip_index_valid()
+    index = dict(mesh.strip_index())
+    mesh.build_strip_index()
+    assert index == mesh.strip_index()
+
+
+def test_strip_index_rebuilt_after_replacing_strip_data(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    mesh.strip_index()
+    mesh.attributes['strips'] = {0: [(0, 1), (3, 4), (6, 7)]}
+    assert not mesh.is_strip_index_valid()
+    assert mesh.edge_strip((4, 3)) == 0
+    assert mesh.vertex_strips(2) == []
+
+
+def test_strips_after_face_deletion_in_strips(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    fkey = next(mesh.faces())
+    mesh.delete_face_in_strips(fkey)
+    assert all(mesh.halfedge[u][v] != fkey for skey, edges in mesh.strips(data=True) for u, v in edges)
+    index = dict(mesh.strip_index())
+    mesh.build_strip_index()
+    assert index == mesh.strip_index()
+
+
+def _strip_edge_sets(mesh):
+    # closed strips may start at another edge
+    return sorted(sorted(set(tuple(sorted(edge)) for edge in edges)) for skey, edges in mesh.strips(data=True))
+
+
+def test_delete_strip_updates_strip_data(irregular_quad_mesh):
+    for skey in irregular_quad_mesh.strips():
+        mesh = irregular_quad_mesh.copy()
+        delete_strip(mesh, skey)
+        strips = _strip_edge_sets(mesh)
+        mesh.collect_strips()
+        assert strips == _strip_edge_sets(mesh)
+
+
+def test_add_strip_updates_strip_data(grid_quad_mesh):
+    mesh = grid_quad_mesh(3)
+    add_strip(mesh, [1, 5, 9, 13])
+    assert mesh.number_of_strips() == 7
+    strips = _strip_edge_sets(mesh)
+    mesh.collect_strips()
+    assert strips == _strip_edge_sets(mesh)
+
+
+def test_strip_index_rebuilt_after_in_place_assignment(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    skey = mesh.edge_strip((0, 1))
+    other = mesh.edge_strip((0, 3))
+    graph = mesh.strip_connectivity()
+    strips = mesh.attributes['strips']
+    strips[skey], strips[other] = strips[other], strips[skey]
+    assert not mesh.is_strip_index_valid()
+    assert mesh.edge_strip((0, 1)) == other
+    assert mesh.strip_connectivity() is not graph
+    assert mesh.is_strip_index_valid()
+
+
+def test_strip_index_invalidated_after_in_place_edge_modification(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    skey = mesh.edge_strip((0, 1))
+    other = mesh.edge_strip((0, 3))
+    edges = mesh.attributes['strips'][skey]
+    edges[:] = [edge for edge in edges if edge not in ((0, 1), (1, 0))]
+    mesh.attributes['strips'][other].append((0, 1))
+    mesh.invalidate_strip_index()
+    assert not mesh.is_strip_index_valid()
+    assert mesh.edge_strip((0, 1)) == other
+
+
+def test_strip_index_of_plain_strip_data(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    mesh.attributes['strips'] = dict(mesh.attributes['strips'])
+    skey = mesh.edge_strip((0, 1))
+    assert not mesh.is_strip_index_valid()
+    other = mesh.edge_strip((0, 3))
+    strips = mesh.attributes['strips']
+    strips[skey], strips[other] = strips[other], strips[skey]
+    assert mesh.edge_strip((0, 1)) == other
+
+
+def test_strip_data_versioned_after_copy(grid_quad_mesh):
+    mesh = grid_quad_mesh(2).copy()
+    skey = mesh.edge_strip((0, 1))
+    assert mesh.is_strip_index_valid()
+    del mesh.attributes['strips'][skey]
+    assert not mesh.is_strip_index_valid()
+    assert mesh.edge_strip((0, 1)) is None
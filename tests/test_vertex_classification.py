@@ -0,0 +1,21 @@
+def test_vertex_classification(irregular_quad_mesh):
+    mesh = irregular_quad_mesh
+    for vkey in mesh.vertices():
+        is_on_boundary, degree, is_singular, index = mesh.vertex_classification(vkey)
+        assert degree == len(mesh.vertex_neighbors(vkey))
+        assert is_singular == (degree != (3 if is_on_boundary else 4))
+        assert mesh.vertex_classification(vkey) == mesh._classify_vertex(vkey)
+
+
+def test_vertex_classification_after_topological_modification(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    assert mesh.vertex_classification(4) == (False, 4, False, 0)
+    mesh.delete_face(0)
+    assert mesh.vertex_classification(4) == (True, 4, True, -0.25)
+
+
+def test_vertex_classification_without_cache(grid_quad_mesh):
+    mesh = grid_quad_mesh(2)
+    mesh.cache_vertex_classification = False
+    assert mesh.vertex_classification(4) == (False, 4, False, 0)
+    assert mesh._vertex_classification == {}